@@ -0,0 +1,74 @@
+"""
+bench_configuration: cost of constructing Configuration from a settings file
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Writes a large ini file and compares constructing Configuration instances from
+it with and without the parsed settings cache. It also compares construction
+alone, with types inferred lazily, to construction followed by access of one 
+section and of every section.
+
+Run from the repository root: python benchmarks/bench_configuration.py
+
+"""
+from __future__ import annotations
+import pathlib
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, '.')
+
+import sourdough
+
+
+def write_settings(file_path: pathlib.Path, sections: int = 500, 
+                   options: int = 20) -> None:
+    """Writes an ini file with 'sections' sections of 'options' options."""
+    values = ['1', '2.5', 'True', 'slice, dice', 'windows-1252']
+    with open(file_path, 'w') as settings_file:
+        for section in range(sections):
+            settings_file.write(f'[section_{section}]\n')
+            for option in range(options):
+                value = values[option % len(values)]
+                settings_file.write(f'option_{option} = {value}\n')
+            settings_file.write('\n')
+    return
+
+
+def measure(statement, number: int = 20) -> float:
+    """Returns milliseconds per call of 'statement'."""
+    timings = timeit.repeat(statement, number = number, repeat = 5)
+    return min(timings) / number * 1e3
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = pathlib.Path(folder) / 'settings.ini'
+        write_settings(file_path = file_path)
+        uncached = measure(
+            lambda: sourdough.Configuration(contents = file_path))
+        sourdough.Configuration(contents = file_path, cache = True)
+        cached = measure(
+            lambda: sourdough.Configuration(contents = file_path, cache = True))
+        one = measure(lambda: sourdough.Configuration(
+            contents = file_path)['section_0'])
+        every = measure(lambda: dict(sourdough.Configuration(
+            contents = file_path).contents.items()))
+        settings = sourdough.Configuration(contents = file_path)
+        typed = settings.contents.layers['source'].typed
+        first = measure(
+            lambda: typed.clear() or settings['section_1'], 
+            number = 10000)
+        again = measure(lambda: settings['section_1'], number = 10000)
+    print(f'10000 options: parsed {uncached:.2f}ms, cached {cached:.2f}ms')
+    print(f'construction + one section {one:.2f}ms, '
+          f'construction + every section {every:.2f}ms')
+    print(f'section access: first {first * 1e3:.2f}us, '
+          f'later {again * 1e3:.2f}us')
+    return
+
+
+if __name__ == '__main__':
+    main()
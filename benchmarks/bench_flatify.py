@@ -0,0 +1,52 @@
+"""
+bench_flatify: instantiation cost of composite quirk classes
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Compares instancing a class composed from Element, Validator, Librarian, and 
+Lexicon using the chained '__post_init__' methods with the same class after
+'flatify' generates a single flat '__post_init__'. A 'name' is passed so that
+the timings are not dominated by deriving a default name.
+
+Run from the repository root: python benchmarks/bench_flatify.py
+
+"""
+from __future__ import annotations
+import dataclasses
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import sourdough
+
+
+@dataclasses.dataclass
+class Chained(
+        sourdough.quirks.Element, 
+        sourdough.quirks.Validator, 
+        sourdough.quirks.Librarian, 
+        sourdough.Lexicon):
+    pass
+
+
+@sourdough.decorators.flatify
+@dataclasses.dataclass
+class Flat(Chained):
+    pass
+
+
+def main(number: int = 100000) -> None:
+    for name, kind in [('chained', Chained), ('flat', Flat)]:
+        seconds = min(timeit.repeat(
+            lambda: kind(name = 'component'), 
+            repeat = 5, 
+            number = number))
+        print(f'{name:<8}{number / seconds:>12,.0f} instances/s'
+              f'{seconds / number * 1e9:>10.0f}ns each')
+    return
+
+
+if __name__ == '__main__':
+    main()
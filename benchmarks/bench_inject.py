@@ -0,0 +1,49 @@
+"""
+bench_inject: cost of injecting settings into many instances
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Compares calling 'inject' for each instance of a class with 'inject_many'.
+
+Run from the repository root: python benchmarks/bench_inject.py
+
+"""
+from __future__ import annotations
+import dataclasses
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import sourdough
+
+
+@dataclasses.dataclass
+class Technique(object):
+    name: str = 'technique'
+    seed: int = None
+
+
+def main() -> None:
+    settings = sourdough.Configuration(contents = {
+        'general': {'seed': 43, 'verbose': True, 'conserve_memory': False},
+        'technique': {f'option_{i}': i for i in range(20)}})
+    instances = [Technique() for _ in range(10000)]
+    each = min(timeit.repeat(
+        lambda: [settings.inject(instance = i) for i in instances], 
+        number = 5, 
+        repeat = 5)) / 5
+    print(f'10000 instances: inject {each * 1e3:.2f}ms', end = '')
+    if hasattr(settings, 'inject_many'):
+        many = min(timeit.repeat(
+            lambda: settings.inject_many(instances = instances), 
+            number = 5, 
+            repeat = 5)) / 5
+        print(f', inject_many {many * 1e3:.2f}ms', end = '')
+    print()
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+bench_instance: cost of instancing many stored classes from a Library
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Compares borrowing and instancing classes one at a time, as workflow creators
+did, with 'instance_many', with and without a thread pool for constructors 
+that wait on I/O.
+
+Run from the repository root: python benchmarks/bench_instance.py
+
+"""
+from __future__ import annotations
+import dataclasses
+import sys
+import time
+import timeit
+
+sys.path.insert(0, '.')
+
+import sourdough
+
+
+@dataclasses.dataclass
+class Node(sourdough.Base):
+    name: str = None
+
+
+@dataclasses.dataclass
+class Technique(Node):
+    pass
+
+
+@dataclasses.dataclass
+class Fetcher(Node):
+
+    def __post_init__(self) -> None:
+        time.sleep(0.001)
+
+
+def one_at_a_time(library: sourdough.Library, specs: list) -> list:
+    instances = []
+    for keys, kwargs in specs:
+        instances.append(library.borrow(name = keys)(**kwargs))
+    return instances
+
+
+def main() -> None:
+    library = Node.library
+    specs = [([f'technique_{i}', 'technique'], {'name': f'technique_{i}'}) 
+             for i in range(5000)]
+    loop = min(timeit.repeat(
+        lambda: one_at_a_time(library, specs), number = 10, repeat = 5)) / 10
+    batch = min(timeit.repeat(
+        lambda: library.instance_many(specs = specs), 
+        number = 10, repeat = 5)) / 10
+    print(f'5000 techniques: loop {loop * 1e3:.2f}ms, '
+          f'instance_many {batch * 1e3:.2f}ms')
+    specs = [('fetcher', {'name': f'fetcher_{i}'}) for i in range(200)]
+    loop = timeit.timeit(lambda: one_at_a_time(library, specs), number = 1)
+    batch = timeit.timeit(
+        lambda: library.instance_many(specs = specs, workers = 16), 
+        number = 1)
+    print(f'200 fetchers: loop {loop * 1e3:.2f}ms, '
+          f'instance_many (16 workers) {batch * 1e3:.2f}ms')
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+bench_load_many: bulk loading with Clerk.load_many and a serial loop
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Writes a folder of files and compares loading them with a loop over
+'Clerk.load' to 'Clerk.load_many' with threads and with processes. csv files
+are used if pandas is installed. Otherwise, pickled lists of rows are used.
+
+Run from the repository root: python benchmarks/bench_load_many.py
+
+"""
+from __future__ import annotations
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Callable
+
+sys.path.insert(0, '.')
+
+import sourdough
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def measure(method: Callable[[], object], repeat: int = 3) -> float:
+    """Returns the fastest of 'repeat' calls of 'method' in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        method()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main(count: int = 200, rows: int = 5000) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        filer = sourdough.Clerk(root_folder = pathlib.Path(folder))
+        records = [[i, i * 2, f'x{i}'] for i in range(rows)]
+        extension = 'csv' if pandas else 'pickle'
+        for i in range(count):
+            file_path = filer.input_folder / f'part{i}.{extension}'
+            if pandas:
+                pandas.DataFrame(records).to_csv(file_path, index = False)
+            else:
+                filer.save(variable = records, file_path = file_path)
+        paths = sorted(filer.input_folder.glob(f'*.{extension}'))
+        print(f'{count} {extension} files of {rows} rows')
+        timings = {
+            'serial load': lambda: {
+                p.stem: filer.load(file_path = p) for p in paths},
+            'load_many (thread)': lambda: filer.load_many(
+                paths = paths, mode = 'thread'),
+            'load_many (process)': lambda: filer.load_many(
+                paths = paths, mode = 'process')}
+        for name, method in timings.items():
+            print(f'{name:<22}{measure(method):>10.1f}ms')
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+bench_loader: per-attribute cost of lazily loaded attributes
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Compares attribute reads on a Loader subclass with reads on a plain dataclass
+and on a replica of the former Loader, which checked every value for an import
+path in '__getattribute__'.
+
+Run from the repository root: python benchmarks/bench_loader.py
+
+"""
+from __future__ import annotations
+import dataclasses
+import sys
+import timeit
+from typing import Any
+
+sys.path.insert(0, '.')
+
+import sourdough
+from sourdough.core import quirks
+
+
+@dataclasses.dataclass
+class Plain(object):
+    kind: Any = sourdough.Graph
+    size: int = 1
+
+    def method(self) -> None:
+        return
+
+
+@dataclasses.dataclass
+class Checked(Plain):
+
+    def __getattribute__(self, name: str) -> Any:
+        value = super().__getattribute__(name)
+        if (isinstance(value, str) and '.' in value):
+            value = sourdough.tools.importify(
+                module = value.rpartition('.')[0],
+                key = value.rpartition('.')[2])
+            super().__setattr__(name, value)
+        return value
+
+
+@dataclasses.dataclass
+class Lazy(quirks.Loader):
+    kind: Any = 'sourdough.core.structures.Graph'
+    size: int = 1
+
+    def method(self) -> None:
+        return
+
+
+def measure(item: object, attribute: str, number: int = 1000000) -> float:
+    """Returns nanoseconds per read of 'attribute' on 'item'."""
+    timer = timeit.Timer(f'item.{attribute}', globals = {'item': item})
+    return min(timer.repeat(repeat = 5, number = number)) / number * 1e9
+
+
+def main() -> None:
+    items = {'plain': Plain(), 'checked': Checked(), 'loader': Lazy()}
+    print(f'{"attribute":<12}' + ''.join(f'{name:>12}' for name in items))
+    for attribute in ['kind', 'size', 'method']:
+        timings = [measure(item, attribute) for item in items.values()]
+        print(f'{attribute:<12}' + ''.join(f'{t:>10.1f}ns' for t in timings))
+    return
+
+
+if __name__ == '__main__':
+    main()
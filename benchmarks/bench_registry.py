@@ -0,0 +1,81 @@
+"""
+bench_registry: concurrent lookups in registries while classes register
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Runs 16 reader threads which look up and iterate over a registry while a writer
+thread keeps registering new keys. A Catalog, which is changed in place, is 
+compared with a Library, which swaps in updated snapshots under a write lock.
+Errors are reads that failed because the registry changed while being read.
+
+Run from the repository root: python benchmarks/bench_registry.py
+
+"""
+from __future__ import annotations
+import sys
+import threading
+import time
+from typing import Any
+
+sys.path.insert(0, '.')
+
+import sourdough
+
+
+def read(registry: Any, stop: threading.Event, counts: list) -> None:
+    """Looks up and iterates over 'registry' until 'stop' is set."""
+    lookups = errors = 0
+    while not stop.is_set():
+        try:
+            registry['key_0']
+            registry[['key_1', 'key_2']]
+            for key in registry:
+                pass
+            lookups += 1
+        except RuntimeError:
+            errors += 1
+    counts.append((lookups, errors))
+    return
+
+def write(registry: Any, stop: threading.Event) -> None:
+    """Registers new keys in 'registry' until 'stop' is set."""
+    index = 0
+    while not stop.is_set():
+        registry[f'new_{index}'] = object
+        index += 1
+        if index % 100 == 0:
+            # Keeps the registry small so that iteration stays comparable.
+            del registry[[f'new_{i}' for i in range(index - 100, index)]]
+    return
+
+def measure(registry: Any, threads: int = 16, seconds: float = 2.0) -> tuple:
+    """Returns lookups per second and errors for 'registry'."""
+    for index in range(10):
+        registry[f'key_{index}'] = object
+    stop = threading.Event()
+    counts = []
+    workers = [
+        threading.Thread(target = read, args = (registry, stop, counts)) 
+        for _ in range(threads)]
+    workers.append(threading.Thread(target = write, args = (registry, stop)))
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    lookups = sum(count[0] for count in counts)
+    errors = sum(count[1] for count in counts)
+    return lookups / seconds, errors
+
+def main() -> None:
+    for name, kind in [('catalog', sourdough.Catalog), 
+                       ('library', sourdough.Library)]:
+        rate, errors = measure(registry = kind())
+        print(f'{name:<8}{rate:>12,.0f} reads/s{errors:>8} errors')
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+bench_share: per-task cost of sending settings to worker processes
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Compares passing a large Configuration to each task in a process pool with 
+passing the name of a shared memory block from 'Configuration.share'.
+
+Run from the repository root: python benchmarks/bench_share.py
+
+"""
+from __future__ import annotations
+import multiprocessing
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+import sourdough
+
+
+def pickled_task(settings: sourdough.Configuration) -> int:
+    return settings['section_0']['option_0']
+
+
+def shared_task(name: str) -> int:
+    return sourdough.Configuration.attach(name = name)['section_0']['option_0']
+
+
+def main() -> None:
+    settings = sourdough.Configuration(contents = {
+        f'section_{i}': {f'option_{j}': str(j) for j in range(20)} 
+        for i in range(500)})
+    tasks = 200
+    with multiprocessing.Pool(processes = 4) as pool:
+        start = time.perf_counter()
+        pool.map(pickled_task, [settings] * tasks, chunksize = 1)
+        pickled = (time.perf_counter() - start) / tasks
+        name = settings.share()
+        start = time.perf_counter()
+        pool.map(shared_task, [name] * tasks, chunksize = 1)
+        shared = (time.perf_counter() - start) / tasks
+    settings.unshare()
+    print(f'10000 options: pickled per task {pickled * 1e3:.3f}ms, '
+          f'shared per task {shared * 1e3:.3f}ms')
+    return
+
+
+if __name__ == '__main__':
+    main()
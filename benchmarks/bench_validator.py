@@ -0,0 +1,76 @@
+"""
+bench_validator: construction throughput of Validator subclasses
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+Compares constructing a Validator subclass using compiled validation plans with
+a replica of the former 'validate', which looked up each validation method by
+name on every call.
+
+Run from the repository root: python benchmarks/bench_validator.py
+
+"""
+from __future__ import annotations
+import dataclasses
+import sys
+import timeit
+from typing import Any, ClassVar, Sequence
+
+sys.path.insert(0, '.')
+
+import sourdough
+
+
+@dataclasses.dataclass
+class Planned(sourdough.quirks.Validator):
+    first: Any = None
+    second: Any = None
+    third: Any = None
+    fourth: Any = None
+    validations: ClassVar[Sequence[str]] = [
+        'first', 'second', 'third', 'fourth']
+
+    def __post_init__(self) -> None:
+        self.validate()
+
+    def _validate_first(self, first: Any) -> Any:
+        return first
+
+    def _validate_second(self, second: Any) -> Any:
+        return second
+
+    def _validate_third(self, third: Any) -> Any:
+        return third
+
+    def _validate_fourth(self, fourth: Any) -> Any:
+        return fourth
+
+
+@dataclasses.dataclass
+class Looked(Planned):
+
+    def validate(self, validations: Sequence[str] = None) -> None:
+        if validations is None:
+            validations = self.validations
+        for item in validations:
+            if hasattr(self, f'_validate_{item}'):
+                kwargs = {item: getattr(self, item)}
+                validated = getattr(self, f'_validate_{item}')(**kwargs)
+            else:
+                value = getattr(self, item)
+                validated = self._validate_generic(value = value, name = item)
+            setattr(self, item, validated)
+        return self
+
+
+def main(number: int = 200000) -> None:
+    for name, kind in [('lookup', Looked), ('plan', Planned)]:
+        seconds = min(timeit.repeat(kind, repeat = 5, number = number))
+        print(f'{name:<8}{number / seconds:>12,.0f} instances/s'
+              f'{seconds / number * 1e9:>10.0f}ns each')
+    return
+
+
+if __name__ == '__main__':
+    main()
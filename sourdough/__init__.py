@@ -75,17 +75,24 @@ importables: Dict[str, str] = {
     'Hybrid': 'core.types.Hybrid',
     'Lexicon': 'core.types.Lexicon',
     'Catalog': 'core.types.Catalog',
+    'WeakCatalog': 'core.types.WeakCatalog',
+    'CopyOnWriteDict': 'core.types.CopyOnWriteDict',
+    'CopyOnWriteList': 'core.types.CopyOnWriteList',
     'Configuration': 'core.framework.Configuration',
     'Clerk': 'core.files.Clerk',
     'Base': 'core.quirks.Base',
     'Bases': 'core.quirks.Bases',
     'Library': 'core.quirks.Library',
+    'Scope': 'core.quirks.Scope',
     'Structure': 'core.structures.Structure',
     'Graph': 'core.structures.Graph',
     'Project': 'project.interface.Project'}
 
 def __getattr__(name: str) -> Any:
     """Lazily imports modules and items within them.
+
+    Imported modules and items are stored as globals of this module, so this
+    function is only called the first time that each is accessed.
     
     Args:
         name (str): name of sourdough module or item.
@@ -97,9 +104,11 @@ def __getattr__(name: str) -> Any:
         Any: a module or item stored within a module.
         
     """
-    return lazily_import(name = name,
-                         package = __name__,  
-                         mapping = importables)
+    value = lazily_import(name = name,
+                          package = __name__,  
+                          mapping = importables)
+    globals()[name] = value
+    return value
 
 def lazily_import(name: str, 
                   package: str = None, 
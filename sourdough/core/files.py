@@ -13,18 +13,23 @@ Contents:
 """
 from __future__ import annotations
 import abc
+import asyncio
+import concurrent.futures
 import csv
 import configparser
 import dataclasses
 import datetime
+import functools
 import importlib
 import importlib.util
+import itertools
 import json
 import pathlib
+import pickle
 import sys
 import toml
-from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
-                    Optional, Sequence, Tuple, Type, Union)
+from typing import (Any, Callable, ClassVar, Dict, Iterable, Iterator, List, 
+                    Mapping, Optional, Sequence, Tuple, Type, Union)
 import sourdough
 
 
@@ -388,7 +393,9 @@ class Clerk(object):
         output_folder (Union[str, pathlib.Path]]): the output_folder subfolder
             name or a complete path if the 'output_folder' is not off of
             'root_folder'. Defaults to 'output'.
-
+        workers (int): maximum number of threads used by the asynchronous
+            transfer methods. Defaults to None, which uses the
+            concurrent.futures default.
 
     ToDo:
         Refactor and simplify with accompanying classes.
@@ -398,6 +405,9 @@ class Clerk(object):
     root_folder: Union[str, pathlib.Path] = None
     input_folder: Union[str, pathlib.Path] = 'input'
     output_folder: Union[str, pathlib.Path] = 'output'
+    workers: int = None
+    _executor: concurrent.futures.ThreadPoolExecutor = dataclasses.field(
+        default = None, init = False, repr = False, compare = False)
     
     """ Initialization Methods """
 
@@ -539,6 +549,218 @@ class Clerk(object):
             **kwargs)
         return self
 
+    def stream(self,
+            file_path: Union[str, pathlib.Path] = None,
+            folder: Union[str, pathlib.Path] = None,
+            file_name: str = None,
+            file_format: Union[str, 'FileFormat'] = None,
+            chunk_size: int = 10000,
+            **kwargs) -> Iterator[Any]:
+        """Yields chunks of a file instead of loading it all at once.
+
+        Arguments are resolved in the same manner as 'load', but only one chunk
+        of at most 'chunk_size' records is held in memory at a time. If the
+        module for 'file_format' cannot be imported and the format has a
+        native fallback (as csv files do), the fallback is used instead.
+
+        Args:
+            file_path (Union[str, Path]]): a complete file path.
+                Defaults to None.
+            folder (Union[str, Path]]): a complete folder path or the
+                name of a folder stored in 'filer'. Defaults to None.
+            file_name (str): file name without extension. Defaults to
+                None.
+            file_format (Union[str, FileFormat]]): object with
+                information about how the file should be loaded or the key to
+                such an object stored in 'filer'. Defaults to None
+            chunk_size (int): maximum number of records in each chunk.
+                Defaults to 10000.
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas or python method used internally.
+
+        Raises:
+            TypeError: if 'file_format' does not support streaming.
+
+        Yields:
+            Any: chunks of the file. With pandas, these are DataFrames. With
+                the native csv fallback, they are lists of rows.
+
+        """
+        return self.loader.stream(
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            file_format = file_format,
+            chunk_size = chunk_size,
+            **kwargs)
+
+    async def aload(self,
+            file_path: Union[str, pathlib.Path] = None,
+            folder: Union[str, pathlib.Path] = None,
+            file_name: str = None,
+            file_format: Union[str, 'FileFormat'] = None,
+            **kwargs) -> Any:
+        """Imports file without blocking the running event loop.
+
+        Takes the same arguments as 'load'. The transfer is run in the thread
+        pool shared by the asynchronous methods of this instance.
+
+        Args:
+            file_path (Union[str, Path]]): a complete file path.
+                Defaults to None.
+            folder (Union[str, Path]]): a complete folder path or the
+                name of a folder stored in 'filer'. Defaults to None.
+            file_name (str): file name without extension. Defaults to
+                None.
+            file_format (Union[str, FileFormat]]): object with
+                information about how the file should be loaded or the key to
+                such an object stored in 'filer'. Defaults to None
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas or python method used internally.
+
+        Returns:
+            Any: depending upon method used for appropriate file format, a new
+                variable of a supported type is returned.
+
+        """
+        return await self._run(functools.partial(
+            self.loader.transfer,
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            file_format = file_format,
+            **kwargs))
+
+    async def asave(self,
+            variable: Any,
+            file_path: Union[str, pathlib.Path] = None,
+            folder: Union[str, pathlib.Path] = None,
+            file_name: str = None,
+            file_format: Union[str, 'FileFormat'] = None,
+            **kwargs) -> None:
+        """Exports file without blocking the running event loop.
+
+        Takes the same arguments as 'save'. The transfer is run in the thread
+        pool shared by the asynchronous methods of this instance.
+
+        Args:
+            variable (Any): object to be save to disk.
+            file_path (Union[str, pathlib.Path]]): a complete file path.
+                Defaults to None.
+            folder (Union[str, pathlib.Path]]): a complete folder path or the
+                name of a folder stored in 'filer'. Defaults to None.
+            file_name (str): file name without extension. Defaults to
+                None.
+            file_format (Union[str, 'FileFormat']]): object with
+                information about how the file should be loaded or the key to
+                such an object stored in 'filer'. Defaults to None
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas or python method used internally.
+
+        """
+        await self._run(functools.partial(
+            self.saver.transfer,
+            variable = variable,
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            file_format = file_format,
+            **kwargs))
+        return self
+
+    async def gather_load(self,
+            paths: Iterable[Union[str, pathlib.Path]],
+            file_format: Union[str, 'FileFormat'] = None,
+            limit: int = None,
+            **kwargs) -> List[Any]:
+        """Imports several files concurrently.
+
+        Args:
+            paths (Iterable[Union[str, pathlib.Path]]): complete file paths.
+            file_format (Union[str, FileFormat]]): object with
+                information about how the files should be loaded or the key to
+                such an object stored in 'filer'. Defaults to None, which 
+                selects the format of each file from its extension.
+            limit (int): maximum number of files loaded at the same time by 
+                this call. Defaults to None, which is only limited by 'workers'.
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas or python method used internally.
+
+        Returns:
+            List[Any]: loaded objects in the same order as 'paths'.
+
+        """
+        if limit is None:
+            return await asyncio.gather(*(
+                self.aload(file_path = path, file_format = file_format, 
+                           **kwargs) 
+                for path in paths))
+        semaphore = asyncio.Semaphore(limit)
+        async def load(path: Union[str, pathlib.Path]) -> Any:
+            async with semaphore:
+                return await self.aload(
+                    file_path = path, 
+                    file_format = file_format, 
+                    **kwargs)
+        return await asyncio.gather(*(load(path) for path in paths))
+
+    def load_many(self,
+            paths: Union[str, pathlib.Path, Iterable[Union[str, pathlib.Path]]],
+            file_format: Union[str, 'FileFormat'] = None,
+            workers: int = None,
+            mode: str = 'thread',
+            concatenate: bool = False,
+            progress: Callable[[int, int, pathlib.Path], None] = None,
+            errors: str = 'raise',
+            **kwargs) -> Union[Dict[str, Any], Any]:
+        """Imports many files in parallel.
+
+        Args:
+            paths (Union[str, pathlib.Path, Iterable[Union[str, 
+                pathlib.Path]]]): a glob pattern (such as 'data/*.csv') or 
+                complete file paths. A relative pattern is matched in 
+                'input_folder'.
+            file_format (Union[str, FileFormat]]): object with
+                information about how the files should be loaded or the key to
+                such an object stored in 'filer'. Defaults to None, which 
+                selects the format of each file from its extension.
+            workers (int): maximum number of threads or processes to use.
+                Defaults to None, which uses the concurrent.futures default.
+            mode (str): either 'thread' or 'process'. Defaults to 'thread'.
+            concatenate (bool): whether to combine the loaded objects into one
+                object instead of returning a dict. Defaults to False.
+            progress (Callable[[int, int, pathlib.Path], None]): called with the
+                number of finished files, the total number of files, and the
+                path of the file which just finished. Defaults to None.
+            errors (str): either 'raise', which raises an error listing every
+                file that failed after all files are attempted, or 'collect',
+                which stores the exception in place of the loaded object.
+                Defaults to 'raise'.
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas or python method used internally.
+
+        Returns:
+            Union[Dict[str, Any], Any]: loaded objects keyed by file stem, or
+                the concatenated object if 'concatenate' is True.
+
+        """
+        return self.loader.load_many(
+            paths = paths,
+            file_format = file_format,
+            workers = workers,
+            mode = mode,
+            concatenate = concatenate,
+            progress = progress,
+            errors = errors,
+            **kwargs)
+
+    def close(self) -> None:
+        """Shuts down the thread pool used by the asynchronous methods."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        return self
+
     def pathlibify(self,
             folder: str,
             file_name: str = None,
@@ -571,6 +793,22 @@ class Clerk(object):
 
     """ Private Methods """
 
+    async def _run(self, method: Callable[[], Any]) -> Any:
+        """Runs 'method' in the thread pool and waits for its result.
+
+        Args:
+            method (Callable[[], Any]): callable which takes no arguments.
+
+        Returns:
+            Any: value returned by 'method'.
+
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers = self.workers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, method)
+
     def _validate_io_folder(self, 
             path: Union[str, pathlib.Path]) -> pathlib.Path:
         """[summary]
@@ -601,6 +839,8 @@ class Clerk(object):
                 extension = '.csv',
                 load_method = 'read_csv',
                 save_method = 'to_csv',
+                chunk_parameter = 'chunksize',
+                stream_method = '_stream_csv',
                 shared_parameters = {
                     'encoding': 'file_encoding',
                     'index_col': 'index_column',
@@ -632,6 +872,7 @@ class Clerk(object):
                 extension = '.hdf',
                 load_method = 'read_hdf',
                 save_method = 'to_hdf',
+                chunk_parameter = 'chunksize',
                 shared_parameters = {
                     'columns': 'included_columns',
                     'chunksize': 'test_size'}),
@@ -641,6 +882,8 @@ class Clerk(object):
                 extension = '.json',
                 load_method = 'read_json',
                 save_method = 'to_json',
+                chunk_parameter = 'chunksize',
+                stream_parameters = {'lines': True},
                 shared_parameters = {
                     'encoding': 'file_encoding',
                     'columns': 'included_columns',
@@ -651,13 +894,14 @@ class Clerk(object):
                 extension = '.dta',
                 load_method = 'read_stata',
                 save_method = 'to_stata',
+                chunk_parameter = 'chunksize',
                 shared_parameters = {'chunksize': 'test_size'}),
             'text': FileFormat(
                 name = 'text',
                 modules =  None,
                 extension = '.txt',
-                load_method = '_import_text',
-                save_method = '_export_text'),
+                load_method = '_load_text',
+                save_method = '_save_text'),
             'png': FileFormat(
                 name = 'png',
                 modules =  'seaborn',
@@ -670,8 +914,8 @@ class Clerk(object):
                 name = 'pickle',
                 modules =  None,
                 extension = '.pickle',
-                load_method = '_pickle_object',
-                save_method = '_unpickle_object')}
+                load_method = '_load_pickle',
+                save_method = '_save_pickle')}
 
     def _get_default_parameters(self, 
                                 settings: Configuration) -> Mapping[Any, Any]:
@@ -685,7 +929,10 @@ class Clerk(object):
             Mapping: with default parameters from settings.
 
         """
-        return self.settings['files']
+        try:
+            return self.settings['files']
+        except (KeyError, TypeError):
+            return {}
 
     def _write_folder(self, folder: Union[str, pathlib.Path]) -> None:
         """Writes folder to disk.
@@ -759,8 +1006,8 @@ class Distributor(abc.ABC):
         """
         new_kwargs = passed_kwargs
         if file_format.required_parameters:
-            for key, value in file_format.required_parameters:
-                if value not in new_kwargs:
+            for key, value in file_format.required_parameters.items():
+                if key not in new_kwargs:
                     new_kwargs[key] = value
         return new_kwargs
 
@@ -782,8 +1029,8 @@ class Distributor(abc.ABC):
         """
         new_kwargs = passed_kwargs
         if file_format.shared_parameters:
-            for key, value in file_format.shared_parameters:
-                if (value not in new_kwargs
+            for key, value in file_format.shared_parameters.items():
+                if (key not in new_kwargs
                         and value in self.filer.default_parameters):
                     new_kwargs[key] = self.filer.default_parameters[value]
         return new_kwargs
@@ -862,7 +1109,7 @@ class Distributor(abc.ABC):
             if not file_format:
                 file_format = [
                     f for f in self.filer.file_formats.values()
-                    if f.extension == file_path.suffix[1:]][0]
+                    if f.extension == file_path.suffix][0]
         file_format = self._check_file_format(file_format = file_format)
         extension = file_format.extension
         if not file_path:
@@ -923,12 +1170,326 @@ class FileLoader(Distributor):
             folder = folder,
             file_name = file_name,
             file_format = file_format)
+        tool, parameters = self._plan_transfer(
+            file_path = file_path, 
+            file_format = file_format, 
+            **kwargs)
+        return tool(file_path, **parameters)
+
+    def load_many(self,
+            paths: Union[str, pathlib.Path, Iterable[Union[str, pathlib.Path]]],
+            file_format: Union[str, 'FileFormat'] = None,
+            workers: int = None,
+            mode: str = 'thread',
+            concatenate: bool = False,
+            progress: Callable[[int, int, pathlib.Path], None] = None,
+            errors: str = 'raise',
+            **kwargs) -> Union[Dict[str, Any], Any]:
+        """Imports many files in parallel.
+
+        The FileFormat, import method, and parameters are resolved once for
+        each file extension instead of once for each file.
+
+        Args:
+            paths (Union[str, pathlib.Path, Iterable[Union[str, 
+                pathlib.Path]]]): a glob pattern (such as 'data/*.csv') or 
+                complete file paths. A relative pattern is matched in 
+                'input_folder'.
+            file_format (Union[str, FileFormat]]): object with
+                information about how the files should be loaded or the key to
+                such an object stored in 'filer'. Defaults to None, which 
+                selects the format of each file from its extension.
+            workers (int): maximum number of threads or processes to use.
+                Defaults to None, which uses the concurrent.futures default.
+            mode (str): either 'thread' or 'process'. Defaults to 'thread'.
+            concatenate (bool): whether to combine the loaded objects into one
+                object instead of returning a dict. Defaults to False.
+            progress (Callable[[int, int, pathlib.Path], None]): called with the
+                number of finished files, the total number of files, and the
+                path of the file which just finished. Defaults to None.
+            errors (str): either 'raise', which raises an error listing every
+                file that failed after all files are attempted, or 'collect',
+                which stores the exception in place of the loaded object.
+                Defaults to 'raise'.
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas or python method used internally.
+
+        Raises:
+            ValueError: if 'mode' or 'errors' is not a recognized option or if
+                two files have the same stem.
+            RuntimeError: if any file fails to load and 'errors' is 'raise'.
+
+        Returns:
+            Union[Dict[str, Any], Any]: loaded objects keyed by file stem, or
+                the concatenated object if 'concatenate' is True.
+
+        """
+        if mode == 'thread':
+            executor = concurrent.futures.ThreadPoolExecutor
+        elif mode == 'process':
+            executor = concurrent.futures.ProcessPoolExecutor
+        else:
+            raise ValueError("mode must be 'thread' or 'process'")
+        if errors not in ['raise', 'collect']:
+            raise ValueError("errors must be 'raise' or 'collect'")
+        paths = self._find_paths(paths = paths)
+        stems = [path.stem for path in paths]
+        if len(set(stems)) < len(stems):
+            raise ValueError('files loaded together must have unique stems')
+        plans = {}
+        loaded = dict.fromkeys(stems)
+        with executor(max_workers = workers) as pool:
+            futures = {}
+            for path, stem in zip(paths, stems):
+                if path.suffix not in plans:
+                    plans[path.suffix] = self._plan_transfer(
+                        file_path = path, 
+                        file_format = file_format, 
+                        **kwargs)
+                tool, parameters = plans[path.suffix]
+                futures[pool.submit(tool, path, **parameters)] = (path, stem)
+            finished = 0
+            for future in concurrent.futures.as_completed(futures):
+                path, stem = futures[future]
+                try:
+                    loaded[stem] = future.result()
+                except Exception as error:
+                    loaded[stem] = error
+                finished += 1
+                if progress is not None:
+                    progress(finished, len(paths), path)
+        if errors == 'raise':
+            failed = {
+                k: v for k, v in loaded.items() if isinstance(v, Exception)}
+            if failed:
+                listed = ', '.join(f'{k} ({v!r})' for k, v in failed.items())
+                raise RuntimeError(
+                    f'{len(failed)} of {len(paths)} files failed to load: '
+                    f'{listed}') from next(iter(failed.values()))
+        if concatenate:
+            return self._concatenate(items = list(loaded.values()))
+        return loaded
+
+    def stream(self,
+            file_path: Union[str, pathlib.Path] = None,
+            folder: Union[str, pathlib.Path] = None,
+            file_name: str = None,
+            file_format: Union[str, 'FileFormat'] = None,
+            chunk_size: int = 10000,
+            **kwargs) -> Iterator[Any]:
+        """Yields chunks of a file by calling a chunked reader.
+
+        Args:
+            file_path (Union[str, Path]]): a complete file path.
+                Defaults to None.
+            folder (Union[str, Path]]): a complete folder path or the
+                name of a folder stored in 'filer'. Defaults to None.
+            file_name (str): file name without extension. Defaults to
+                None.
+            file_format (Union[str, FileFormat]]): object with
+                information about how the file should be loaded or the key to
+                such an object stored in 'filer'. Defaults to None
+            chunk_size (int): maximum number of records in each chunk.
+                Defaults to 10000.
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas or python method used internally.
+
+        Raises:
+            TypeError: if 'file_format' does not support streaming.
+
+        Returns:
+            Iterator[Any]: chunks of the file.
+
+        """
+        file_path, file_format = self._prepare_transfer(
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            file_format = file_format)
+        if not file_format.chunk_parameter:
+            raise TypeError(f'{file_format.name} files cannot be streamed')
         parameters = self._get_parameters(file_format = file_format, **kwargs)
-        if file_format.module:
-            tool = file_format.load('import_method')
+        try:
+            tool = file_format.load(method = 'load_method')
+        except ImportError:
+            if not file_format.stream_method:
+                raise
+            tool = getattr(self, file_format.stream_method)
+            parameters['chunk_size'] = chunk_size
+            return tool(file_path, **parameters)
+        parameters.update(file_format.stream_parameters or {})
+        parameters[file_format.chunk_parameter] = chunk_size
+        return self._stream_chunks(reader = tool(file_path, **parameters))
+
+    """ Private Methods """
+
+    def _concatenate(self, items: List[Any]) -> Any:
+        """Combines loaded objects into one object.
+
+        pandas objects are combined with 'pandas.concat', and str or bytes 
+        objects are joined. Other objects must be list-like and are chained 
+        into a list.
+
+        Args:
+            items (List[Any]): loaded objects.
+
+        Raises:
+            TypeError: if 'items' mixes text with other objects or if an item
+                is not list-like.
+
+        Returns:
+            Any: a combined DataFrame or Series, a str or bytes, or a list.
+
+        """
+        pandas = sys.modules.get('pandas')
+        if (pandas is not None 
+                and items 
+                and isinstance(items[0], (pandas.DataFrame, pandas.Series))):
+            return pandas.concat(items, ignore_index = True)
+        for kind in [str, bytes]:
+            if items and all(isinstance(item, kind) for item in items):
+                return kind().join(items)
+        for item in items:
+            if (isinstance(item, (str, bytes, Mapping)) 
+                    or not isinstance(item, Iterable)):
+                raise TypeError(
+                    f'{type(item).__name__} objects cannot be concatenated '
+                    f'into a list')
+        return list(itertools.chain.from_iterable(items))
+
+    def _find_paths(self, 
+            paths: Union[str, pathlib.Path, Iterable[Union[str, pathlib.Path]]]
+            ) -> List[pathlib.Path]:
+        """Returns file paths listed in or matched by 'paths'.
+
+        Args:
+            paths (Union[str, pathlib.Path, Iterable[Union[str, 
+                pathlib.Path]]]): a glob pattern or complete file paths.
+
+        Returns:
+            List[pathlib.Path]: matching file paths.
+
+        """
+        if not isinstance(paths, (str, pathlib.Path)):
+            return [pathlib.Path(path) for path in paths]
+        pattern = pathlib.Path(paths)
+        if not pattern.is_absolute():
+            pattern = self.filer.input_folder / pattern
+        parts = pattern.parts
+        for i, part in enumerate(parts):
+            if any(character in part for character in '*?['):
+                folder = pathlib.Path(*parts[:i])
+                return sorted(folder.glob(str(pathlib.Path(*parts[i:]))))
+        return [pattern]
+
+    def _plan_transfer(self,
+            file_path: pathlib.Path,
+            file_format: Union[str, 'FileFormat'] = None,
+            **kwargs) -> Tuple[Callable, Dict[str, Any]]:
+        """Returns the import method and parameters for 'file_path'.
+
+        Args:
+            file_path (pathlib.Path): a complete file path.
+            file_format (Union[str, FileFormat]]): object with
+                information about how the file should be loaded or the key to
+                such an object stored in 'filer'. Defaults to None
+            **kwargs: can be passed if additional options are desired specific
+                to the pandas or python method used internally.
+
+        Returns:
+            Tuple[Callable, Dict[str, Any]]: import method and the parameters
+                to pass to it.
+
+        """
+        file_path, file_format = self._prepare_transfer(
+            file_path = file_path,
+            folder = None,
+            file_name = None,
+            file_format = file_format)
+        parameters = self._get_parameters(file_format = file_format, **kwargs)
+        if file_format.modules:
+            tool = file_format.load(method = 'load_method')
         else:
-            tool = getattr(self, file_format.import_method)
-        return tool(file_path, **parameters)
+            tool = getattr(self, file_format.load_method)
+        return tool, parameters
+
+    @staticmethod
+    def _load_pickle(file_path: Union[str, pathlib.Path], **kwargs) -> Any:
+        """Returns object unpickled from 'file_path'."""
+        with open(file_path, 'rb') as source:
+            return pickle.load(source, **kwargs)
+
+    @staticmethod
+    def _load_text(file_path: Union[str, pathlib.Path], 
+                   encoding: str = None,
+                   **kwargs) -> str:
+        """Returns contents of the text file at 'file_path'."""
+        with open(file_path, encoding = encoding) as source:
+            return source.read()
+
+    def _stream_chunks(self, reader: Iterable[Any]) -> Iterator[Any]:
+        """Yields chunks from 'reader' and closes it when exhausted.
+
+        Args:
+            reader (Iterable[Any]): a chunked reader returned by a pandas
+                import method.
+
+        Yields:
+            Any: each chunk from 'reader'.
+
+        """
+        try:
+            yield from reader
+        finally:
+            try:
+                reader.close()
+            except AttributeError:
+                pass
+
+    def _stream_csv(self,
+            file_path: Union[str, pathlib.Path],
+            chunk_size: int = 10000,
+            encoding: str = None,
+            header: Union[int, bool, str] = 'infer',
+            usecols: Sequence[str] = None,
+            nrows: int = None,
+            sep: str = ',',
+            **kwargs) -> Iterator[List[Any]]:
+        """Yields lists of csv rows using the standard library.
+
+        This is used by 'stream' when pandas is not available. Rows are dicts
+        keyed by column name unless 'header' is None or False, in which case
+        they are lists. pandas-specific kwargs are ignored.
+
+        Args:
+            file_path (Union[str, pathlib.Path]): path to a csv file.
+            chunk_size (int): maximum number of rows in each chunk. Defaults to
+                10000.
+            encoding (str): file encoding. Defaults to None.
+            header (Union[int, bool, str]): whether the first row contains the
+                column names. Defaults to 'infer' (which means that it does).
+            usecols (Sequence[str]): names of columns to keep if 'header' is 
+                used. Defaults to None (which keeps all columns).
+            nrows (int): maximum number of rows to read. Defaults to None.
+            sep (str): delimiter between values. Defaults to ','.
+
+        Yields:
+            List[Any]: up to 'chunk_size' rows.
+
+        """
+        with open(file_path, newline = '', encoding = encoding) as source:
+            if header is None or header is False:
+                rows = csv.reader(source, delimiter = sep)
+            else:
+                rows = csv.DictReader(source, delimiter = sep)
+                if usecols:
+                    rows = ({k: row[k] for k in usecols} for row in rows)
+            rows = itertools.islice(rows, nrows)
+            while True:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                yield chunk
 
 
 @dataclasses.dataclass
@@ -982,10 +1543,34 @@ class FileSaver(Distributor):
             file_name = file_name,
             file_format = file_format)
         parameters = self._get_parameters(file_format = file_format, **kwargs)
-        if file_format.module:
-            getattr(variable, file_format.export_method)(variable, **parameters)
+        if file_format.modules:
+            getattr(variable, file_format.save_method)(file_path, **parameters)
         else:
-            getattr(self, file_format.export_method)(variable, **parameters)
+            getattr(self, file_format.save_method)(
+                variable, 
+                file_path, 
+                **parameters)
+        return self
+
+    """ Private Methods """
+
+    def _save_pickle(self, 
+            variable: Any, 
+            file_path: Union[str, pathlib.Path],
+            **kwargs) -> None:
+        """Pickles 'variable' to 'file_path'."""
+        with open(file_path, 'wb') as target:
+            pickle.dump(variable, target, **kwargs)
+        return self
+
+    def _save_text(self, 
+            variable: str, 
+            file_path: Union[str, pathlib.Path],
+            encoding: str = None,
+            **kwargs) -> None:
+        """Writes the str 'variable' to 'file_path'."""
+        with open(file_path, 'w', encoding = encoding) as target:
+            target.write(variable)
         return self
 
 
@@ -1016,6 +1601,13 @@ class FileFormat(object):
         required_parameters (Mapping[Any, Any]]): any required parameters
             that should be passed to the import or export methods. Defaults to
             None.
+        chunk_parameter (str): name of the kwarg of the import method which
+            sets the number of records per chunk. If None, the format cannot
+            be streamed. Defaults to None.
+        stream_method (str): name of a local Distributor method to stream the
+            file if 'module' cannot be imported. Defaults to None.
+        stream_parameters (Mapping[Any, Any]]): any parameters that should be
+            passed to the import method only when streaming. Defaults to None.
 
     """
 
@@ -1028,4 +1620,33 @@ class FileFormat(object):
     save_method: str = None
     shared_parameters: Sequence[str] = None
     required_parameters: Mapping[Any, Any] = None
+    chunk_parameter: str = None
+    stream_method: str = None
+    stream_parameters: Mapping[Any, Any] = None
+
+    """ Public Methods """
+
+    def load(self, method: str) -> Callable:
+        """Returns the method named in attribute 'method' from 'modules'.
+
+        Imported methods are cached in '_loaded'.
+
+        Args:
+            method (str): name of the attribute that stores the method name,
+                such as 'load_method'.
+
+        Raises:
+            ImportError: if 'modules' cannot be imported.
+
+        Returns:
+            Callable: the method stored in 'modules'.
+
+        """
+        name = getattr(self, method)
+        try:
+            return self._loaded[name]
+        except KeyError:
+            module = importlib.import_module(self.modules)
+            self._loaded[name] = getattr(module, name)
+            return self._loaded[name]
     
\ No newline at end of file
@@ -9,23 +9,48 @@ Contents:
         them from disk or by the passed arguments.    
     Clerk (object): interface for sourdough file management classes and 
         methods.
+    LayeredSections (MutableMapping): settings sections which are looked up
+        through prioritized layers without merging them.
+    LazySections (MutableMapping): settings sections which are typed when they
+        are first accessed.
+    SectionChain (ChainMap): a section of LayeredSections which counts changes
+        made through it.
          
 """
 from __future__ import annotations
 import abc
+import collections.abc
 import configparser
 import dataclasses
+import hashlib
 import importlib
 import importlib.util
 import more_itertools
 import json
+import logging
+import multiprocessing.shared_memory
+import os
 import pathlib
+import pickle
+import struct
+import tempfile
+import threading
 import toml
+import types
+import weakref
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
-                    Optional, Sequence, Tuple, Type, Union)
+                    MutableMapping, Optional, Sequence, Tuple, Type, Union)
 import sourdough
 
 
+logger = logging.getLogger()
+
+# Layout of the header of shared settings: size of the pickled settings in 
+# bytes. Shared memory blocks may be larger than requested, so the size is
+# stored with the settings.
+SHARED_HEADER = struct.Struct('<Q')
+
+
 @dataclasses.dataclass
 class Configuration(sourdough.Lexicon):
     """Loads and stores configuration settings.
@@ -44,7 +69,24 @@ class Configuration(sourdough.Lexicon):
     automatically converted to appropriate datatypes (str, list, float, bool, 
     and int are currently supported). Type conversion is automatically disabled
     if the source file is a python module (assuming the user has properly set
-    the types of the stored python dict).
+    the types of the stored python dict). Types are inferred for each section
+    when it is first accessed, so sections that are never used are never 
+    converted.
+
+    Settings are stored in layers which are searched in order of priority: 
+    'runtime' (values set on the instance), 'environment' (environment 
+    variables, if 'environment' is passed), 'source' (the passed 'contents'), 
+    and 'defaults'. Each option is found in the highest priority layer that
+    has it without copying or merging the layers, and any layer can be 
+    replaced with 'replace_layer' without rebuilding the others.
+
+    Resolved settings can be placed in shared memory with 'share' so that 
+    worker processes load them with 'attach' instead of parsing the settings
+    file or receiving pickled settings with each task.
+
+    If 'contents' is loaded from a file, the file can be watched with 'watch'.
+    When the file changes, it is loaded again, instances that were injected
+    with changed sections are updated, and registered callbacks are called.
 
     Because Configuration uses ConfigParser for .ini files, by default it stores 
     a 2-level dict. The desire for accessibility and simplicity dictated this 
@@ -62,7 +104,23 @@ class Configuration(sourdough.Lexicon):
             Defaults to True.
         defaults (Mapping[str, Mapping[str]]): any default options that should
             be used when a user does not provide the corresponding options in 
-            their configuration settings. Defaults to an empty dict.
+            their configuration settings. It is used as the lowest priority 
+            layer without being copied. Defaults to an empty dict.
+        environment (str): prefix of environment variables to use as settings
+            in the 'environment' layer. A variable named 
+            '{environment}__{section}__{option}' sets 'option' in 'section'. 
+            Section and option names are lowercased. Defaults to None, which 
+            does not read environment variables.
+        cache (Union[bool, str, pathlib.Path]): whether to store the parsed 
+            settings from an ini, json, or toml file in a pickled cache file 
+            that later instances load instead of parsing the file again. If
+            'infer_types' is True, every section is typed before it is cached,
+            so later instances do not type sections again. If True, the 
+            cache file is stored next to the settings file. If a str or Path 
+            is passed, it is the folder where the cache file is stored. A 
+            cache file is only used if the path, modification time,
+            and size of the settings file, the sourdough version, and 
+            'infer_types' all match. Defaults to False.
 
     """
     contents: Union[str, pathlib.Path, Mapping[str, Mapping[str, Any]]] = (
@@ -70,6 +128,29 @@ class Configuration(sourdough.Lexicon):
     infer_types: bool = True
     defaults: Mapping[str, Mapping[str, Any]] = dataclasses.field(
         default_factory = dict)
+    cache: Union[bool, str, pathlib.Path] = False
+    environment: str = None
+    _source: pathlib.Path = dataclasses.field(
+        default = None, init = False, repr = False, compare = False)
+    _stamp: Tuple[int, int] = dataclasses.field(
+        default = None, init = False, repr = False, compare = False)
+    _bindings: Dict[int, Tuple[weakref.ref, Tuple[str, ...]]] = (
+        dataclasses.field(
+            default_factory = dict, 
+            init = False, 
+            repr = False, 
+            compare = False))
+    _callbacks: List[Callable[[Configuration, Dict[str, Dict[str, Any]]], 
+                              None]] = dataclasses.field(
+        default_factory = list, init = False, repr = False, compare = False)
+    _watcher: threading.Event = dataclasses.field(
+        default = None, init = False, repr = False, compare = False)
+    _shared: Tuple[int, str, weakref.finalize] = dataclasses.field(
+        default = None, init = False, repr = False, compare = False)
+    _attached: ClassVar[Dict[str, Configuration]] = {}
+    _plans: Dict[Tuple[Tuple[Optional[str], ...], bool], Tuple[
+                 int, Tuple[Tuple[str, Any], ...]]] = dataclasses.field(
+        default_factory = dict, init = False, repr = False, compare = False)
 
     """ Initialization Methods """
 
@@ -80,14 +161,15 @@ class Configuration(sourdough.Lexicon):
             super().__post_init__()
         except AttributeError:
             pass
-        # Validates passed 'contents' on class initialization.
-        self.contents = self.validate(contents = self.contents)
-        # Infers types for values in 'contents', if the 'infer_types' option is 
-        # selected.
-        if self.infer_types:
-            self.contents = self._infer_types(contents = self.contents)
-        # Adds default settings as backup settings to 'contents'.
-        self.contents = self._add_defaults(contents = self.contents)
+        # Stores the source file so that it can be watched for changes.
+        if isinstance(self.contents, (str, pathlib.Path)):
+            self._source = pathlib.Path(self.contents)
+        self.contents = LayeredSections(layers = {
+            'runtime': {},
+            'environment': self._load_from_environment(
+                prefix = self.environment),
+            'source': self._load(contents = self.contents),
+            'defaults': self.defaults})
 
     """ Public Methods """
 
@@ -126,10 +208,7 @@ class Configuration(sourdough.Lexicon):
             contents (Mapping[Any, Any]): a dict to store in 'section'.
 
         """
-        try:
-            self[section].update(self.validate(contents = contents))
-        except KeyError:
-            self[section] = self.validate(contents = contents)
+        self[section] = self.validate(contents = contents)
         return self
 
     def inject(self, instance: object,
@@ -149,27 +228,528 @@ class Configuration(sourdough.Lexicon):
             instance (object): sourdough class instance with modifications made.
 
         """
-        sections = ['general']
+        return self.inject_many(
+            instances = [instance], 
+            additional = additional, 
+            overwrite = overwrite)[0]
+
+    def inject_many(self, instances: Iterable[object],
+                    additional: Union[Sequence[str], str] = None, 
+                    overwrite: bool = False) -> List[object]:
+        """Injects appropriate items into each of 'instances' from 'contents'.
+
+        The attributes and values to inject for each set of sections are 
+        compiled into a plan once and reused until 'contents' is changed, so
+        injecting many instances with the same 'name' is a single loop.
+
+        Args:
+            instances (Iterable[object]): sourdough class instances to be 
+                modified.
+            additional (Union[Sequence[str], str]]): other section(s) in 
+                'contents' to inject into each instance. Defaults to None.
+            overwrite (bool]): whether to overwrite a local attribute in an 
+                instance if there are values stored in that attribute. 
+                Defaults to False.
+
+        Returns:
+            List[object]: sourdough class instances with modifications made.
+
+        """
+        additional = tuple(more_itertools.always_iterable(additional))
+        instances = list(instances)
+        for instance in instances:
+            sections = ('general', getattr(instance, 'name', None)) + additional
+            plan = self._get_plan(sections = sections, overwrite = overwrite)
+            self._bind(instance = instance, sections = sections)
+            if overwrite:
+                for key, value in plan:
+                    setattr(instance, key, value)
+            else:
+                for key, value in plan:
+                    if not getattr(instance, key, None):
+                        setattr(instance, key, value)
+        return instances
+
+    def reload(self) -> Dict[str, Dict[str, Any]]:
+        """Loads the source file again and applies any changes.
+
+        Changed, added, and removed options are injected into every instance 
+        previously passed to 'inject' with the changed sections, replacing the
+        values of those attributes. A removed option is given the value in 
+        effect from the other layers or None if no layer has it. Then, each 
+        registered callback is called with this instance and the changes.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: keys are names of changed sections and
+                values are dicts of the changed, added, or removed options in 
+                each.
+            
+        """
+        if self._source is None:
+            return {}
+        contents = self._load(contents = self._source)
+        changes = self._compare(
+            old = self.contents.layers['source'], 
+            new = contents)
+        self.contents.replace(name = 'source', layer = contents)
+        # Reports the values which are in effect after higher priority layers
+        # are applied.
+        for section, options in changes.items():
+            current = self.contents.get(section)
+            if isinstance(options, Mapping):
+                if not isinstance(current, Mapping):
+                    current = {}
+                changes[section] = {key: current.get(key) for key in options}
+            else:
+                changes[section] = current
+        if changes:
+            for reference, sections in list(self._bindings.values()):
+                instance = reference()
+                if instance is not None:
+                    for section in sections:
+                        for key, value in changes.get(section, {}).items():
+                            setattr(instance, key, value)
+            for callback in list(self._callbacks):
+                callback(self, changes)
+        return changes
+
+    def replace_layer(self, name: str, contents: Union[
+            str, 
+            pathlib.Path, 
+            Mapping[str, Mapping[str, Any]]]) -> Configuration:
+        """Replaces the layer 'name' without changing the other layers.
+
+        Args:
+            name (str): name of the layer to replace: 'runtime', 'environment',
+                'source', 'defaults', or a new layer, which is given the lowest
+                priority.
+            contents (Union[str, pathlib.Path, Mapping[str, Mapping[str, 
+                Any]]]): a dict, a str file path to a file with settings, or a
+                pathlib Path to a file with settings. Types are inferred for 
+                values loaded from a file if 'infer_types' is True.
+            
+        """
+        contents = self.validate(contents = contents)
+        if self.infer_types and name not in ['runtime', 'defaults']:
+            contents = self._infer_types(contents = contents)
+        self.contents.replace(name = name, layer = contents)
+        return self
+
+    def share(self) -> str:
+        """Stores the resolved settings in a shared memory block.
+
+        Every section is resolved through the layers and typed before it is 
+        stored, so attached instances do no further work. The same block is 
+        returned until 'contents' is changed through this instance. The block 
+        stays available until 'unshare' is called or this instance is garbage
+        collected.
+
+        Returns:
+            str: name of the shared memory block to pass to 'attach'.
+            
+        """
+        version = self.contents.version
+        if self._shared is not None and self._shared[0] == version:
+            return self._shared[1]
+        self.unshare()
+        resolved = {
+            key: dict(value) if isinstance(value, Mapping) else value
+            for key, value in self.contents.items()}
+        data = pickle.dumps(resolved, protocol = pickle.HIGHEST_PROTOCOL)
+        block = self._open_shared(size = SHARED_HEADER.size + len(data))
+        SHARED_HEADER.pack_into(block.buf, 0, len(data))
+        block.buf[SHARED_HEADER.size:SHARED_HEADER.size + len(data)] = data
+        self._shared = (
+            version, 
+            block.name, 
+            weakref.finalize(self, self._release_shared, block))
+        return block.name
+
+    def unshare(self) -> Configuration:
+        """Releases the shared memory block created by 'share'."""
+        if self._shared is not None:
+            self._shared[2]()
+            self._shared = None
+        return self
+
+    def unwatch(self) -> Configuration:
+        """Stops watching the source file."""
+        if self._watcher is not None:
+            self._watcher.set()
+            self._watcher = None
+        return self
+
+    def watch(self, interval: float = 1.0, 
+              callbacks: Union[
+                  Callable[[Configuration, Dict[str, Dict[str, Any]]], None],
+                  Sequence[Callable[[Configuration, Dict[str, Dict[str, Any]]], 
+                                    None]]] = None) -> Configuration:
+        """Watches the source file and reloads it whenever it changes.
+
+        A daemon thread compares the modification time and size of the source
+        file every 'interval' seconds and calls 'reload' when either changes.
+
+        Args:
+            interval (float): seconds between checks of the source file. 
+                Defaults to 1.0.
+            callbacks (Union[Callable, Sequence[Callable]]): function(s) called
+                with this instance and the changes returned by 'reload' after
+                each change. Defaults to None.
+
+        Raises:
+            ValueError: if 'contents' was not loaded from a file.
+            
+        """
+        if self._source is None:
+            raise ValueError('only settings loaded from a file can be watched')
+        if callbacks is not None:
+            self._callbacks.extend(more_itertools.always_iterable(callbacks))
+        if self._watcher is None:
+            self._watcher = threading.Event()
+            # The thread only holds a weak reference, so watching does not keep
+            # this instance alive.
+            threading.Thread(
+                target = self._poll, 
+                kwargs = {
+                    'reference': weakref.ref(self),
+                    'stop': self._watcher, 
+                    'interval': interval},
+                daemon = True).start()
+        return self
+
+    """ Class Methods """
+
+    @classmethod
+    def attach(cls, name: str) -> Configuration:
+        """Returns a read-only instance with settings from shared memory.
+
+        Settings are read from the block once per process. Later calls with
+        the same 'name' return the same instance, so tasks run in a worker 
+        process do not load them again. It is intended for worker processes 
+        started by multiprocessing from the process that called 'share'. 
+        The shared settings cannot be changed. Sections and options set on the
+        returned instance are stored in its 'runtime' layer, which is shared 
+        by every caller in the process.
+
+        Args:
+            name (str): name of a shared memory block returned by 'share'.
+
+        Returns:
+            Configuration: instance with the shared settings.
+            
+        """
         try:
-            sections.append(instance.name)
-        except AttributeError:
+            return cls._attached[name]
+        except KeyError:
             pass
-        if additional:
-            sections.extend(more_itertools.always_iterable(additional))
-        for section in sections:
-            try:
-                for key, value in self.contents[section].items():
-                    instance = self._inject(
-                        instance = instance,
-                        attribute = key,
-                        value = value,
-                        overwrite = overwrite)
-            except KeyError:
-                pass
-        return instance
+        block = cls._open_shared(name = name)
+        try:
+            (size,) = SHARED_HEADER.unpack_from(block.buf, 0)
+            start = SHARED_HEADER.size
+            with block.buf[start:start + size] as data:
+                contents = pickle.loads(data)
+        finally:
+            block.close()
+        contents = types.MappingProxyType({
+            key: types.MappingProxyType(value) if isinstance(value, dict) 
+            else value 
+            for key, value in contents.items()})
+        settings = cls(contents = contents, infer_types = False)
+        cls._attached[name] = settings
+        return settings
 
     """ Private Methods """
 
+    @staticmethod
+    def _open_shared(
+            name: str = None, 
+            size: int = None) -> multiprocessing.shared_memory.SharedMemory:
+        """Opens or creates a shared memory block that is not tracked.
+
+        Each process that opens a block registers it with a resource tracker, 
+        which destroys the block when the process exits. Worker processes 
+        may start their own resource trackers. So, blocks are never tracked,
+        and blocks created by 'share' are released by 'unshare' or when the 
+        sharing instance is garbage collected.
+
+        Args:
+            name (str): name of an existing shared memory block to open. 
+                Defaults to None, which creates a new block.
+            size (int): size in bytes of a new block. Defaults to None.
+
+        Returns:
+            multiprocessing.shared_memory.SharedMemory: opened block.
+            
+        """
+        create = name is None
+        try:
+            return multiprocessing.shared_memory.SharedMemory(
+                name = name, 
+                create = create,
+                size = size or 0,
+                track = False)
+        except TypeError:
+            # Before python 3.13, blocks cannot be opened without tracking.
+            block = multiprocessing.shared_memory.SharedMemory(
+                name = name, 
+                create = create,
+                size = size or 0)
+            Configuration._set_tracked(block = block, tracked = False)
+            return block
+
+    @staticmethod
+    def _release_shared(
+            block: multiprocessing.shared_memory.SharedMemory) -> None:
+        """Closes and destroys a block created by '_open_shared'.
+
+        Args:
+            block (multiprocessing.shared_memory.SharedMemory): block to 
+                release.
+            
+        """
+        block.close()
+        # Registers the block again because 'unlink' unregisters it.
+        Configuration._set_tracked(block = block, tracked = True)
+        block.unlink()
+        return
+
+    @staticmethod
+    def _set_tracked(
+            block: multiprocessing.shared_memory.SharedMemory, 
+            tracked: bool) -> None:
+        """Registers or unregisters 'block' with the resource tracker.
+
+        multiprocessing has no public API for this before python 3.13, so the
+        private parts it relies on are checked and, if they are missing, the 
+        block is left as it is. Blocks opened with 'track = False' are never
+        registered, so they are skipped.
+
+        Args:
+            block (multiprocessing.shared_memory.SharedMemory): block to 
+                register or unregister.
+            tracked (bool): whether to register (True) or unregister (False)
+                'block'.
+            
+        """
+        if os.name != 'posix' or not getattr(block, '_track', True):
+            return
+        try:
+            from multiprocessing import resource_tracker
+        except ImportError:
+            return
+        # The tracker stores the name with its leading slash, which is kept in
+        # the private '_name' and removed from the public 'name'.
+        name = getattr(block, '_name', None) or f'/{block.name}'
+        try:
+            if tracked:
+                resource_tracker.register(name, 'shared_memory')
+            else:
+                resource_tracker.unregister(name, 'shared_memory')
+        except (AttributeError, KeyError, OSError):
+            pass
+        return
+
+    def _bind(self, instance: object, sections: Sequence[str]) -> None:
+        """Records that 'sections' were injected into 'instance'.
+
+        Only a weak reference to 'instance' is kept. Instances which do not
+        support weak references are not updated by 'reload'.
+
+        Args:
+            instance (object): sourdough class instance which was injected.
+            sections (Sequence[str]): names of sections injected.
+            
+        """
+        key = id(instance)
+        bindings = self._bindings
+        try:
+            reference, bound = bindings[key]
+        except KeyError:
+            try:
+                reference = weakref.ref(
+                    instance, lambda _: bindings.pop(key, None))
+            except TypeError:
+                return
+            bound = ()
+        bindings[key] = (
+            reference, tuple(dict.fromkeys(bound + tuple(sections))))
+        return
+
+    def _compare(self, old: Mapping[str, Mapping[str, Any]], 
+                 new: Mapping[str, Mapping[str, Any]]) -> Dict[
+                     str, Dict[str, Any]]:
+        """Returns the options in 'new' which differ from those in 'old'.
+
+        Sections are compared before their types are inferred, so comparing 
+        does not convert unchanged sections.
+
+        Args:
+            old (Mapping[str, Mapping[str, Any]]): prior 'contents'.
+            new (Mapping[str, Mapping[str, Any]]): reloaded 'contents'.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: keys are names of changed sections and
+                values are dicts of the changed or added options in each. 
+                Options (and sections) in 'old' which are not in 'new' are 
+                included with None values.
+            
+        """
+        old_raw = getattr(old, 'contents', old)
+        new_raw = getattr(new, 'contents', new)
+        changes = {}
+        for section, options in new_raw.items():
+            previous = old_raw.get(section)
+            if options != previous:
+                if isinstance(options, Mapping) and isinstance(
+                        previous, Mapping):
+                    keys = [
+                        key for key, value in options.items()
+                        if key not in previous or previous[key] != value]
+                    changes[section] = {
+                        key: new[section][key] for key in keys}
+                    changes[section].update(dict.fromkeys(
+                        key for key in previous if key not in options))
+                else:
+                    changes[section] = new[section]
+        for section, previous in old_raw.items():
+            if section not in new_raw:
+                if isinstance(previous, Mapping):
+                    changes[section] = dict.fromkeys(previous)
+                else:
+                    changes[section] = None
+        return changes
+
+    def _get_cache_key(self, source: pathlib.Path) -> Tuple[Any, ...]:
+        """Returns the key which a cache file of 'source' must match.
+
+        Args:
+            source (pathlib.Path): path of a settings file.
+
+        Returns:
+            Tuple[Any, ...]: resolved path, modification time, and size of 
+                'source', the sourdough version, and 'infer_types'.
+            
+        """
+        stats = source.stat()
+        return (
+            str(source), 
+            stats.st_mtime_ns, 
+            stats.st_size, 
+            sourdough.__version__, 
+            self.infer_types)
+
+    def _get_cache_path(self, contents: Union[
+            str, 
+            pathlib.Path, 
+            Mapping[str, Mapping[str, Any]]]) -> Optional[pathlib.Path]:
+        """Returns the path of the cache file for 'contents'.
+
+        Args:
+            contents (Union[str, pathlib.Path, Mapping[str, Mapping[str, 
+                Any]]]): passed 'contents'.
+
+        Returns:
+            Optional[pathlib.Path]: path of the cache file or None if 'cache' is
+                False or 'contents' is not a path to a cacheable file. Python 
+                files are not cached because loading them executes code.
+            
+        """
+        if (not self.cache 
+                or not isinstance(contents, (str, pathlib.Path))
+                or pathlib.Path(contents).suffix == '.py'):
+            return None
+        source = pathlib.Path(contents).resolve()
+        digest = hashlib.blake2b(
+            str(source).encode('utf-8'), digest_size = 8).hexdigest()
+        if self.cache is True:
+            folder = source.parent
+        else:
+            folder = pathlib.Path(self.cache)
+        return folder / f'.{source.name}.{digest}.cache'
+
+    def _load_from_cache(self, cache_path: Optional[pathlib.Path],
+                         key: Tuple[Any, ...]) -> Optional[
+                             Mapping[str, Mapping[str, Any]]]:
+        """Returns cached 'contents' if the cache file is current.
+
+        Args:
+            cache_path (Optional[pathlib.Path]): path of the cache file.
+            key (Tuple[Any, ...]): key returned by '_get_cache_key'.
+
+        Returns:
+            Optional[Mapping[str, Mapping[str, Any]]]: parsed 'contents' or 
+                None if there is no current cache file.
+            
+        """
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                cached_key, contents = pickle.load(cache_file)
+        except (OSError, EOFError, AttributeError, ImportError, ValueError, 
+                pickle.UnpicklingError):
+            return None
+        return contents if cached_key == key else None
+
+    def _save_to_cache(self, cache_path: Optional[pathlib.Path], 
+                       key: Tuple[Any, ...],
+                       contents: Mapping[str, Mapping[str, Any]]) -> None:
+        """Writes 'contents' to a cache file.
+
+        The file is written to a temporary file and then moved into place, so 
+        concurrent readers never see a partly written cache file. Failures to
+        write are ignored because the cache is only an optimization.
+
+        Args:
+            cache_path (Optional[pathlib.Path]): path of the cache file. If it
+                is None, nothing is written.
+            key (Tuple[Any, ...]): key returned by '_get_cache_key' before 
+                'contents' was parsed.
+            contents (Mapping[str, Mapping[str, Any]]): parsed settings.
+            
+        """
+        if cache_path is None:
+            return
+        temporary = None
+        try:
+            cache_path.parent.mkdir(parents = True, exist_ok = True)
+            handle, temporary = tempfile.mkstemp(dir = cache_path.parent)
+            with os.fdopen(handle, 'wb') as cache_file:
+                pickle.dump(
+                    (key, contents), 
+                    cache_file, 
+                    protocol = pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, cache_path)
+        except (OSError, TypeError, AttributeError, pickle.PicklingError):
+            if temporary is not None and os.path.exists(temporary):
+                os.remove(temporary)
+        return
+
+    def _load_from_environment(self, prefix: Optional[str]) -> Mapping[
+                               str, Mapping[str, Any]]:
+        """Returns settings from environment variables starting with 'prefix'.
+
+        Args:
+            prefix (Optional[str]): prefix of the environment variable names.
+                If it is None, no environment variables are read.
+
+        Returns:
+            Mapping[str, Mapping[str, Any]]: settings from environment 
+                variables named '{prefix}__{section}__{option}'.
+            
+        """
+        contents = {}
+        if prefix:
+            start = f'{prefix}__'
+            for name, value in os.environ.items():
+                if name.startswith(start) and '__' in name[len(start):]:
+                    section, _, option = name[len(start):].partition('__')
+                    contents.setdefault(section.lower(), {})[
+                        option.lower()] = value
+        if self.infer_types:
+            contents = self._infer_types(contents = contents)
+        return contents
+
     def _load_from_ini(self, file_path: str) -> Mapping[Any, Any]:
         """Returns settings dictionary from an .ini file.
 
@@ -257,10 +837,96 @@ class Configuration(sourdough.Lexicon):
         except FileNotFoundError:
             raise FileNotFoundError(f'settings file {file_path} not found')
 
+    def _load(self, contents: Union[
+            str, 
+            pathlib.Path, 
+            Mapping[str, Mapping[str, Any]]]) -> Mapping[
+                str, Mapping[str, Any]]:
+        """Returns validated and typed 'contents' for the 'source' layer.
+
+        The source file is checked before it is parsed, so if it is changed 
+        while it is parsed, the parsed settings are stored under the older 
+        cache key and the change is seen by the next load or reload.
+
+        Args:
+            contents (Union[str, pathlib.Path, Mapping[str, Mapping[str, 
+                Any]]]): a dict, a str file path to a file with settings, or a
+                pathlib Path to a file with settings.
+
+        Returns:
+            Mapping[str, Mapping[str, Any]]: loaded settings.
+            
+        """
+        if self._source is not None:
+            stats = self._source.stat()
+            self._stamp = (stats.st_mtime_ns, stats.st_size)
+        # Loads parsed 'contents' from a cache file, if possible.
+        cache_path = self._get_cache_path(contents = contents)
+        key = None
+        if cache_path is not None:
+            try:
+                key = self._get_cache_key(
+                    source = pathlib.Path(contents).resolve())
+            except OSError:
+                cache_path = None
+        loaded = self._load_from_cache(cache_path = cache_path, key = key)
+        if loaded is None:
+            # Validates passed 'contents'.
+            loaded = self.validate(contents = contents)
+            # Infers types for values in 'contents', if the 'infer_types' 
+            # option is selected.
+            if self.infer_types:
+                loaded = self._infer_types(contents = loaded)
+                if cache_path is not None:
+                    # Types every section before it is cached, so that 
+                    # sections loaded from the cache are not typed again.
+                    typed = {section: loaded[section] for section in loaded}
+                    loaded = LazySections(
+                        contents = typed, 
+                        typed = dict(typed))
+            self._save_to_cache(
+                cache_path = cache_path, 
+                key = key, 
+                contents = loaded)
+        return loaded
+
+    @staticmethod
+    def _poll(reference: weakref.ref, stop: threading.Event, 
+              interval: float) -> None:
+        """Calls 'reload' whenever the source file changes until 'stop' is set.
+
+        Polling also stops once the watched instance is garbage collected.
+
+        Args:
+            reference (weakref.ref): weak reference to the watched instance.
+            stop (threading.Event): event which stops polling when set.
+            interval (float): seconds between checks of the source file.
+            
+        """
+        while not stop.wait(interval):
+            settings = reference()
+            if settings is None:
+                break
+            try:
+                stats = settings._source.stat()
+            except OSError:
+                continue
+            if (stats.st_mtime_ns, stats.st_size) != settings._stamp:
+                try:
+                    settings.reload()
+                except Exception:
+                    # Keeps the current settings if the file is partly written
+                    # or invalid, or a callback failed. The next change is 
+                    # loaded normally.
+                    logger.exception(f'failed to reload {settings._source}')
+                    settings._stamp = (stats.st_mtime_ns, stats.st_size)
+            del settings
+        return
+
     def _infer_types(self,
             contents: Mapping[Any, Mapping[Any, Any]]) -> Mapping[
                 str, Mapping[Any, Any]]:
-        """Converts stored values to appropriate datatypes.
+        """Wraps 'contents' so that values are converted when first accessed.
 
         Args:
             contents (Mapping[Any, Mapping[Any, Any]]): a nested contents dict
@@ -268,60 +934,87 @@ class Configuration(sourdough.Lexicon):
 
         Returns:
             Mapping[Any, Mapping[Any, Any]]: with the nested values converted to 
-                the appropriate datatypes.
+                the appropriate datatypes when each section is first accessed.
 
         """
-        new_contents = {}
-        for key, value in contents.items():
-            if isinstance(value, dict):
-                inner_bundle = {
-                    inner_key: sourdough.tools.typify(inner_value)
-                    for inner_key, inner_value in value.items()}
-                new_contents[key] = inner_bundle
-            else:
-                new_contents[key] = sourdough.tools.typify(value)
-        return new_contents
+        if isinstance(contents, LazySections):
+            return contents
+        else:
+            return LazySections(contents = contents)
 
-    def _add_defaults(self, contents: Mapping[str, Mapping[str, Any]]) -> (
-            Mapping[str, Mapping[str, Any]]):
-        """Creates a backup set of mappings for sourdough settings lookup.
+    def _get_plan(self, sections: Tuple[Optional[str], ...], 
+                  overwrite: bool) -> Tuple[Tuple[str, Any], ...]:
+        """Returns the attributes and values to inject from 'sections'.
 
+        Sections are injected in order. Without 'overwrite', an attribute 
+        keeps the first truthy value injected, so each attribute is planned 
+        with the first truthy value in 'sections' (or the last value if none
+        is truthy). With 'overwrite', the last value is planned. 
+        
+        Plans are cached until 'contents' is changed through this instance,
+        including changes to a section returned by it (such as 
+        'settings['section']['key'] = value'). Changes made directly to the 
+        dicts in a layer of 'contents' or to a dict after it was passed are 
+        not seen by cached plans.
 
         Args:
-            contents (MutableMapping[Any, Mapping[Any, Any]]): a nested contents 
-                dict to add defaults to.
+            sections (Tuple[Optional[str], ...]): names of sections to inject. 
+                Names which are None or not in 'contents' are skipped.
+            overwrite (bool]): whether injected values replace existing values.
 
         Returns:
-            Mapping[Any, Mapping[Any, Any]]: with stored defaults added.
-
+            Tuple[Tuple[str, Any], ...]: pairs of attribute names and values.
+            
         """
-        new_contents = self.defaults
-        new_contents.update(contents)
-        return new_contents
+        key = (sections, overwrite)
+        version = self.contents.version
+        try:
+            planned_version, plan = self._plans[key]
+            if planned_version == version:
+                return plan
+        except KeyError:
+            pass
+        values = {}
+        for section in dict.fromkeys(sections):
+            if section is not None and section in self.contents:
+                for attribute, value in self.contents[section].items():
+                    if overwrite or not values.get(attribute):
+                        values[attribute] = value
+        plan = tuple(values.items())
+        self._plans[key] = (version, plan)
+        return plan
 
-    def _inject(self, instance: object, attribute: str, value: Any, 
-                overwrite: bool) -> object:
-        """Adds attribute to 'instance' based on conditions.
+    """ Dunder Methods """
 
-        Args:
-            instance (object): sourdough class instance to be modified.
-            attribute (str): name of attribute to inject.
-            value (Any): value to assign to attribute.
-            overwrite (bool]): whether to overwrite a local attribute
-                in 'instance' if there are values stored in that attribute.
-                Defaults to False.
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns instance state without runtime-only attributes.
 
-        Returns:
-            object: with attribute possibly injected.
+        Bindings, callbacks, the watcher, and the shared memory block belong 
+        to the process and instances which created them, and weak references
+        and events cannot be pickled.
 
+        Returns:
+            Dict[str, Any]: attributes to pickle.
+            
         """
-        if (not hasattr(instance, attribute)
-                or not getattr(instance, attribute)
-                or overwrite):
-            setattr(instance, attribute, value)
-        return instance
+        state = self.__dict__.copy()
+        for name in ['_bindings', '_callbacks', '_watcher', '_shared']:
+            state.pop(name, None)
+        return state
 
-    """ Dunder Methods """
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores pickled state with empty runtime-only attributes.
+
+        Args:
+            state (Dict[str, Any]): attributes returned by '__getstate__'.
+            
+        """
+        self.__dict__.update(state)
+        self._bindings = {}
+        self._callbacks = []
+        self._watcher = None
+        self._shared = None
+        return
 
     def __setitem__(self, key: str, value: Mapping[str, Any]) -> None:
         """Creates new key/value pair(s) in a section of the active dictionary.
@@ -336,13 +1029,9 @@ class Configuration(sourdough.Lexicon):
 
         """
         try:
-            self.contents[key].update(value)
-        except KeyError:
-            try:
-                self.contents[key] = value
-            except TypeError:
-                raise TypeError(
-                    'key must be a str and value must be a dict type')
+            self.contents[key] = value
+        except TypeError:
+            raise TypeError('key must be a str and value must be a dict type')
         return self
 
     def __missing__(self, key: str) -> Dict:
@@ -361,6 +1050,242 @@ class Configuration(sourdough.Lexicon):
         return value
 
 
+@dataclasses.dataclass
+class LayeredSections(collections.abc.MutableMapping):
+    """Settings sections which are looked up through prioritized layers.
+
+    A section which is a mapping is returned as a collections.ChainMap of the
+    layers' sections, so each option comes from the highest priority layer 
+    that has it and nothing is copied. The first layer's section is always
+    at the front of the ChainMap, so changes made through it are stored in 
+    the first layer and never in a lower layer, such as passed defaults. If 
+    the first layer has no such section, an empty one is added to it when an
+    option is first set through the ChainMap, so reading never changes the 
+    layers. If the first layer is read-only, the returned section cannot be
+    changed. Other sections are returned as stored.
+
+    The ChainMap is a SectionChain, so changes made through it increase 
+    'version' like changes made to the LayeredSections itself. Changes made
+    directly to a layer's dicts are not counted.
+
+    Sections set on a LayeredSections are merged into its first layer. 
+    Deleting a section removes it from every layer.
+
+    Args:
+        layers (Dict[str, Mapping[str, Any]]): keys are names of layers and 
+            values are their sections, in order of priority from highest to
+            lowest. Defaults to an empty dict.
+        version (int): number of changes made through the LayeredSections, 
+            which allows cached results derived from it to be invalidated.
+            Defaults to 0.
+            
+    """
+    layers: Dict[str, Mapping[str, Any]] = dataclasses.field(
+        default_factory = dict)
+    version: int = dataclasses.field(default = 0, compare = False)
+
+    """ Public Methods """
+
+    def replace(self, name: str, layer: Mapping[str, Any]) -> LayeredSections:
+        """Replaces or adds the layer 'name' with 'layer'.
+
+        Args:
+            name (str): name of the layer. A new layer is given the lowest 
+                priority.
+            layer (Mapping[str, Any]): sections of the layer.
+            
+        """
+        self.layers[name] = layer
+        self.version += 1
+        return self
+
+    """ Dunder Methods """
+
+    def __getitem__(self, key: str) -> Any:
+        # Uses 'collections.abc.Mapping' because isinstance checks with 
+        # 'typing.Mapping' are much slower.
+        found = [layer[key] for layer in self.layers.values() if key in layer]
+        if not found:
+            raise KeyError(key)
+        elif not isinstance(found[0], collections.abc.Mapping):
+            return found[0]
+        sections = [
+            item for item in found 
+            if isinstance(item, collections.abc.Mapping)]
+        first = next(iter(self.layers.values()))
+        if (key not in first 
+                and isinstance(first, collections.abc.MutableMapping)):
+            sections.insert(0, {})
+            return SectionChain(
+                *sections, owner = self, layer = first, name = key)
+        return SectionChain(*sections, owner = self)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        layer = next(iter(self.layers.values()))
+        if isinstance(value, Mapping) and isinstance(layer.get(key), Mapping):
+            layer[key].update(value)
+        else:
+            layer[key] = value
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        found = False
+        for layer in self.layers.values():
+            if key in layer:
+                del layer[key]
+                found = True
+        if not found:
+            raise KeyError(key)
+        self.version += 1
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in layer for layer in self.layers.values())
+
+    def __iter__(self) -> Iterable[str]:
+        return iter(dict.fromkeys(
+            key 
+            for layer in reversed(list(self.layers.values())) 
+            for key in layer))
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, collections.abc.Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+
+class SectionChain(collections.ChainMap):
+    """A section of LayeredSections which counts changes made through it.
+
+    Every change made through the SectionChain increases the 'version' of
+    'owner', so cached results derived from 'owner' are invalidated.
+
+    Args:
+        maps (Mapping[str, Any]): sections of the layers, in order of priority
+            from highest to lowest. Changes are stored in the first one.
+        owner (LayeredSections): the instance which returned the section. 
+            Defaults to None, which does not count changes.
+        layer (MutableMapping[str, Any]): the first layer, if it does not have
+            the section yet. The first map is stored in it at 'name' when an 
+            option is first set. Defaults to None.
+        name (str): name of the section. Defaults to None.
+            
+    """
+
+    def __init__(self, *maps: Mapping[str, Any], 
+                 owner: LayeredSections = None,
+                 layer: MutableMapping[str, Any] = None,
+                 name: str = None) -> None:
+        super().__init__(*maps)
+        self.owner = owner
+        self.layer = layer
+        self.name = name
+
+    """ Private Methods """
+
+    def _add_section(self) -> None:
+        """Stores the first map as the section 'name' in 'layer'."""
+        if self.layer is not None:
+            # Uses a section added by another SectionChain in the meantime.
+            self.maps[0] = self.layer.setdefault(self.name, self.maps[0])
+            self.layer = None
+        return
+
+    def _changed(self) -> None:
+        """Increases the 'version' of 'owner'."""
+        if self.owner is not None:
+            self.owner.version += 1
+        return
+
+    """ Dunder Methods """
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._add_section()
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def pop(self, key: str, *args: Any) -> Any:
+        """Removes 'key' from the first section and returns its value."""
+        value = super().pop(key, *args)
+        self._changed()
+        return value
+
+    def popitem(self) -> Tuple[str, Any]:
+        """Removes and returns an option from the first section."""
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        """Removes every option from the first section."""
+        super().clear()
+        self._changed()
+
+
+@dataclasses.dataclass
+class LazySections(collections.abc.MutableMapping):
+    """Settings sections which are typed when they are first accessed.
+
+    The values in each section are converted with 'sourdough.tools.typify' the
+    first time that the section is sought, and the converted section is kept
+    for later access. Values which are set directly are stored as passed.
+    
+    Args:
+        contents (Mapping[str, Any]): sections (or values) which have not been 
+            typed. Defaults to an empty dict.
+        typed (Mapping[str, Any]): sections (or values) which have been typed or
+            set directly. Defaults to an empty dict.
+            
+    """
+    contents: Mapping[str, Any] = dataclasses.field(default_factory = dict)
+    typed: Mapping[str, Any] = dataclasses.field(default_factory = dict)
+
+    """ Dunder Methods """
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self.typed[key]
+        except KeyError:
+            value = self.contents[key]
+            if isinstance(value, dict):
+                value = {
+                    inner_key: sourdough.tools.typify(inner_value)
+                    for inner_key, inner_value in value.items()}
+            else:
+                value = sourdough.tools.typify(value)
+            # Keeps the first converted section if another thread converted 
+            # the same section at the same time.
+            return self.typed.setdefault(key, value)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.contents[key] = value
+        self.typed[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.contents[key]
+        self.typed.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.contents
+
+    def __iter__(self) -> Iterable[str]:
+        return iter(self.contents)
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, collections.abc.Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+
 @dataclasses.dataclass
 class Clerk(object):
     """File and folder management for sourdough.
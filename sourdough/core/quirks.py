@@ -40,28 +40,209 @@ ToDo:
 """
 from __future__ import annotations
 import abc
+import collections.abc
+import concurrent.futures
+import contextvars
 import copy
 import dataclasses
+import functools
+import importlib
 import inspect
+import json
 import more_itertools
+import pathlib
+import threading
+import time
 import types
+import weakref
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
-                    Optional, Sequence, Tuple, Type, Union, get_args, 
+                    Optional, Sequence, Set, Tuple, Type, Union, get_args, 
                     get_origin)
 
 import sourdough
 
 
+_active_scope: contextvars.ContextVar = contextvars.ContextVar(
+    'sourdough_scope', default = None)
+# Tokens to restore the previously active Scope, stored per context so that
+# threads and tasks entering the same Scope at once do not share them.
+_scope_tokens: contextvars.ContextVar = contextvars.ContextVar(
+    'sourdough_scope_tokens', default = ())
+
+
+@dataclasses.dataclass
+class Scope(object):
+    """Registry scope which isolates changes to Library instances.
+
+    While a Scope is active, each Library that is changed is forked: the 
+    change is made to a copy of the Library's 'contents' stored in the Scope,
+    and every later lookup in that Library within the Scope uses the copy. 
+    Libraries that are not changed within a Scope are shared with the global
+    registry. Because the active Scope is stored in a context variable, each 
+    thread and asyncio task sees only the Scope that it (or its parent task) 
+    entered.
+
+    Scopes are activated as context managers and may be re-entered and nested,
+    including by several threads or tasks at once.
+    
+    Args:
+        name (str): designates the name of a class instance that is used for 
+            internal referencing throughout sourdough. Defaults to None.
+        contents (Dict[int, Mapping[Any, Type[Base]]]): keys are ids of forked
+            Library instances and values are their 'contents' in this scope. 
+            Defaults to an empty dict.
+        builds (Dict[int, Dict[Tuple[str, Tuple[str, ...]], Type[Base]]]): 
+            keys are ids of forked Library instances and values are their 
+            caches of built classes in this scope. Defaults to an empty dict.
+
+    Forks are discarded when their Library is garbage collected, so a new 
+    Library which reuses the id of a collected one does not inherit its fork.
+            
+    """
+    name: str = None
+    contents: Dict[int, Mapping[Any, Type[Base]]] = dataclasses.field(
+        default_factory = dict)
+    builds: Dict[int, Dict[Tuple[str, Tuple[str, ...]], Type[Base]]] = (
+        dataclasses.field(default_factory = dict))
+
+    """ Class Methods """
+
+    @classmethod
+    def active(cls) -> Optional[Scope]:
+        """Returns the active Scope or None if no Scope is active."""
+        return _active_scope.get()
+
+    """ Public Methods """
+
+    def clear(self) -> Scope:
+        """Discards all forked 'contents' and built classes in this scope."""
+        self.contents = {}
+        self.builds = {}
+        return self
+
+    def fork(self, library: Library, contents: Mapping[Any, Type[Base]]) -> (
+             None):
+        """Stores 'contents' as the 'contents' of 'library' in this scope.
+
+        Args:
+            library (Library): Library instance which is changed in this scope.
+            contents (Mapping[Any, Type[Base]]): new 'contents' of 'library'.
+            
+        """
+        key = id(library)
+        if key not in self.contents:
+            weakref.finalize(
+                library, self._discard, weakref.ref(self), key)
+        self.contents[key] = contents
+        return
+
+    """ Private Methods """
+
+    @staticmethod
+    def _discard(reference: weakref.ref, key: int) -> None:
+        """Removes the fork of a garbage collected Library.
+
+        Args:
+            reference (weakref.ref): weak reference to the Scope with the fork.
+            key (int): id of the garbage collected Library.
+            
+        """
+        scope = reference()
+        if scope is not None:
+            scope.contents.pop(key, None)
+            scope.builds.pop(key, None)
+        return
+
+    """ Dunder Methods """
+
+    def __enter__(self) -> Scope:
+        """Activates this scope in the current context."""
+        token = _active_scope.set(self)
+        _scope_tokens.set(_scope_tokens.get() + (token,))
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Restores the scope that was active before this one was entered."""
+        tokens = _scope_tokens.get()
+        _scope_tokens.set(tokens[:-1])
+        _active_scope.reset(tokens[-1])
+        return
+
+
+@dataclasses.dataclass
+class ScopedContents(object):
+    """Data descriptor which resolves a Library's 'contents' in a Scope.
+
+    The global 'contents' is stored in the instance's '__dict__'. If a Scope
+    is active and has forked the Library, the Scope's copy is returned and 
+    replacements of 'contents' are stored in the Scope instead. Outside of a 
+    Scope, access costs one context variable lookup.
+    
+    """
+
+    """ Dunder Methods """
+
+    def __get__(self, instance: Library, owner: Type[Library]) -> Mapping[
+                Any, Type[Base]]:
+        """Returns 'contents' of 'instance' in the active Scope.
+
+        Args:
+            instance (Library): Library instance with 'contents'.
+            owner (Type[Library]): class of 'instance'.
+
+        Returns:
+            Mapping[Any, Type[Base]]: 'contents' of 'instance'.
+            
+        """
+        if instance is None:
+            return self
+        scope = _active_scope.get()
+        if scope is not None:
+            try:
+                return scope.contents[id(instance)]
+            except KeyError:
+                pass
+        return instance.__dict__['contents']
+
+    def __set__(self, instance: Library, value: Mapping[Any, Type[Base]]) -> (
+                None):
+        """Stores 'value' as 'contents' of 'instance' in the active Scope.
+
+        'value' is always stored globally when 'instance' is being 
+        initialized, even if a Scope is active.
+
+        Args:
+            instance (Library): Library instance with 'contents'.
+            value (Mapping[Any, Type[Base]]): new 'contents' of 'instance'.
+            
+        """
+        scope = _active_scope.get()
+        if scope is None or 'contents' not in instance.__dict__:
+            instance.__dict__['contents'] = value
+        else:
+            scope.fork(library = instance, contents = value)
+        return
+
+
 @dataclasses.dataclass
 class Library(sourdough.Catalog):
     """Stores Base subclasses in a dictionary.
 
     A Library inherits the differences between a Catalog and a Lexicon.
     
-    A Library differs from a Catalog in 2 significant ways:
+    A Library differs from a Catalog in 4 significant ways:
         1) It should only store Base subclasses as values.
         2) It includes methods for accessing, building, customizing, and 
             instancing the stored subclasses.
+        3) 'contents' is never changed in place. Each change replaces it with
+            an updated copy while holding a lock, so reads do not need a lock
+            and always see a complete snapshot. Because changes copy 
+            'contents', they should be made through the Library rather than 
+            directly to 'contents'.
+        4) Changes made while a Scope is active are stored in that Scope and
+            are only seen by lookups made within it. So, different projects 
+            can register different subclasses under the same keys in one
+            process.
         
     Args:
         contents (Mapping[Any, Type[Base]]): stored dictionary with only Base 
@@ -73,12 +254,28 @@ class Library(sourdough.Catalog):
             passed is not a list or special access key (True) or to return a 
             list only when a list or special access key is used (False). 
             Defaults to False.       
+        manifest (Mapping[str, str]): keys of subclasses which have not yet
+            been imported and the import paths where they are located. A 
+            subclass is imported the first time that its key is sought. 
+            Defaults to an empty dict.
+        build_limit (ClassVar[int]): maximum number of classes built with 
+            quirks to keep cached. When the limit is exceeded, the least 
+            recently used class is evicted. Defaults to 128.
+            
     """
     contents: Mapping[Any, Type[Base]] = dataclasses.field(
         default_factory = dict)
     default: Any = None
     defaults: Sequence[Any] = dataclasses.field(default_factory = list)
     always_return_list: bool = False
+    manifest: Mapping[str, str] = dataclasses.field(default_factory = dict)
+    build_limit: ClassVar[int] = 128
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+    _builds: Dict[Tuple[str, Tuple[str, ...]], Type[Base]] = dataclasses.field(
+        default_factory = collections.OrderedDict, 
+        init = False, 
+        repr = False,
+        compare = False)
 
     """ Properties """
     
@@ -90,6 +287,20 @@ class Library(sourdough.Catalog):
     
     """ Public Methods """
 
+    def add(self, item: Mapping[Any, Type[Base]], **kwargs) -> None:
+        """Adds 'item' to the 'contents' attribute.
+        
+        Args:
+            item (Mapping[Any, Type[Base]]): items to add to 'contents'.
+            kwargs: creates a consistent interface even when subclasses have
+                additional parameters.
+                
+        """
+        with self._lock:
+            self.contents = {**self.contents, **item}
+            self._forget(names = list(item))
+        return self
+
     def borrow(self, name: Union[str, Sequence[str]]) -> Type[Base]:
         """Returns a stored subclass unchanged.
 
@@ -106,13 +317,20 @@ class Library(sourdough.Catalog):
                 match = self.contents[item]
                 break
             except KeyError:
-                pass
+                if item in self.manifest:
+                    match = self._import(key = item)
+                    break
         return match
 
     def build(self, name: str, 
               quirks: Union[str, Sequence[str]] = None) -> Type[Base]:
         """Returns subclass matching 'name' with selected quirks.
 
+        Built classes are cached using 'name' and 'quirks' as the key, so the
+        same class is returned for repeated calls with the same arguments. The
+        cache keeps up to 'build_limit' classes. Cached classes are discarded
+        when the class stored at 'name' is replaced or deleted.
+
         Args:
             name (str): key name of stored class in 'contents' to returned.
             quirks (Union[str, Sequence[str]]): names of Quirk subclasses to
@@ -122,12 +340,17 @@ class Library(sourdough.Catalog):
             Type: stored class.
             
         """
-        bases = []
-        if quirks is not None:
-            bases.extend(more_itertools.always_iterable(
-                sourdough.base.Quirk.library.select(name = quirks)))
-        bases.append(self.select(name = name))
-        return dataclasses.dataclass(type(name, tuple(bases), {}))
+        key = (name, tuple(more_itertools.always_iterable(quirks)))
+        builds = self._get_builds()
+        try:
+            built = builds[key]
+            builds.move_to_end(key)
+        except KeyError:
+            built = self._build(name = name, quirks = quirks)
+            builds[key] = built
+            while len(builds) > self.build_limit:
+                builds.popitem(last = False)
+        return built
     
     def instance(self, name: str, quirks: Union[str, Sequence[str]] = None, 
                  **kwargs) -> object:
@@ -151,6 +374,477 @@ class Library(sourdough.Catalog):
         else:
             return self.build(name = name, quirks = quirks)(**kwargs)
 
+    def load_manifest(self, file_path: Union[str, pathlib.Path],
+                      modules: Sequence[str] = None) -> Library:
+        """Adds keys and import paths in a json manifest file to 'manifest'.
+
+        If 'file_path' does not exist and 'modules' are passed, 'modules' are
+        imported (which registers their subclasses) and the manifest is saved 
+        to 'file_path' so that later runs do not need to import them eagerly.
+
+        Args:
+            file_path (Union[str, pathlib.Path]): path of a json file mapping
+                keys to import paths.
+            modules (Sequence[str]): names of modules to import to create the 
+                manifest if 'file_path' does not exist. Defaults to None.
+
+        """
+        file_path = pathlib.Path(file_path)
+        if file_path.exists():
+            with open(file_path, 'r', encoding = 'utf-8') as manifest_file:
+                self.manifest.update(json.load(manifest_file))
+        elif modules is not None:
+            for module in more_itertools.always_iterable(modules):
+                sourdough.tools.importify_file(module = module)
+            self.save_manifest(file_path = file_path)
+        return self
+
+    def prebuild(self, combinations: Iterable[Tuple[
+                     str, Union[str, Sequence[str]]]]) -> Library:
+        """Builds and caches classes before they are needed.
+
+        Args:
+            combinations (Iterable[Tuple[str, Union[str, Sequence[str]]]]): 
+                pairs of a key name of a stored class in 'contents' and the 
+                names of Quirk subclasses to add to it.
+
+        """
+        for name, quirks in combinations:
+            self.build(name = name, quirks = quirks)
+        return self
+
+    def save_manifest(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves keys and import paths of stored subclasses to a json file.
+
+        The saved file includes the current 'manifest' and every subclass in 
+        'contents' that can be imported by its module and qualified name. 
+
+        Args:
+            file_path (Union[str, pathlib.Path]): path of the json file to 
+                write.
+
+        """
+        manifest = dict(self.manifest)
+        for key, item in self.contents.items():
+            if '<locals>' not in item.__qualname__:
+                manifest[key] = f'{item.__module__}.{item.__qualname__}'
+        with open(file_path, 'w', encoding = 'utf-8') as manifest_file:
+            json.dump(manifest, manifest_file, indent = 4, sort_keys = True)
+        return self
+
+    """ Private Methods """
+
+    def _build(self, name: str, 
+               quirks: Union[str, Sequence[str]] = None) -> Type[Base]:
+        """Creates a new subclass matching 'name' with selected quirks.
+
+        Args:
+            name (str): key name of stored class in 'contents' to returned.
+            quirks (Union[str, Sequence[str]]): names of Quirk subclasses to
+                add to the custom built class. Defaults to None.
+
+        Returns:
+            Type: newly created dataclass.
+            
+        """
+        bases = []
+        if quirks is not None:
+            bases.extend(more_itertools.always_iterable(
+                Quirk.library.select(name = quirks)))
+        bases.append(self.select(name = name))
+        # Built classes are not registered so that they do not replace the 
+        # stored classes that they are derived from.
+        return dataclasses.dataclass(types.new_class(
+            name, tuple(bases), {'register': False}))
+
+    def _forget(self, names: Sequence[Any]) -> None:
+        """Removes cached built classes derived from the classes at 'names'.
+
+        Args:
+            names (Sequence[Any]): keys in 'contents' which were changed.
+            
+        """
+        builds = self._get_builds()
+        for key in list(builds):
+            stored = key[0] if isinstance(key[0], tuple) else (key[0],)
+            if any(name in stored for name in names):
+                builds.pop(key, None)
+        return
+
+    def _get_builds(self) -> Dict[Tuple[str, Tuple[str, ...]], Type[Base]]:
+        """Returns the cache of built classes for the active Scope.
+
+        Classes built from a Library that has been forked by the active Scope
+        are cached in the Scope so that they are not shared with other scopes.
+
+        Returns:
+            Dict[Tuple[str, Tuple[str, ...]], Type[Base]]: cache of built 
+                classes.
+            
+        """
+        scope = _active_scope.get()
+        if scope is None or id(self) not in scope.contents:
+            return self._builds
+        else:
+            return scope.builds.setdefault(
+                id(self), collections.OrderedDict())
+
+    def _import(self, key: str) -> Type[Base]:
+        """Imports the subclass listed at 'key' in 'manifest'.
+
+        Importing the subclass's module usually registers it. It is also 
+        stored in 'contents' directly in case it registers in another Library.
+
+        Args:
+            key (str): key of the subclass in 'manifest'.
+
+        Raises:
+            KeyError: if the subclass cannot be imported from its listed path.
+
+        Returns:
+            Type[Base]: the imported subclass.
+            
+        """
+        path = self.manifest[key]
+        module, _, name = path.rpartition('.')
+        try:
+            item = sourdough.tools.importify(module = module, key = name)
+        except ImportError:
+            raise KeyError(f'{key} could not be imported from {path}')
+        self[key] = item
+        return item
+
+    def _select_many(self, keys: Sequence[Union[str, Sequence[str]]]) -> List[
+                     Type[Base]]:
+        """Returns the stored subclass for each key in 'keys'.
+
+        Each key may also be a sequence of names, in which case the first 
+        stored subclass is returned, as in 'borrow'. Subclasses listed in 
+        'manifest' are imported.
+
+        Args:
+            keys (Sequence[Union[str, Sequence[str]]]): keys in 'contents' or
+                'manifest'.
+
+        Raises:
+            KeyError: if no subclass is stored for a key in 'keys'.
+
+        Returns:
+            List[Type[Base]]: stored subclasses in the same order as 'keys'.
+            
+        """
+        contents = self.contents
+        items = []
+        for key in keys:
+            for name in more_itertools.always_iterable(key):
+                if name in contents:
+                    item = contents[name]
+                    break
+                elif name in self.manifest:
+                    item = self._import(key = name)
+                    contents = self.contents
+                    break
+            else:
+                item = self.default
+                if item is None:
+                    raise KeyError(f'{key} is not in {self.__class__.__name__}')
+            items.append(item)
+        return items
+
+    """ Dunder Methods """
+
+    def __getitem__(self, key: Union[Any, Sequence[Any]]) -> Union[
+                    Any, Sequence[Any]]:
+        """Returns value(s) for 'key', importing listed subclasses first.
+
+        Args:
+            key (Union[Any, Sequence[Any]]): key(s) in 'contents' or 
+                'manifest'.
+
+        Returns:
+            Union[Any, Sequence[Any]]: value(s) stored in 'contents'.
+
+        """
+        if self.manifest:
+            if key in ['default', ['default'], 'defaults', ['defaults']]:
+                keys = self.defaults
+            else:
+                keys = key
+            if keys in ['all', ['all']]:
+                keys = list(self.manifest)
+            for item in more_itertools.always_iterable(keys):
+                if item not in self.contents and item in self.manifest:
+                    self._import(key = item)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: Union[Any, Sequence[Any]], 
+                    value: Union[Any, Sequence[Any]]) -> None:
+        """Replaces 'contents' with a copy in which 'key' is set to 'value'.
+
+        Args:
+            key (Union[Any, Sequence[Any]]): key(s) to set in 'contents'.
+            value (Union[Any, Sequence[Any]]): value(s) to be paired with 'key' 
+                in 'contents'.
+
+        """
+        if key in ['default', ['default'], 'defaults', ['defaults']]:
+            return super().__setitem__(key, value)
+        with self._lock:
+            contents = dict(self.contents)
+            try:
+                contents[key] = value
+                names = [key]
+            except TypeError:
+                contents.update(dict(zip(key, value)))
+                names = list(key)
+            self.contents = contents
+            self._forget(names = names)
+        return self
+
+    def __delitem__(self, key: Union[Any, Sequence[Any]]) -> None:
+        """Replaces 'contents' with a copy without 'key'.
+
+        Args:
+            key (Union[Any, Sequence[Any]]): name(s) of key(s) in 'contents' to
+                delete the key/value pair.
+
+        """
+        with self._lock:
+            super().__delitem__(key)
+            self._forget(names = list(more_itertools.always_iterable(key)))
+        return self
+
+
+# Replaces the 'contents' field default, which dataclasses removes from the
+# class, with a descriptor that resolves 'contents' in the active Scope.
+Library.contents = ScopedContents()
+
+
+@dataclasses.dataclass
+class ImportPath(object):
+    """Descriptor which imports an attribute's import path on first access.
+
+    ImportPath is a non-data descriptor. After an import path is imported, the
+    imported object is stored in the instance's '__dict__', which takes 
+    precedence over the descriptor. So, every later access is an ordinary 
+    attribute lookup.
+
+    Import paths assigned to instances are held in the '_import_paths' dict of
+    the instance until they are first accessed. Classes using ImportPath 
+    should call 'defer' in '__setattr__' and 'discard' in '__delattr__'. Only
+    attributes without a class-level value or whose class-level value is an 
+    import path are deferred, so methods and other class attributes are never
+    replaced.
+
+    Concurrent first accesses of an attribute from several threads all 
+    return the same imported object.
+
+    Args:
+        name (str): name of the attribute managed by the descriptor.
+        default (Any): class-level value of the attribute. If it is an import
+            path, it is replaced by the imported object when first accessed 
+            from an instance. Defaults to MISSING, which means the attribute
+            has no class-level value.
+            
+    """
+    name: str
+    default: Any = dataclasses.MISSING
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    """ Class Methods """
+
+    @classmethod
+    def defer(cls, instance: object, name: str, value: Any) -> bool:
+        """Stores 'value' to be imported when 'name' is first accessed.
+
+        Args:
+            instance (object): instance on which 'name' is being set.
+            name (str): name of the attribute being set.
+            value (Any): value being set.
+
+        Returns:
+            bool: whether 'value' is an import path that was deferred. If it is
+                False, the caller should store 'value' normally. Import paths 
+                are not deferred if the class of 'instance' has a value for 
+                'name' which is not an import path.
+            
+        """
+        cls.discard(instance = instance, name = name)
+        if cls.is_path(value):
+            owner = instance.__class__
+            current = inspect.getattr_static(owner, name, dataclasses.MISSING)
+            if not isinstance(current, cls):
+                if (current is not dataclasses.MISSING 
+                        and not cls.is_path(current)):
+                    return False
+                setattr(owner, name, cls(name = name, default = current))
+            instance.__dict__.pop(name, None)
+            instance.__dict__.setdefault('_import_paths', {})[name] = value
+            return True
+        else:
+            return False
+
+    @classmethod
+    def discard(cls, instance: object, name: str) -> bool:
+        """Removes a deferred import path for 'name' from 'instance'.
+
+        Args:
+            instance (object): instance which may have a deferred import path.
+            name (str): name of the attribute.
+
+        Returns:
+            bool: whether a deferred import path was removed.
+            
+        """
+        paths = instance.__dict__.get('_import_paths')
+        if paths and name in paths:
+            del paths[name]
+            return True
+        else:
+            return False
+
+    @classmethod
+    def install(cls, owner: Type) -> None:
+        """Replaces class attributes of 'owner' which are import paths.
+
+        Args:
+            owner (Type): class to scan for import paths.
+            
+        """
+        for name, value in list(vars(owner).items()):
+            if not name.startswith('__') and cls.is_path(value):
+                setattr(owner, name, cls(name = name, default = value))
+        return
+
+    @staticmethod
+    def is_path(value: Any) -> bool:
+        """Returns whether 'value' is an import path.
+
+        Args:
+            value (Any): item to check.
+
+        Returns:
+            bool: whether 'value' is a str with a '.' in it.
+            
+        """
+        return isinstance(value, str) and '.' in value
+
+    @classmethod
+    def preload(cls, instance: object, 
+                workers: int = None) -> Dict[str, Union[float, Exception]]:
+        """Imports modules of unresolved import paths of 'instance' at once.
+
+        Modules are imported concurrently in a thread pool. Failures are not
+        raised. Instead, the import error is raised again when the attribute 
+        is first accessed.
+
+        Args:
+            instance (object): instance with deferred import paths or 
+                ImportPath descriptors.
+            workers (int): maximum number of threads to use. Defaults to None,
+                which uses the concurrent.futures default.
+
+        Returns:
+            Dict[str, Union[float, Exception]]: keys are module names and 
+                values are the seconds taken to import them or the exception
+                raised when importing them failed.
+            
+        """
+        paths = list(instance.__dict__.get('_import_paths', {}).values())
+        for owner in instance.__class__.__mro__:
+            for name, item in vars(owner).items():
+                if (isinstance(item, cls) 
+                        and cls.is_path(item.default)
+                        and name not in instance.__dict__):
+                    paths.append(item.default)
+        modules = list(dict.fromkeys(p.rpartition('.')[0] for p in paths))
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers = workers) as pool:
+            return dict(zip(modules, pool.map(cls._preload_module, modules)))
+
+    """ Private Methods """
+
+    def _import(self, path: str) -> Any:
+        """Returns the object stored at 'path'.
+
+        Args:
+            path (str): import path of a class, function, or variable.
+
+        Returns:
+            Any: imported object.
+            
+        """
+        module, _, key = path.rpartition('.')
+        return sourdough.tools.importify(module = module, key = key)
+
+    @staticmethod
+    def _preload_module(module: str) -> Union[float, Exception]:
+        """Imports 'module' and returns how long it took or the exception.
+
+        Args:
+            module (str): name of module to import.
+
+        Returns:
+            Union[float, Exception]: seconds taken to import 'module' or the
+                exception raised when importing it failed.
+            
+        """
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module)
+        except Exception as error:
+            return error
+        return time.perf_counter() - start
+
+    """ Dunder Methods """
+
+    def __get__(self, instance: object, owner: Type = None) -> Any:
+        """Returns the imported object and stores it on 'instance'.
+
+        Args:
+            instance (object): instance on which the attribute was sought or
+                None if it was sought on the class.
+            owner (Type): class on which the attribute was sought. Defaults to
+                None.
+
+        Raises:
+            AttributeError: if there is no deferred import path or default.
+
+        Returns:
+            Any: the imported object or class-level value.
+            
+        """
+        if instance is None:
+            return self.default
+        # Importing happens outside of the lock, so that an import which 
+        # accesses other ImportPaths cannot deadlock.
+        with self._lock:
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+            paths = instance.__dict__.get('_import_paths', {})
+            path = paths.get(self.name)
+        if path is not None:
+            value = self._import(path = path)
+        elif self.default is dataclasses.MISSING:
+            raise AttributeError(
+                f'{owner.__name__} object has no attribute {self.name}')
+        else:
+            if self.is_path(self.default):
+                self.default = self._import(path = self.default)
+            value = self.default
+        with self._lock:
+            # Returns the value installed by another thread which won the race.
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+            if paths.get(self.name) is not path:
+                # The deferred path was changed while it was imported.
+                retry = True
+            else:
+                retry = False
+                paths.pop(self.name, None)
+                instance.__dict__[self.name] = value
+        return self.__get__(instance, owner) if retry else value
+
 
 @dataclasses.dataclass
 class Bases(types.SimpleNamespace):
@@ -163,7 +857,7 @@ class Bases(types.SimpleNamespace):
     
     Attribute values can either be classes or strings of the import path of 
     classes. In the latter case, the base classes will be lazily loaded when 
-    called.
+    called, after which they are accessed like any other attribute.
             
     """
 
@@ -194,27 +888,45 @@ class Bases(types.SimpleNamespace):
         module = path[:-len(item) - 1]
         return sourdough.tools.importify(module = module, key = item)
 
-    """ Dunder Methods """
-
-    def __getattribute__(self, name: str) -> Any:
-        """Converts stored import paths into the corresponding objects.
+    def preload(self, 
+                workers: int = None) -> Dict[str, Union[float, Exception]]:
+        """Imports modules of all unresolved import paths concurrently.
 
-        If an import path is stored, that attribute is permanently converted
-        from a str to the imported object or class.
-        
         Args:
-            name (str): name of attribute sought.
+            workers (int): maximum number of threads to use. Defaults to None,
+                which uses the concurrent.futures default.
 
         Returns:
-            Any: the stored value or, if the value is an import path, the
-                class or object stored at the designated import path.
+            Dict[str, Union[float, Exception]]: keys are module names and 
+                values are the seconds taken to import them or the exception
+                raised when importing them failed.
+            
+        """
+        return ImportPath.preload(instance = self, workers = workers)
+
+    """ Dunder Methods """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Stores import paths to be imported when they are first accessed.
+
+        Args:
+            name (str): name of attribute to set.
+            value (Any): value to store. If it is an import path, the object at
+                that path is imported the first time the attribute is accessed.
             
         """
-        value = super().__getattribute__(name)
-        if (isinstance(value, str) and '.' in value):
-            value = self.importify(path = value)
+        if not ImportPath.defer(instance = self, name = name, value = value):
             super().__setattr__(name, value)
-        return value
+
+    def __delattr__(self, name: str) -> None:
+        """Deletes attribute 'name' whether or not it has been imported.
+
+        Args:
+            name (str): name of attribute to delete.
+            
+        """
+        if not ImportPath.discard(instance = self, name = name):
+            super().__delattr__(name)
 
 
 @dataclasses.dataclass
@@ -222,7 +934,8 @@ class Base(abc.ABC):
     """Abstract base class for connecting a base class to a Library.
     
     Any subclass will automatically store itself in the class attribute 
-    'library' using the snakecase name of the class as the key.
+    'library' using the snakecase name of the class as the key, unless it is
+    created with the 'register = False' class keyword.
     
     Args:
         library (ClassVar[Library]): related Library instance that will store
@@ -235,7 +948,7 @@ class Base(abc.ABC):
     
     """ Initialization Methods """
     
-    def __init_subclass__(cls, **kwargs):
+    def __init_subclass__(cls, register: bool = True, **kwargs):
         """Adds 'cls' to 'library' if it is a concrete class."""
         super().__init_subclass__(**kwargs)
         # Creates a snakecase key of the class name.
@@ -245,7 +958,7 @@ class Base(abc.ABC):
             cls.bases.add(name = key, base = cls)
             # setattr(cls.bases, key, cls)
         # Adds concrete subclasses to 'library' using 'key'.
-        elif not abc.ABC in cls.__bases__:
+        elif register and not abc.ABC in cls.__bases__:
             cls.library[key] = cls
            
            
@@ -312,13 +1025,75 @@ class Element(Quirk):
 class Validator(Quirk):
     """Mixin for calling validation methods
 
+    The validation methods for 'validations' are looked up once per class, 
+    when the class is defined, and stored as a plan of (attribute, method 
+    name, function) tuples. Plans for other sequences of validations are 
+    compiled and cached the first time they are used. A validation method 
+    stored on an instance is called instead of the planned one.
+
     Args:
         validations (List[str]): a list of attributes that need validating.
             Each item in 'validations' should also have a corresponding
-            method named f'_validate_{item}'. Defaults to an empty list. 
+            method named f'_validate_{item}', which is passed the value of the
+            attribute as a keyword argument named after the attribute. 
+            Defaults to an empty list. 
                
     """
     validations: ClassVar[Sequence[str]] = []
+    _validation_plans: ClassVar[Dict[Tuple[str, ...], Tuple[Any, ...]]] = {}
+
+    """ Initialization Methods """
+    
+    def __init_subclass__(cls, **kwargs):
+        """Compiles a validation plan for 'validations' of 'cls'."""
+        super().__init_subclass__(**kwargs)
+        cls._validation_plans = {}
+        cls._compile_validations(validations = cls.validations)
+
+    """ Class Methods """
+
+    @classmethod
+    def _compile_validations(cls, validations: Sequence[str]) -> Tuple[
+            Tuple[str, str, Callable[..., Any]], ...]:
+        """Returns and caches validation functions for 'validations'.
+
+        Args:
+            validations (Sequence[str]): attributes that need validating.
+
+        Returns:
+            Tuple[Tuple[str, str, Callable[..., Any]], ...]: the attribute 
+                name, the name of its validation method, and a function which
+                is called with the instance and the attribute value as a 
+                keyword argument and returns the validated value.
+            
+        """
+        plan = []
+        for item in validations:
+            name = f'_validate_{item}'
+            method = inspect.getattr_static(cls, name, None)
+            if isinstance(method, types.FunctionType):
+                validator = method
+            elif method is not None:
+                validator = cls._call_validator(name = name)
+            else:
+                validator = cls._call_generic_validator(item = item)
+            plan.append((item, name, validator))
+        cls._validation_plans[tuple(validations)] = tuple(plan)
+        return tuple(plan)
+
+    @staticmethod
+    def _call_generic_validator(item: str) -> Callable[..., Any]:
+        """Returns a function which calls '_validate_generic' for 'item'."""
+        def call(self, **kwargs: Any) -> Any:
+            return self._validate_generic(value = kwargs[item], name = item)
+        return call
+
+    @staticmethod
+    def _call_validator(name: str) -> Callable[..., Any]:
+        """Returns a function which calls a non-function validation method."""
+        def call(self, **kwargs: Any) -> Any:
+            return getattr(self, name)(**kwargs)
+        return call
 
     """ Public Methods """
 
@@ -334,14 +1109,19 @@ class Validator(Quirk):
         """
         if validations is None:
             validations = self.validations
+        try:
+            plan = self._validation_plans[tuple(validations)]
+        except KeyError:
+            plan = self._compile_validations(validations = validations)
+        attributes = self.__dict__
         # Calls validation methods based on items listed in 'validations'.
-        for item in validations:
-            if hasattr(self, f'_validate_{item}'):
-                kwargs = {item: getattr(self, item)}
-                validated = getattr(self, f'_validate_{item}')(**kwargs)
+        for item, name, validator in plan:
+            kwargs = {item: getattr(self, item)}
+            if name in attributes:
+                # Uses a validation method stored on the instance.
+                validated = attributes[name](**kwargs)
             else:
-                value = getattr(self, item)
-                validated = self._validate_generic(value = value, name = item)
+                validated = validator(self, **kwargs)
             setattr(self, item, validated)
         return self     
 
@@ -387,10 +1167,12 @@ class Registrar(Quirk):
     Namespaces: 'registry', 'register', 'acquire'
 
     Args:
-        registry (ClassVar[Mapping[str, Type]]):
+        registry (ClassVar[Mapping[str, Type]]): stores registered subclasses.
+            Defaults to a Library, which is safe to read while other threads
+            register subclasses.
     
     """
-    registry: ClassVar[Mapping[str, Type]] = sourdough.Catalog()
+    registry: ClassVar[Mapping[str, Type]] = Library()
 
     """ Initialization Methods """
     
@@ -438,8 +1220,45 @@ class Librarian(Quirk):
     
     To use this quirk, the '__post_init__' method must be called.
     
+    Stored instances are templates which are cloned by 'borrow'. Any stored 
+    object may define a '__sourdough_clone__' method which takes no arguments
+    and returns a clone. Objects without one are deep copied. The Librarian
+    implementation shares attributes listed in 'shared', wraps mutable 
+    containers listed in 'copy_on_write', and deep copies everything else. 
+    Templates should not be changed in place after they are borrowed because
+    their shared attributes and containers are visible to clones.
+    
+    Args:
+        store (ClassVar[Mapping[str, object]]): stored template instances. 
+            Subclasses may use a WeakCatalog so that stored instances are not
+            kept alive indefinitely.
+        shared (ClassVar[Sequence[str]]): names of attributes which clones
+            share with the template. Defaults to an empty list.
+        copy_on_write (ClassVar[Sequence[str]]): names of dict or list 
+            attributes which clones share with the template until the clone
+            changes them. Defaults to an empty list.
+        pool_size (ClassVar[int]): number of clones of each borrowed template
+            to prepare in a background thread. Defaults to 0, which means 
+            clones are only made when 'borrow' is called. Pools only hold 
+            weak references to templates and are evicted when their template
+            is garbage collected. A pooled clone is only returned if it still
+            compares equal to its template, so a template which is changed 
+            after its clones were prepared does not return stale clones. 
+            Pooling should only be used for templates whose clones compare 
+            equal to them, such as dataclasses with fields that compare by 
+            value.
+    
     """
     store: ClassVar[Mapping[str, object]] = sourdough.Catalog()
+    shared: ClassVar[Sequence[str]] = []
+    copy_on_write: ClassVar[Sequence[str]] = []
+    pool_size: ClassVar[int] = 0
+    _pools: ClassVar[Dict[Tuple[Type, str], collections.deque]] = {}
+    _filling: ClassVar[Set[Tuple[Type, str]]] = set()
+    # Reentrant because '_evict' may run during garbage collection while the
+    # lock is held by the same thread.
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+    _pooler: ClassVar[concurrent.futures.ThreadPoolExecutor] = None
 
     """ Initialization Methods """
 
@@ -483,11 +1302,157 @@ class Librarian(Quirk):
             key (str): name of stored subclass instance to be returned, as 
                 defined by the 'deposit' method.
 
+        If 'pool_size' is greater than 0, a clone is taken from a pool of 
+        prepared clones which is refilled in a background thread. If the 
+        template no longer equals the prepared clones, they are discarded.
+
         Returns:
             object: stored subclass isntance.
             
         """
-        return copy.deepcopy(cls.store.select(key))
+        template = cls.store.select(key)
+        if cls.pool_size > 0:
+            pool = cls._pools.get((cls, key), collections.deque())
+            item = None
+            while item is None:
+                try:
+                    source, clone = pool.popleft()
+                except IndexError:
+                    break
+                if source() is template and clone == template:
+                    item = clone
+            cls._refill(key = key, template = template)
+            if item is not None:
+                return item
+        return cls._clone(item = template)
+
+    """ Private Methods """
+
+    @staticmethod
+    def _clone(item: object) -> object:
+        """Returns a clone of 'item' using its '__sourdough_clone__' method.
+
+        Args:
+            item (object): object to clone.
+
+        Returns:
+            object: a clone or, if 'item' has no '__sourdough_clone__' method, 
+                a deep copy of 'item'.
+            
+        """
+        if getattr(type(item), '__sourdough_clone__', None) is None:
+            return copy.deepcopy(item)
+        return item.__sourdough_clone__()
+
+    @classmethod
+    def _evict(cls, key: str, reference: weakref.ref) -> None:
+        """Removes clones of a garbage collected template from '_pools'.
+        
+        Args:
+            key (str): key of the template in 'store'.
+            reference (weakref.ref): dead weak reference to the template.
+            
+        """
+        with cls._lock:
+            pool = cls._pools.get((cls, key))
+            if pool is not None:
+                # Filters in place, so that each clone is still popped once 
+                # if 'borrow' pops from the pool at the same time.
+                for _ in range(len(pool)):
+                    try:
+                        item = pool.popleft()
+                    except IndexError:
+                        break
+                    if item[0]() is not None:
+                        pool.append(item)
+                if not pool:
+                    del cls._pools[(cls, key)]
+        return
+
+    @classmethod
+    def _fill(cls, key: str, template: object) -> None:
+        """Adds clones of 'template' to the pool at 'key' up to 'pool_size'.
+        
+        Args:
+            key (str): key of 'template' in 'store'.
+            template (object): stored instance to clone.
+            
+        """
+        try:
+            try:
+                source = weakref.ref(
+                    template, functools.partial(cls._evict, key))
+            except TypeError:
+                # Templates which do not support weak references are kept.
+                source = lambda: template
+            while True:
+                with cls._lock:
+                    pool = cls._pools.setdefault(
+                        (cls, key), collections.deque())
+                    if len(pool) >= cls.pool_size:
+                        break
+                clone = cls._clone(item = template)
+                with cls._lock:
+                    # Looks up the pool again in case it was evicted.
+                    cls._pools.setdefault(
+                        (cls, key), collections.deque()).append(
+                            (source, clone))
+        finally:
+            with cls._lock:
+                cls._filling.discard((cls, key))
+        return
+
+    @classmethod
+    def _refill(cls, key: str, template: object) -> None:
+        """Refills the pool at 'key' in a background thread.
+        
+        Args:
+            key (str): key of 'template' in 'store'.
+            template (object): stored instance to clone.
+            
+        """
+        with cls._lock:
+            if (cls, key) in cls._filling:
+                return
+            cls._filling.add((cls, key))
+            if Librarian._pooler is None:
+                Librarian._pooler = concurrent.futures.ThreadPoolExecutor(
+                    max_workers = 1)
+        Librarian._pooler.submit(cls._fill, key, template)
+        return
+
+    """ Dunder Methods """
+
+    def __sourdough_clone__(self) -> Librarian:
+        """Returns a clone which shares attributes listed in 'shared'.
+
+        Attributes listed in 'copy_on_write' are wrapped so that they are
+        copied only when the clone changes them. All other attributes are deep
+        copied.
+
+        Returns:
+            Librarian: clone of this instance.
+            
+        """
+        clone = copy.copy(self)
+        memo = {id(self): clone}
+        for name, value in vars(self).items():
+            if name in self.shared:
+                pass
+            elif name in self.copy_on_write and isinstance(
+                    value, (collections.abc.MutableMapping, 
+                            collections.abc.MutableSequence)):
+                if isinstance(value, (sourdough.CopyOnWriteDict, 
+                                      sourdough.CopyOnWriteList)):
+                    value = value.contents
+                if isinstance(value, collections.abc.MutableMapping):
+                    value = sourdough.CopyOnWriteDict(contents = value)
+                else:
+                    value = sourdough.CopyOnWriteList(contents = value)
+            else:
+                value = copy.deepcopy(value, memo)
+            clone.__dict__[name] = value
+        return clone
 
 
 @dataclasses.dataclass
@@ -500,12 +1465,22 @@ class Loader(Quirk):
 
     The 'load' method also allows this process to be performed manually.
 
-    Subclasses should not have custom '__getattribute__' methods or properties
-    to avoid errors.
+    Import paths are managed by ImportPath descriptors, so attributes cost the
+    same as ordinary attributes once they have been imported. Subclasses 
+    should call the Loader '__setattr__' and '__delattr__' methods if they 
+    override them.
 
-    Namespaces: 'load', '__getattribute__'
+    Namespaces: 'load', 'preload', '_import_paths', '__setattr__', 
+        '__delattr__'
     
     """
+    
+    """ Initialization Methods """
+    
+    def __init_subclass__(cls, **kwargs):
+        """Replaces import paths stored as class attributes with ImportPaths."""
+        super().__init_subclass__(**kwargs)
+        ImportPath.install(owner = cls)
  
     """ Public Methods """
 
@@ -529,27 +1504,45 @@ class Loader(Quirk):
         else:
             return imported
 
-    """ Dunder Methods """
-
-    def __getattribute__(self, name: str) -> Any:
-        """Converts stored import paths into the corresponding objects.
+    def preload(self, 
+                workers: int = None) -> Dict[str, Union[float, Exception]]:
+        """Imports modules of all unresolved import paths concurrently.
 
-        If an import path is stored, that attribute is permanently converted
-        from a str to the imported object or class.
-        
         Args:
-            name (str): name of attribute sought.
+            workers (int): maximum number of threads to use. Defaults to None,
+                which uses the concurrent.futures default.
 
         Returns:
-            Any: the stored value or, if the value is an import path, the
-                class or object stored at the designated import path.
+            Dict[str, Union[float, Exception]]: keys are module names and 
+                values are the seconds taken to import them or the exception
+                raised when importing them failed.
             
         """
-        value = super().__getattribute__(name)
-        if (isinstance(value, str) and '.' in value):
-            value = self.load(path = value)
+        return ImportPath.preload(instance = self, workers = workers)
+
+    """ Dunder Methods """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Stores import paths to be imported when they are first accessed.
+
+        Args:
+            name (str): name of attribute to set.
+            value (Any): value to store. If it is an import path, the object at
+                that path is imported the first time the attribute is accessed.
+            
+        """
+        if not ImportPath.defer(instance = self, name = name, value = value):
             super().__setattr__(name, value)
-        return value
+
+    def __delattr__(self, name: str) -> None:
+        """Deletes attribute 'name' whether or not it has been imported.
+
+        Args:
+            name (str): name of attribute to delete.
+            
+        """
+        if not ImportPath.discard(instance = self, name = name):
+            super().__delattr__(name)
 
   
 # @dataclasses.dataclass
@@ -15,15 +15,37 @@ Contents:
 """
 from __future__ import annotations
 import abc
+import array
+import collections
 import copy
+import csv
 import dataclasses
+import hashlib
 import itertools
+import json
 import more_itertools
+import pathlib
+import struct
+import sys
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
                     Optional, Sequence, Tuple, Type, Union)
 
 import sourdough
 
+# Tries to import numpy so that saved Graphs can be memory-mapped. numpy is not 
+# a required dependency and is only used for optional support.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Layout of the header of a saved Graph: magic bytes, format version, number
+# of nodes, number of edges, and size of the name table in bytes.
+GRAPH_HEADER = struct.Struct('<8sIIII')
+GRAPH_MAGIC = b'SDGRAPH\x00'
+GRAPH_VERSION = 1
+
 
 @dataclasses.dataclass
 class Structure(sourdough.Bunch, abc.ABC):
@@ -248,6 +270,12 @@ class Graph(sourdough.Lexicon, Structure):
     string names of nodes which can then be used to create and iterate over
     nodes (as is done by Workflow in the project subpackage).
     
+    Every change made through Graph methods increments a private mutation
+    version. Values derived from the structure of a Graph (such as the value
+    returned by 'fingerprint') are cached under that version and recomputed
+    only after the Graph has changed. Changes made directly to 'contents' are 
+    not tracked.
+    
     Args:
         contents (Dict[str, List[str]]): an adjacency list where the keys are 
             the names of nodes and the values are names of nodes which the key 
@@ -258,6 +286,10 @@ class Graph(sourdough.Lexicon, Structure):
     """  
     contents: Dict[str, List[str]] = dataclasses.field(default_factory = dict)
     default: Any = dataclasses.field(default_factory = list)
+    _version: int = dataclasses.field(
+        default = 0, init = False, repr = False, compare = False)
+    _cached: Dict[str, Tuple[int, Any]] = dataclasses.field(
+        default_factory = dict, init = False, repr = False, compare = False)
 
     """ Properties """
            
@@ -362,6 +394,40 @@ class Graph(sourdough.Lexicon, Structure):
             
         """
         return cls(contents = adjacency)
+
+    @classmethod
+    def from_edge_stream(cls, 
+            edges: Iterable[Sequence[str]], 
+            buffer_size: int = 10000) -> Graph:
+        """Creates a Graph instance by incrementally consuming 'edges'.
+        
+        'edges' may be any iterable, including generators and open file 
+        readers. It is consumed 'buffer_size' edges at a time, so no more than
+        that many raw edges are held in memory beyond the adjacency list that 
+        is being built.
+        
+        An edge whose stop is missing or None (such as the final item yielded by
+        'more_itertools.windowed') adds its start as a node without an edge.
+
+        Args:
+            edges (Iterable[Sequence[str]]): pairs of node names, each of which
+                indicates an edge from the first to the second node.
+            buffer_size (int): maximum number of edges read from 'edges' at a 
+                time. Defaults to 10000.
+            
+        """
+        contents = {}
+        for chunk in more_itertools.chunked(edges, buffer_size):
+            for edge_pair in chunk:
+                start = edge_pair[0]
+                stop = edge_pair[1] if len(edge_pair) > 1 else None
+                if start not in contents:
+                    contents[start] = []
+                if stop is not None:
+                    contents[start].append(stop)
+                    if stop not in contents:
+                        contents[stop] = []
+        return cls(contents = contents)
     
     @classmethod
     def from_edges(cls, edges: List[Tuple[str]]) -> Graph:
@@ -371,15 +437,7 @@ class Graph(sourdough.Lexicon, Structure):
             edges (List[Tuple[str]]): Edge list used to create a Graph instance.
             
         """
-        contents = {}
-        for edge_pair in edges:
-            if edge_pair[0] not in contents:
-                contents[edge_pair[0]] = [edge_pair[1]]
-            else:
-                contents[edge_pair[0]].append(edge_pair[1])
-            if edge_pair[1] not in contents:
-                contents[edge_pair[1]] = []
-        return cls(contents = contents)
+        return cls.from_edge_stream(edges = edges)
     
     @classmethod
     def from_matrix(cls, matrix: List[List[int]], names: List[str]) -> Graph:
@@ -405,6 +463,94 @@ class Graph(sourdough.Lexicon, Structure):
                 new_values.append(name_mapping[edge])
             contents[new_key] = new_values
         return cls(contents = contents)
+
+    @classmethod
+    def load_edges(cls, 
+            file_path: Union[str, pathlib.Path], 
+            file_format: str = None,
+            header: bool = False,
+            buffer_size: int = 10000) -> Graph:
+        """Creates a Graph instance from an edge list stored in a file.
+        
+        The file is read one line at a time and passed to 'from_edge_stream', 
+        so it is never loaded into memory all at once.
+        
+        In 'csv' and 'tsv' files, each row should contain the start and stop 
+        nodes of an edge in its first two columns. In 'jsonl' files, each line
+        should be a list of the start and stop nodes or a dict with 'start' and
+        'stop' keys. A row or line with only one node adds that node without 
+        an edge.
+
+        Args:
+            file_path (Union[str, pathlib.Path]): path to the edge list file.
+            file_format (str): 'csv', 'tsv', or 'jsonl'. If None, it is inferred
+                from the extension of 'file_path'. Defaults to None.
+            header (bool): whether the first row of a 'csv' or 'tsv' file is a
+                header which should be skipped. Defaults to False.
+            buffer_size (int): maximum number of edges read from the file at a 
+                time. Defaults to 10000.
+
+        Raises:
+            ValueError: if 'file_format' is not a supported format.
+            
+        """
+        file_path = pathlib.Path(file_path)
+        file_format = file_format or file_path.suffix[1:]
+        if file_format not in ['csv', 'tsv', 'jsonl']:
+            raise ValueError(
+                f'{file_format} is not a supported edge list file format')
+        with open(file_path, newline = '', encoding = 'utf-8') as edge_file:
+            return cls.from_edge_stream(
+                edges = cls._read_edges(
+                    edge_file = edge_file, 
+                    file_format = file_format,
+                    header = header),
+                buffer_size = buffer_size)
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path]) -> Graph:
+        """Creates a Graph instance from a file written by 'save'.
+        
+        If numpy is installed, the offset and target arrays are memory-mapped
+        with 'numpy.memmap' rather than read and copied. Otherwise, they are
+        read with the standard library 'array' module.
+
+        Args:
+            file_path (Union[str, pathlib.Path]): path to a saved Graph.
+
+        Raises:
+            ValueError: if 'file_path' is not a Graph saved by 'save'.
+            
+        """
+        file_path = pathlib.Path(file_path)
+        with open(file_path, 'rb') as graph_file:
+            magic, version, node_count, edge_count, names_size = (
+                GRAPH_HEADER.unpack(graph_file.read(GRAPH_HEADER.size)))
+            if magic != GRAPH_MAGIC or version != GRAPH_VERSION:
+                raise ValueError(f'{file_path} is not a saved Graph')
+            array_count = node_count + 1 + edge_count
+            if np is None:
+                indices = array.array('i')
+                indices.frombytes(graph_file.read(array_count * 4))
+                if sys.byteorder == 'big':
+                    indices.byteswap()
+            else:
+                graph_file.seek(GRAPH_HEADER.size + array_count * 4)
+            names = graph_file.read(names_size).decode('utf-8')
+        if np is not None:
+            indices = np.memmap(
+                file_path, 
+                dtype = '<i4', 
+                mode = 'r', 
+                offset = GRAPH_HEADER.size, 
+                shape = (array_count,))
+        names = names.split('\x00') if node_count else []
+        offsets = indices[:node_count + 1].tolist()
+        stops = [names[t] for t in indices[node_count + 1:].tolist()]
+        contents = {
+            name: stops[start:stop] 
+            for name, start, stop in zip(names, offsets, offsets[1:])}
+        return cls(contents = contents)
     
     """ Public Methods """
     
@@ -449,6 +595,7 @@ class Graph(sourdough.Lexicon, Structure):
                 self.add_node(node = start)
             if stop not in self.contents[start]:
                 self.contents[start].append(stop)
+                self._modify()
         return self
 
     def add_node(self, node: str) -> None:
@@ -465,6 +612,7 @@ class Graph(sourdough.Lexicon, Structure):
             raise ValueError(f'{node} already exists in the graph')
         else:
             self.contents[node] = []
+            self._modify()
         return self
 
     def append(self, 
@@ -537,10 +685,33 @@ class Graph(sourdough.Lexicon, Structure):
                         self.add_edge(start = endpoint, stop = root)
             else:
                 self.contents = graph.contents
+            self._modify()
         else:
             raise TypeError('graph must be a Graph type to combine')
         return self
 
+    def components(self) -> List[List[str]]:
+        """Returns the weakly connected components of the Graph.
+        
+        Two nodes are in the same component if they are connected by a path 
+        when the direction of edges is ignored. Components are found with a 
+        union-find (disjoint set) structure in near-linear time and are cached
+        until the Graph is next modified.
+        
+        Because no edge crosses between components, each one can be executed
+        independently (for example, in a separate worker process).
+
+        Returns:
+            List[List[str]]: names of nodes in each component. Components and
+                the nodes within them are listed in the order that they first
+                appear in 'contents'.
+            
+        """
+        return [
+            list(component) for component in self._get_cached(
+                key = 'components', 
+                process = self._find_components)]
+
     def delete_edge(self, start: str, stop: str) -> None:
         """Deletes edge from graph.
 
@@ -559,6 +730,7 @@ class Graph(sourdough.Lexicon, Structure):
             raise KeyError(f'{start} does not exist in the graph')
         except ValueError:
             raise ValueError(f'{stop} is not connected to {start}')
+        self._modify()
         return self
        
     def delete_node(self, node: str) -> None:
@@ -577,6 +749,7 @@ class Graph(sourdough.Lexicon, Structure):
             raise KeyError(f'{node} does not exist in the graph')
         self.contents = {
             k: v.remove(node) for k, v in self.contents.items() if node in v}
+        self._modify()
         return self
        
     def excludify(self, subset: Union[Any, Sequence[Any]], **kwargs) -> Graph:
@@ -621,6 +794,81 @@ class Graph(sourdough.Lexicon, Structure):
         for edge_pair in edges:
             self.add_edge(start = edge_pair[0], stop = edge_pair[1])
         return self  
+
+    def fingerprint(self) -> str:
+        """Returns a canonical digest of the structure of the Graph.
+        
+        The digest is a BLAKE2 hash of the sorted node names and sorted edges.
+        So, it does not depend upon the order in which nodes and edges were
+        added and is the same across processes and python hash seeds. This 
+        makes it suitable as a key for caching anything derived from a Graph.
+        
+        The digest is cached until the Graph is next modified.
+
+        Returns:
+            str: hexadecimal digest of the nodes and edges in the Graph.
+            
+        """
+        return self._get_cached(key = 'fingerprint', process = self._digest)
+           
+    def partition(self) -> Iterable[Graph]:
+        """Yields an independent Graph for each weakly connected component.
+        
+        Each yielded Graph has its own 'contents' and shares no state with 
+        this Graph or the other partitions.
+
+        Yields:
+            Graph: subgraph containing the nodes and edges of one component.
+            
+        """
+        for component in self.components():
+            yield self.__class__(contents = {
+                node: list(self.contents.get(node, [])) 
+                for node in component})
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Writes the Graph to disk in a compact binary layout.
+        
+        The file contains a fixed-size header, int32 compressed sparse row 
+        (CSR) offset and target arrays, and an interned table of node names. 
+        The arrays can be memory-mapped with 'numpy.memmap' so that worker 
+        processes can open a saved Graph without rebuilding it from settings.
+        
+        Node names are stored as str. Nodes which only appear as the stop of an
+        edge are added to the name table.
+
+        Args:
+            file_path (Union[str, pathlib.Path]): path of the file to write.
+            
+        """
+        names = list(self.contents.keys())
+        indices = dict(zip(names, range(len(names))))
+        offsets = array.array('i', [0])
+        targets = array.array('i')
+        for name in list(names):
+            for stop in self.contents[name]:
+                if stop not in indices:
+                    indices[stop] = len(names)
+                    names.append(stop)
+                targets.append(indices[stop])
+            offsets.append(len(targets))
+        # Nodes which are only stops of edges have no edges of their own.
+        offsets.extend([len(targets)] * (len(names) + 1 - len(offsets)))
+        table = '\x00'.join(str(name) for name in names).encode('utf-8')
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+            targets.byteswap()
+        with open(pathlib.Path(file_path), 'wb') as graph_file:
+            graph_file.write(GRAPH_HEADER.pack(
+                GRAPH_MAGIC, 
+                GRAPH_VERSION, 
+                len(names), 
+                len(targets), 
+                len(table)))
+            graph_file.write(offsets.tobytes())
+            graph_file.write(targets.tobytes())
+            graph_file.write(table)
+        return self
            
     def search(self, start: str = None, depth_first: bool = True) -> List[str]:
         """Returns a path through the stored data structure.
@@ -659,8 +907,195 @@ class Graph(sourdough.Lexicon, Structure):
         excludables = [i for i in self.contents if i not in subset]
         return self.excludify(subset = excludables, **kwargs)
 
+    def transitive_reduction(self) -> Graph:
+        """Returns a new instance with all redundant edges removed.
+        
+        An edge is redundant if its stop can also be reached from its start
+        through another path. The returned Graph has the same nodes and the 
+        same reachability as this Graph with the fewest possible edges.
+        
+        Reachability is stored as an integer bitset for each node and nodes are
+        visited in reverse topological order, so the reduction takes O(V * E)
+        bit operations in the worst case.
+
+        Raises:
+            ValueError: if the Graph has a cycle.
+
+        Returns:
+            Graph: the minimal equivalent DAG.
+            
+        """
+        order = self._sort_topologically()
+        positions = {node: index for index, node in enumerate(order)}
+        reachable = {}
+        reduced = {}
+        for node in reversed(order):
+            stops = list(dict.fromkeys(self.contents.get(node, [])))
+            covered = 0
+            kept = set()
+            # Visiting stops in topological order means that a stop reachable
+            # through a sibling is always covered before it is visited.
+            for stop in sorted(stops, key = positions.__getitem__):
+                bit = 1 << positions[stop]
+                if not covered & bit:
+                    kept.add(stop)
+                covered |= bit | reachable[stop]
+            reachable[node] = covered
+            reduced[node] = [stop for stop in stops if stop in kept]
+        nodes = dict.fromkeys(itertools.chain(self.contents, order))
+        return self.__class__(
+            contents = {node: reduced[node] for node in nodes})
+
     """ Private Methods """
 
+    @staticmethod
+    def _read_edges(edge_file: Iterable[str], file_format: str, 
+                    header: bool) -> Iterable[Sequence[str]]:
+        """Yields edges, one at a time, from an open edge list file.
+
+        Args:
+            edge_file (Iterable[str]): open edge list file.
+            file_format (str): 'csv', 'tsv', or 'jsonl'.
+            header (bool): whether to skip the first row of a 'csv' or 'tsv'
+                file.
+
+        Yields:
+            Sequence[str]: start and stop node of each edge.
+            
+        """
+        if file_format in ['jsonl']:
+            for line in edge_file:
+                if line.strip():
+                    edge = json.loads(line)
+                    if isinstance(edge, Mapping):
+                        edge = (edge['start'], edge.get('stop'))
+                    yield edge
+        else:
+            delimiter = '\t' if file_format in ['tsv'] else ','
+            rows = csv.reader(edge_file, delimiter = delimiter)
+            if header:
+                next(rows, None)
+            for row in rows:
+                if row and row[0]:
+                    yield row[:2] if len(row) > 1 and row[1] else row[:1]
+
+    def _modify(self) -> None:
+        """Increments the mutation version of the Graph."""
+        self._version += 1
+        return self
+
+    def _get_cached(self, key: str, process: Callable[[], Any]) -> Any:
+        """Returns value cached at 'key' or calls 'process' if it is stale.
+
+        Args:
+            key (str): name of the cached value.
+            process (Callable[[], Any]): callable which computes the value from
+                the current 'contents'.
+
+        Returns:
+            Any: value computed for the current mutation version.
+            
+        """
+        version, value = self._cached.get(key, (None, None))
+        if version != self._version:
+            value = process()
+            self._cached[key] = (self._version, value)
+        return value
+
+    def _digest(self) -> str:
+        """Returns a BLAKE2 digest of the sorted nodes and edges.
+
+        Each name is prefixed by its length so that no combination of node
+        names can produce the same stream of bytes as another.
+        
+        Returns:
+            str: hexadecimal digest of the nodes and edges in the Graph.
+            
+        """
+        def encode(name: Any) -> bytes:
+            data = str(name).encode('utf-8')
+            return len(data).to_bytes(4, 'big') + data
+        
+        nodes = sorted(str(node) for node in self.contents)
+        edges = sorted(set(
+            (str(start), str(stop)) 
+            for start, stops in self.contents.items() for stop in stops))
+        digest = hashlib.blake2b(digest_size = 16)
+        digest.update(len(nodes).to_bytes(8, 'big'))
+        for node in nodes:
+            digest.update(encode(node))
+        digest.update(len(edges).to_bytes(8, 'big'))
+        for start, stop in edges:
+            digest.update(encode(start) + encode(stop))
+        return digest.hexdigest()
+
+    def _find_components(self) -> Tuple[Tuple[str, ...], ...]:
+        """Returns weakly connected components using union-find.
+
+        Returns:
+            Tuple[Tuple[str, ...], ...]: names of nodes in each component.
+            
+        """
+        indices = {}
+        for node, stops in self.contents.items():
+            indices.setdefault(node, len(indices))
+            for stop in stops:
+                indices.setdefault(stop, len(indices))
+        parents = list(range(len(indices)))
+        sizes = [1] * len(indices)
+        
+        def find(index: int) -> int:
+            while parents[index] != index:
+                # Path halving keeps the trees shallow.
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+        
+        for node, stops in self.contents.items():
+            for stop in stops:
+                first, second = find(indices[node]), find(indices[stop])
+                if first != second:
+                    if sizes[first] < sizes[second]:
+                        first, second = second, first
+                    parents[second] = first
+                    sizes[first] += sizes[second]
+        components = {}
+        for node, index in indices.items():
+            components.setdefault(find(index), []).append(node)
+        return tuple(tuple(nodes) for nodes in components.values())
+
+    def _sort_topologically(self) -> List[str]:
+        """Returns nodes in topological order using Kahn's algorithm.
+        
+        Raises:
+            ValueError: if the Graph has a cycle.
+
+        Returns:
+            List[str]: every node, listed after all nodes with edges to it.
+            
+        """
+        def process() -> Tuple[str, ...]:
+            indegrees = {}
+            for node, stops in self.contents.items():
+                indegrees.setdefault(node, 0)
+                for stop in dict.fromkeys(stops):
+                    indegrees[stop] = indegrees.get(stop, 0) + 1
+            queue = collections.deque(
+                node for node, degree in indegrees.items() if degree == 0)
+            order = []
+            while queue:
+                node = queue.popleft()
+                order.append(node)
+                for stop in dict.fromkeys(self.contents.get(node, [])):
+                    indegrees[stop] -= 1
+                    if indegrees[stop] == 0:
+                        queue.append(stop)
+            if len(order) < len(indegrees):
+                raise ValueError('Graph is not acyclic - it has a cycle')
+            return tuple(order)
+        
+        return list(self._get_cached(key = 'order', process = process))
+
     def _breadth_first_search(self, node: str) -> List[str]:
         """Returns a breadth first search path through the Graph.
 
@@ -760,6 +1195,29 @@ class Graph(sourdough.Lexicon, Structure):
         return all_permutations
 
     """ Dunder Methods """
+
+    def __setitem__(self, key: str, value: List[str]) -> None:
+        """Sets 'key' in 'contents' to 'value'.
+
+        Args:
+            key (str): name of node to set in 'contents'.
+            value (List[str]): names of nodes that 'key' is connected to.
+
+        """
+        self.contents[key] = value
+        self._modify()
+        return self
+
+    def __delitem__(self, key: str) -> None:
+        """Deletes 'key' in 'contents'.
+
+        Args:
+            key (str): name of node in 'contents' to delete.
+
+        """
+        del self.contents[key]
+        self._modify()
+        return self
     
     def __missing__(self, key: str) -> List:
         """Returns an empty list when a missing 'key' is sought.
@@ -32,13 +32,22 @@ Contents:
     Catalog (Lexicon): wildcard-accepting dict which is primarily intended for 
         storing different options and strategies. It also returns lists of 
         matches if a list of keys is provided.
+    WeakCatalog (Catalog): Catalog which holds weak references to its values
+        and keeps recently used values alive according to retention limits.
+    CopyOnWriteDict (MutableMapping): dict wrapper which shares its contents
+        until it is first changed.
+    CopyOnWriteList (MutableSequence): list wrapper which shares its contents
+        until it is first changed.
 
 """
 from __future__ import annotations
 import abc
 import collections.abc
+import concurrent.futures
 import dataclasses
 import more_itertools
+import time
+import weakref
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
                     Optional, Sequence, Tuple, Type, Union)
 
@@ -908,6 +917,60 @@ class Catalog(Lexicon):
         else:
             instances = items(**kwargs)
         return instances
+
+    def instance_many(self, specs: Iterable[Tuple[Any, Mapping[str, Any]]], 
+                      workers: int = None) -> List[Any]:
+        """Returns instances of stored classes for each item in 'specs'.
+        
+        All classes are looked up in one pass over a single snapshot of 
+        'contents'. Specs with the same class and the same argument names are
+        grouped, and each group is instanced together. If 'workers' is passed,
+        groups are divided among a thread pool, which is useful when 
+        constructors wait on I/O.
+
+        Args:
+            specs (Iterable[Tuple[Any, Mapping[str, Any]]]): pairs of a key in 
+                'contents' and the arguments to pass to its stored class when 
+                instanced. The arguments may be None.
+            workers (int): maximum number of threads to use. Defaults to None,
+                which instances every item in the calling thread.
+
+        Raises:
+            KeyError: if a key in 'specs' is not in 'contents'.
+
+        Returns:
+            List[Any]: instances in the same order as 'specs'.
+            
+        """
+        specs = [(key, kwargs or {}) for key, kwargs in specs]
+        items = self._select_many(keys = [key for key, _ in specs])
+        groups = collections.defaultdict(list)
+        for index, item in enumerate(items):
+            groups[(item, tuple(specs[index][1]))].append(index)
+        batches = []
+        for (item, _), indices in groups.items():
+            size = len(indices) if workers is None else -(
+                -len(indices) // workers)
+            for start in range(0, len(indices), size):
+                batches.append((item, indices[start:start + size]))
+        instances = [None] * len(specs)
+        if workers is None:
+            for item, indices in batches:
+                for index in indices:
+                    instances[index] = item(**specs[index][1])
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers = workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._instance_batch, 
+                        item = item, 
+                        kwargs = [specs[index][1] for index in indices]): 
+                    indices for item, indices in batches}
+                for future, indices in futures.items():
+                    for index, instance in zip(indices, future.result()):
+                        instances[index] = instance
+        return instances
  
     def select(self, name: Union[Any, Sequence[Any]]) -> Union[
                Any, Sequence[Any]]:
@@ -964,6 +1027,44 @@ class Catalog(Lexicon):
                                  always_return_list = self.always_return_list,
                                  **kwargs)
 
+    """ Private Methods """
+
+    @staticmethod
+    def _instance_batch(item: Type, 
+                        kwargs: Sequence[Mapping[str, Any]]) -> List[Any]:
+        """Returns an instance of 'item' for each set of arguments in 'kwargs'.
+
+        Args:
+            item (Type): class to instance.
+            kwargs (Sequence[Mapping[str, Any]]): arguments to pass to 'item'
+                for each instance.
+
+        Returns:
+            List[Any]: instances of 'item'.
+            
+        """
+        return [item(**arguments) for arguments in kwargs]
+
+    def _select_many(self, keys: Sequence[Any]) -> List[Any]:
+        """Returns the stored value for each key in 'keys'.
+
+        Args:
+            keys (Sequence[Any]): keys in 'contents'.
+
+        Raises:
+            KeyError: if a key in 'keys' is not in 'contents'.
+
+        Returns:
+            List[Any]: stored values in the same order as 'keys'.
+            
+        """
+        contents = self.contents
+        try:
+            return [contents[key] for key in keys]
+        except KeyError as error:
+            raise KeyError(
+                f'{error.args[0]} is not in {self.__class__.__name__}')
+
     """ Dunder Methods """
 
     def __getitem__(self, key: Union[Any, Sequence[Any]]) -> Union[
@@ -980,29 +1081,31 @@ class Catalog(Lexicon):
             Union[Any, Sequence[Any]]: value(s) stored in 'contents'.
 
         """
+        # Reads 'contents' once so that a replaced 'contents' is not mixed 
+        # with the prior one.
+        contents = self.contents
         # Returns a list of all values if the 'all' key is sought.
         if key in ['all', ['all']]:
-            return list(self.contents.values())
+            return list(contents.values())
         # Returns a list of values for keys listed in 'defaults' attribute.
         elif key in ['default', ['default'], 'defaults', ['defaults']]:
             try:
                 return self[self.defaults]
             except KeyError:
-                return list(
-                    {k: self.contents[k] for k in self.defaults}.values())
+                return list({k: contents[k] for k in self.defaults}.values())
         # Returns an empty list if a null value is sought.
         elif key in ['none', ['none'], 'None', ['None']]:
             return []
         # Returns list of matching values if 'key' is list-like.        
         elif isinstance(key, Sequence) and not isinstance(key, str):
-            return [self.contents[k] for k in key if k in self.contents]
+            return [contents[k] for k in key if k in contents]
         # Returns matching value if key is not a non-str Sequence or wildcard.
         else:
             try:
                 if self.always_return_list:
-                    return [self.contents[key]]
+                    return [contents[key]]
                 else:
-                    return self.contents[key]
+                    return contents[key]
             except KeyError:
                 raise KeyError(f'{key} is not in {self.__class__.__name__}')
 
@@ -1037,4 +1140,344 @@ class Catalog(Lexicon):
             i: self.contents[i] 
             for i in self.contents if i not in more_itertools.always_iterable(key)}
         return self
- 
\ No newline at end of file
+ 
+
+@dataclasses.dataclass
+class WeakCatalog(Catalog):
+    """Catalog which does not keep its values alive.
+    
+    A WeakCatalog stores its values in a weakref.WeakValueDictionary, so a 
+    value is removed once nothing else refers to it. Values must support weak
+    references.
+    
+    Optionally, recently stored or accessed values are kept alive by strong
+    references until they exceed 'limit' or 'ttl'. If both are None, values are
+    never kept alive by the WeakCatalog.
+    
+    Args:
+        contents (Mapping[Any, Any]]): stored dictionary. It is converted to a
+            weakref.WeakValueDictionary if it is another type of Mapping. 
+            Defaults to an empty weakref.WeakValueDictionary.
+        defaults (Sequence[Any]]): a list of keys in 'contents' which will be 
+            used to return items when 'default' is sought. If not passed, 
+            'default' will be set to all keys.
+        always_return_list (bool): whether to return a list even when the key 
+            passed is not a list or special access key (True) or to return a 
+            list only when a list or special access key is used (False). 
+            Defaults to False.
+        limit (int): maximum number of the most recently used values to keep
+            alive. Defaults to None.
+        ttl (float): number of seconds to keep a value alive after it was last
+            used. Defaults to None.
+            
+    """
+    contents: Mapping[Any, Any] = dataclasses.field(
+        default_factory = weakref.WeakValueDictionary)
+    limit: int = None
+    ttl: float = None
+    _retained: Mapping[Any, Tuple[Any, float]] = dataclasses.field(
+        default_factory = collections.OrderedDict, 
+        init = False, 
+        repr = False, 
+        compare = False)
+    
+    """ Initialization Methods """
+    
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        # Calls parent initialization methods, if they exist.
+        try:
+            super().__post_init__()
+        except AttributeError:
+            pass
+        if not isinstance(self.contents, weakref.WeakValueDictionary):
+            self.contents = weakref.WeakValueDictionary(self.contents)
+        
+    """ Public Methods """
+
+    def prune(self) -> None:
+        """Stops keeping alive values which exceed 'limit' or 'ttl'."""
+        if self.ttl is not None:
+            expiration = time.monotonic() - self.ttl
+            while (self._retained 
+                    and next(iter(self._retained.values()))[1] < expiration):
+                self._retained.popitem(last = False)
+        if self.limit is not None:
+            while len(self._retained) > self.limit:
+                self._retained.popitem(last = False)
+        return self
+
+    def report(self) -> Dict[Any, int]:
+        """Returns approximate memory used by each stored value.
+
+        Returns:
+            Dict[Any, int]: keys are keys in 'contents' and values are the 
+                approximate number of bytes used by the stored value.
+            
+        """
+        return {
+            key: sourdough.memory.get_size(value) 
+            for key, value in self.contents.items()}
+
+    """ Private Methods """
+
+    def _retain(self, key: Any) -> None:
+        """Keeps the value at 'key' alive as the most recently used value.
+
+        Args:
+            key (Any): key in 'contents' of the value to keep alive.
+            
+        """
+        if self.limit is not None or self.ttl is not None:
+            self._retained[key] = (self.contents[key], time.monotonic())
+            self._retained.move_to_end(key)
+            self.prune()
+        return self
+
+    """ Dunder Methods """
+
+    def __getitem__(self, key: Union[Any, Sequence[Any]]) -> Union[
+                    Any, Sequence[Any]]:
+        """Returns value(s) for 'key' and keeps them alive if retained.
+
+        Args:
+            key (Union[Any, Sequence[Any]]): key(s) in 'contents'.
+
+        Returns:
+            Union[Any, Sequence[Any]]: value(s) stored in 'contents'.
+
+        """
+        value = super().__getitem__(key)
+        for item in more_itertools.always_iterable(key):
+            if item in self.contents:
+                self._retain(key = item)
+        return value
+
+    def __setitem__(self, key: Union[Any, Sequence[Any]], 
+                    value: Union[Any, Sequence[Any]]) -> None:
+        """Sets 'key' in 'contents' to 'value' and keeps it alive if retained.
+
+        Args:
+            key (Union[Any, Sequence[Any]]): key(s) to set in 'contents'.
+            value (Union[Any, Sequence[Any]]): value(s) to be paired with 'key' 
+                in 'contents'.
+
+        """
+        super().__setitem__(key, value)
+        for item in more_itertools.always_iterable(key):
+            if item in self.contents:
+                self._retain(key = item)
+        return self
+
+    def __delitem__(self, key: Union[Any, Sequence[Any]]) -> None:
+        """Deletes 'key' in 'contents'.
+
+        Args:
+            key (Union[Any, Sequence[Any]]): name(s) of key(s) in 'contents' to
+                delete the key/value pair.
+
+        """
+        for item in more_itertools.always_iterable(key):
+            self.contents.pop(item, None)
+            self._retained.pop(item, None)
+        return self
+
+
+@dataclasses.dataclass
+class CopyOnWriteDict(collections.abc.MutableMapping):
+    """dict wrapper which shares 'contents' until it is first changed.
+    
+    Reading from a CopyOnWriteDict reads the shared 'contents' directly. The
+    first change replaces 'contents' with a shallow copy, so the original 
+    mapping is never altered. Values stored in 'contents' remain shared.
+    
+    Args:
+        contents (Mapping[Any, Any]): shared mapping. Defaults to an empty 
+            dict.
+            
+    """
+    contents: Mapping[Any, Any] = dataclasses.field(default_factory = dict)
+    _copied: bool = dataclasses.field(
+        default = False, 
+        init = False, 
+        repr = False, 
+        compare = False)
+
+    """ Private Methods """
+
+    def _copy(self) -> None:
+        """Replaces shared 'contents' with a copy before it is changed."""
+        if not self._copied:
+            self.contents = dict(self.contents)
+            self._copied = True
+        return self
+    
+    """ Dunder Methods """
+
+    def __getitem__(self, key: Any) -> Any:
+        """Returns value for 'key' in 'contents'.
+
+        Args:
+            key (Any): key to search for in 'contents'.
+
+        Returns:
+            Any: value stored in 'contents' at 'key'.
+
+        """
+        return self.contents[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Sets 'key' in a copy of 'contents' to 'value'.
+
+        Args:
+            key (Any): key to set in 'contents'.
+            value (Any): value to be paired with 'key' in 'contents'.
+
+        """
+        self._copy()
+        self.contents[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        """Deletes 'key' in a copy of 'contents'.
+
+        Args:
+            key (Any): key in 'contents' to delete the key/value pair.
+
+        """
+        self._copy()
+        del self.contents[key]
+
+    def __iter__(self) -> Iterable[Any]:
+        """Returns iterable of 'contents'.
+
+        Returns:
+            Iterable: of 'contents'.
+
+        """
+        return iter(self.contents)
+
+    def __len__(self) -> int:
+        """Returns length of 'contents'.
+
+        Returns:
+            int: length of 'contents'.
+
+        """
+        return len(self.contents)
+
+    def __eq__(self, other: Any) -> bool:
+        """Returns whether 'contents' is equal to 'other'.
+
+        Args:
+            other (Any): mapping or CopyOnWriteDict to compare.
+
+        Returns:
+            bool: whether 'contents' is equal to 'other' or its 'contents'.
+
+        """
+        return self.contents == getattr(other, 'contents', other)
+
+
+@dataclasses.dataclass
+class CopyOnWriteList(collections.abc.MutableSequence):
+    """list wrapper which shares 'contents' until it is first changed.
+    
+    Reading from a CopyOnWriteList reads the shared 'contents' directly. The
+    first change replaces 'contents' with a shallow copy, so the original list
+    is never altered. Items stored in 'contents' remain shared.
+    
+    Args:
+        contents (Sequence[Any]): shared sequence. Defaults to an empty list.
+            
+    """
+    contents: Sequence[Any] = dataclasses.field(default_factory = list)
+    _copied: bool = dataclasses.field(
+        default = False, 
+        init = False, 
+        repr = False, 
+        compare = False)
+
+    """ Public Methods """
+
+    def insert(self, index: int, item: Any) -> None:
+        """Inserts 'item' at 'index' in a copy of 'contents'.
+
+        Args:
+            index (int): index to insert 'item' at.
+            item (Any): object to be inserted.
+
+        """
+        self._copy()
+        self.contents.insert(index, item)
+
+    """ Private Methods """
+
+    def _copy(self) -> None:
+        """Replaces shared 'contents' with a copy before it is changed."""
+        if not self._copied:
+            self.contents = list(self.contents)
+            self._copied = True
+        return self
+    
+    """ Dunder Methods """
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Returns item(s) at 'index' in 'contents'.
+
+        Args:
+            index (Union[int, slice]): index or slice of 'contents'.
+
+        Returns:
+            Any: item(s) stored in 'contents' at 'index'.
+
+        """
+        return self.contents[index]
+
+    def __setitem__(self, index: Union[int, slice], item: Any) -> None:
+        """Sets 'index' in a copy of 'contents' to 'item'.
+
+        Args:
+            index (Union[int, slice]): index or slice of 'contents' to set.
+            item (Any): object(s) to store at 'index'.
+
+        """
+        self._copy()
+        self.contents[index] = item
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """Deletes item(s) at 'index' in a copy of 'contents'.
+
+        Args:
+            index (Union[int, slice]): index or slice of 'contents' to delete.
+
+        """
+        self._copy()
+        del self.contents[index]
+
+    def __len__(self) -> int:
+        """Returns length of 'contents'.
+
+        Returns:
+            int: length of 'contents'.
+
+        """
+        return len(self.contents)
+
+    def __eq__(self, other: Any) -> bool:
+        """Returns whether 'contents' has the same items as 'other'.
+
+        Shared 'contents' which are not lists, such as tuples, are compared to
+        lists item by item.
+
+        Args:
+            other (Any): sequence or CopyOnWriteList to compare.
+
+        Returns:
+            bool: whether 'contents' is equal to 'other' or its 'contents'.
+
+        """
+        if isinstance(other, CopyOnWriteList):
+            other = list(other.contents)
+        if isinstance(other, list) and not isinstance(self.contents, list):
+            return list(self.contents) == other
+        return self.contents == other
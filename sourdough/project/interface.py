@@ -10,6 +10,7 @@ Contents:
 
 """
 from __future__ import annotations
+import contextlib
 import copy
 import dataclasses
 import inspect
@@ -61,6 +62,15 @@ class Project(sourdough.quirks.Validator, sourdough.project.Manager):
         data (object): any data object for the project to be applied. If it is
             None, an instance will still execute its workflow, but it won't
             apply it to any external data. Defaults to None.  
+        preload (bool): whether to import the modules of all import paths in
+            'bases' concurrently before validation (True) or to import each 
+            one when it is first used (False). Import times and failures are
+            logged. Defaults to False.
+        scope (sourdough.Scope): registry scope in which the project is 
+            validated, created, and executed. Subclasses registered while the
+            project is active are only available to it, which allows projects
+            with different plugins to run concurrently in one process. 
+            Defaults to None, which uses the global registries.
         validations (Sequence[str]): 
     
     Attributes:
@@ -95,6 +105,8 @@ class Project(sourdough.quirks.Validator, sourdough.project.Manager):
         str] = dataclasses.field(default_factory = sourdough.project.Results)
     automatic: bool = True
     data: Any = None
+    preload: bool = False
+    scope: sourdough.Scope = None
     validations: ClassVar[Sequence[str]] = [
         'settings', 
         'name', 
@@ -113,16 +125,20 @@ class Project(sourdough.quirks.Validator, sourdough.project.Manager):
             super().__post_init__()
         except AttributeError:
             pass
-        # Calls validation methods.
-        self.validate()
-        # Removes various python warnings from console output.
-        warnings.filterwarnings('ignore')
-        # Adds 'general' section attributes from 'settings'.
-        self.settings.inject(instance = self)
-        # Calls 'create' and 'execute' if 'automatic' is True.
-        if self.automatic:
-            self.create()
-            self.execute()
+        with self._activate():
+            # Imports modules for base classes if 'preload' is True.
+            if self.preload:
+                self._preload()
+            # Calls validation methods.
+            self.validate()
+            # Removes various python warnings from console output.
+            warnings.filterwarnings('ignore')
+            # Adds 'general' section attributes from 'settings'.
+            self.settings.inject(instance = self)
+            # Calls 'create' and 'execute' if 'automatic' is True.
+            if self.automatic:
+                self.create()
+                self.execute()
             
     """ Public Methods """
 
@@ -133,22 +149,40 @@ class Project(sourdough.quirks.Validator, sourdough.project.Manager):
             kwargs
             
         """
-        for manager in self.managers:
-            manager.create()
+        with self._activate():
+            for manager in self.managers:
+                manager.create()
         return self
     
     def execute(self) -> None:
         """
         """
-        for manager in self.managers:
-            if self.workflow.graph.managers:
-                self.workflow.combine(workflow = manager.workflow)
-            else:
-                self.workflow = manager.workflow
-        self.workflow.execute(project = self)
+        with self._activate():
+            for manager in self.managers:
+                if self.workflow.graph.managers:
+                    self.workflow.combine(workflow = manager.workflow)
+                else:
+                    self.workflow = manager.workflow
+            self.workflow.execute(project = self)
         return self
                   
     """ Private Methods """
+
+    def _activate(self) -> contextlib.AbstractContextManager:
+        """Returns a context manager which activates 'scope', if it exists."""
+        if self.scope is None:
+            return contextlib.nullcontext()
+        else:
+            return self.scope
+
+    def _preload(self) -> None:
+        """Imports modules for import paths in 'bases' and logs the results."""
+        for module, result in self.bases.preload().items():
+            if isinstance(result, Exception):
+                logger.warning(f'failed to preload {module}: {result}')
+            else:
+                logger.info(f'preloaded {module} in {result:.4f} seconds')
+        return self
     
     def _validate_settings(self, settings: Union[
             sourdough.project.Settings, 
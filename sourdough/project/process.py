@@ -13,6 +13,8 @@ import abc
 import collections.abc
 import copy
 import dataclasses
+import hashlib
+import json
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
                     Optional, Sequence, Tuple, Type, Union)
 
@@ -29,6 +31,9 @@ class Workflow(sourdough.Base, collections.abc.Iterator):
             adjacency list to represented the graph. Defaults to a Graph.
         components (Library): stores Component instances that correspond to 
             nodes in 'graph'. Defaults to an empty Library.
+        reduce_graph (ClassVar[bool]): whether to remove redundant edges from
+            'graph' with a transitive reduction before it is executed. Defaults
+            to False.
             
     """ 
     graph: sourdough.Graph = dataclasses.field(
@@ -37,6 +42,7 @@ class Workflow(sourdough.Base, collections.abc.Iterator):
     paths: Mapping[str: str] = dataclasses.field(default_factory = dict)
     copy_components: ClassVar[bool] = False
     copy_data: ClassVar[bool] = False
+    reduce_graph: ClassVar[bool] = False
         
     """ Public Methods """
 
@@ -77,6 +83,8 @@ class Workflow(sourdough.Base, collections.abc.Iterator):
             sourdough.Project: [description]
             
         """
+        if self.reduce_graph:
+            self.graph = self.graph.transitive_reduction()
         print('test execute', self.graph)
         for path in self.graph.paths:
             for node in path:
@@ -87,6 +95,31 @@ class Workflow(sourdough.Base, collections.abc.Iterator):
                 project = component.execute(project = project, **kwargs)    
         return project
 
+    def fingerprint(self) -> str:
+        """Returns a canonical digest of 'graph' and 'components'.
+        
+        The digest combines the fingerprint of 'graph' with the name, class, 
+        and 'parameters' of each stored component. Like the Graph fingerprint,
+        it does not depend upon insertion order or python's hash seed, so it
+        can be used to cache plans and results derived from a Workflow.
+        
+        Returns:
+            str: hexadecimal digest of the Workflow.
+            
+        """
+        digest = hashlib.blake2b(digest_size = 16)
+        digest.update(self.graph.fingerprint().encode('utf-8'))
+        for name in sorted(self.components.contents, key = str):
+            component = self.components.contents[name]
+            kind = component.__class__
+            parameters = getattr(component, 'parameters', None) or {}
+            digest.update(json.dumps(
+                [str(name), f'{kind.__module__}.{kind.__qualname__}', 
+                 parameters],
+                sort_keys = True, 
+                default = repr).encode('utf-8'))
+        return digest.hexdigest()
+
     """ Private Methods """
    
     # def _implement_parallel_in_parallel(self, data: Any) -> Any:
@@ -122,15 +122,17 @@ class WorkflowCreator(base.Creator):
         instances[blueprint.name] = section_component(
             name = blueprint.name, 
             **blueprint.parameters)
+        specs = []
         for value in blueprint.components.values():
             for item in value:
                 if not item in self.settings:
                     subcomponent_keys = [item, blueprint.designs[item]]
-                    subcomponent = self.components.borrow(name = subcomponent_keys)
-                    instance = subcomponent(name = item)
-                    instances[item] = self._inject_attributes(
-                        component = instance, 
-                        blueprint = blueprint)
+                    specs.append((subcomponent_keys, {'name': item}))
+        subcomponents = self.components.instance_many(specs = specs)
+        for (subcomponent_keys, _), instance in zip(specs, subcomponents):
+            instances[subcomponent_keys[0]] = self._inject_attributes(
+                component = instance, 
+                blueprint = blueprint)
         return instances
 
     def create_graph(self, 
@@ -6,17 +6,98 @@
 :license: Apache-2.0
 """
 from __future__ import annotations
+import __future__
+import ast
 import datetime
 import inspect
 import functools
+import textwrap
 import time
 import types
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
-                    Optional, Sequence, Tuple, Type, Union)
+                    Optional, Sequence, Set, Tuple, Type, Union)
 
 import sourdough
 
 
+# Python allows at most 20 statically nested blocks in a function, so 'flatify'
+# nests fewer try blocks than that.
+MAX_FLAT_DEPTH = 16
+
+
+def flatify(cls: Type) -> Type:
+    """Replaces the chained '__post_init__' methods of 'cls' with a flat one.
+    
+    sourdough types and quirks call 'super().__post_init__()' inside a 
+    try/except AttributeError block, so a composed class runs a chain of frames
+    and raises an AttributeError at the end of its MRO. 'flatify' walks the MRO
+    once and splits each '__post_init__' at its 'super().__post_init__()' call.
+    It then generates a single '__post_init__' that calls the statements before
+    each 'super' call, from subclass to base class, followed by the statements
+    after each 'super' call, from base class to subclass. This matches the 
+    order of the original chain. A 'super' call which was wrapped in a 
+    try/except AttributeError block is replaced by the same block around the
+    calls for the parent classes, so an AttributeError raised in a parent 
+    class's '__post_init__' is ignored as it is in the original chain.
+    
+    A '__post_init__' method which cannot be split (because its source is not
+    available, it does not call 'super().__post_init__()' exactly once at the
+    top level of its body, it contains a 'return', or a local name set before
+    the 'super' call is used after it) is called unchanged, and the MRO walk
+    stops there. The walk also stops after 'MAX_FLAT_DEPTH' nested try blocks.
+    
+    Args:
+        cls (Type): class whose '__post_init__' should be flattened.
+        
+    Returns:
+        Type: 'cls' with a flat '__post_init__' method.
+        
+    """
+    levels = []
+    guarded = 0
+    for klass in cls.__mro__:
+        method = klass.__dict__.get('__post_init__')
+        if method is not None:
+            parts = None
+            if guarded < MAX_FLAT_DEPTH:
+                parts = _split_post_init(method = method, owner = klass)
+            if parts is None:
+                levels.append((method, None, False))
+                break
+            levels.append(parts)
+            guarded += parts[2]
+    if levels:
+        namespace = {}
+        lines = []
+        opened = []
+        indent = '    '
+        for i, (before, _, guard) in enumerate(levels):
+            if before is not None:
+                namespace[f'_before{i}'] = before
+                lines.append(f'{indent}_before{i}(self)')
+            if guard:
+                lines.append(f'{indent}try:')
+                opened.append(len(lines))
+                indent += '    '
+        for i, (_, after, guard) in reversed(list(enumerate(levels))):
+            if guard:
+                if len(lines) == opened.pop():
+                    lines.append(f'{indent}pass')
+                indent = indent[:-4]
+                lines.extend([
+                    f'{indent}except AttributeError:', 
+                    f'{indent}    pass'])
+            if after is not None:
+                namespace[f'_after{i}'] = after
+                lines.append(f'{indent}_after{i}(self)')
+        body = '\n'.join(lines or ['    pass'])
+        exec(f'def __post_init__(self):\n{body}\n', namespace)
+        flat = namespace['__post_init__']
+        flat.__qualname__ = f'{cls.__qualname__}.__post_init__'
+        flat.__doc__ = 'Calls the flattened initialization methods of the MRO.'
+        cls.__post_init__ = flat
+    return cls
+
 def namify(process: Callable) -> Callable:
     """Adds 'name' attribute to 'process' if none is passed.
     
@@ -62,3 +143,157 @@ def timer(process: str = None) -> Callable:
             return result
         return decorated
     return shell_timer
+
+def _is_super_post_init(statement: ast.stmt) -> bool:
+    """Returns whether 'statement' calls 'super().__post_init__()'.
+    
+    Both a bare call and a call wrapped in 'try: ... except AttributeError: 
+    pass' are recognized.
+    
+    Args:
+        statement (ast.stmt): statement to check.
+        
+    Returns:
+        bool: whether 'statement' only calls 'super().__post_init__()'.
+        
+    """
+    if isinstance(statement, ast.Try):
+        if (len(statement.body) != 1
+                or len(statement.handlers) != 1
+                or statement.orelse 
+                or statement.finalbody):
+            return False
+        handler = statement.handlers[0]
+        if (not isinstance(handler.type, ast.Name)
+                or handler.type.id != 'AttributeError'
+                or not all(isinstance(s, ast.Pass) for s in handler.body)):
+            return False
+        statement = statement.body[0]
+    return (isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Call)
+            and not statement.value.args
+            and isinstance(statement.value.func, ast.Attribute)
+            and statement.value.func.attr == '__post_init__'
+            and isinstance(statement.value.func.value, ast.Call)
+            and isinstance(statement.value.func.value.func, ast.Name)
+            and statement.value.func.value.func.id == 'super'
+            and not statement.value.func.value.args)
+
+def _get_bound_names(statements: Sequence[ast.stmt]) -> Set[str]:
+    """Returns the names bound by 'statements'.
+    
+    Names bound in nested functions and comprehensions are included, so the
+    result may contain names which are not local to 'statements'.
+    
+    Args:
+        statements (Sequence[ast.stmt]): statements to check.
+        
+    Returns:
+        Set[str]: names assigned, deleted, imported, or defined.
+        
+    """
+    bound = set()
+    for statement in statements:
+        for node in ast.walk(statement):
+            if isinstance(node, ast.Name) and not isinstance(
+                    node.ctx, ast.Load):
+                bound.add(node.id)
+            elif isinstance(node, (
+                    ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                bound.add(node.name)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                bound.update(
+                    (alias.asname or alias.name).partition('.')[0] 
+                    for alias in node.names)
+            elif isinstance(node, ast.ExceptHandler) and node.name:
+                bound.add(node.name)
+    return bound
+
+def _split_post_init(method: Callable, owner: Type) -> Optional[
+        Tuple[Optional[Callable], Optional[Callable], bool]]:
+    """Splits 'method' at its 'super().__post_init__()' call.
+    
+    Args:
+        method (Callable): '__post_init__' method defined in 'owner'.
+        owner (Type): class in which 'method' is defined. It is used for any
+            zero-argument 'super' calls in the split functions.
+        
+    Returns:
+        Optional[Tuple[Optional[Callable], Optional[Callable], bool]]: 
+            functions with the statements before and after the 'super' call 
+            (or None if there are no statements) and whether the 'super' call
+            was wrapped in a try/except AttributeError block, or None if 
+            'method' cannot be split.
+        
+    """
+    try:
+        source = textwrap.dedent(inspect.getsource(method))
+    except (OSError, TypeError):
+        return None
+    definition = ast.parse(source).body[0]
+    if (not isinstance(definition, ast.FunctionDef) 
+            or definition.decorator_list
+            or any(isinstance(n, ast.Return) for n in ast.walk(definition))):
+        return None
+    body = definition.body
+    if (body and isinstance(body[0], ast.Expr) 
+            and isinstance(body[0].value, ast.Constant)):
+        body = body[1:]
+    indices = [i for i, s in enumerate(body) if _is_super_post_init(s)]
+    if len(indices) != 1:
+        return None
+    # Locals cannot be shared by the split functions, so a name bound before
+    # the 'super' call and used after it prevents splitting.
+    bound = _get_bound_names(statements = body[:indices[0]])
+    used = {
+        node.id 
+        for statement in body[indices[0] + 1:] 
+        for node in ast.walk(statement) 
+        if isinstance(node, ast.Name)}
+    if bound & used:
+        return None
+    parts = []
+    for statements in [body[:indices[0]], body[indices[0] + 1:]]:
+        if statements:
+            part = ast.FunctionDef(
+                name = '__post_init__',
+                args = definition.args,
+                body = statements,
+                decorator_list = [],
+                returns = None,
+                type_comment = None)
+            # Wraps the part so that zero-argument 'super' calls work.
+            creator = ast.FunctionDef(
+                name = '_create',
+                args = ast.arguments(
+                    posonlyargs = [], 
+                    args = [ast.arg(arg = '__class__', annotation = None)], 
+                    vararg = None, 
+                    kwonlyargs = [], 
+                    kw_defaults = [], 
+                    kwarg = None, 
+                    defaults = []),
+                body = [part, ast.Return(value = ast.Name(
+                    id = '__post_init__', 
+                    ctx = ast.Load()))],
+                decorator_list = [],
+                returns = None,
+                type_comment = None)
+            module = ast.Module(body = [creator], type_ignores = [])
+            ast.fix_missing_locations(module)
+            ast.increment_lineno(module, method.__code__.co_firstlineno - 1)
+            code = compile(
+                module, 
+                method.__code__.co_filename, 
+                'exec',
+                flags = __future__.annotations.compiler_flag,
+                dont_inherit = True)
+            namespace = {}
+            exec(code, method.__globals__, namespace)
+            part = namespace['_create'](owner)
+            part.__qualname__ = f'{owner.__qualname__}.__post_init__'
+            parts.append(part)
+        else:
+            parts.append(None)
+    parts.append(isinstance(body[indices[0]], ast.Try))
+    return tuple(parts)
@@ -6,7 +6,9 @@
 :license: Apache-2.0
 """
 from __future__ import annotations
+import collections.abc
 import dataclasses
+import sys
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Mapping, 
                     Optional, Sequence, Tuple, Type, Union)
 
@@ -41,3 +43,39 @@ def add_slots(cls) -> object:
         if qualname is not None:
             cls.__qualname__ = qualname
     return cls
+
+def get_size(item: Any) -> int:
+    """Returns approximate number of bytes used by 'item' and its contents.
+    
+    Contents of containers and attributes stored in '__dict__' or '__slots__'
+    are included. Objects referenced more than once are only counted once.
+    
+    Args:
+        item (Any): object to measure.
+        
+    Returns:
+        int: approximate size of 'item' in bytes.
+        
+    """
+    seen = set()
+    size = 0
+    pending = [item]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, bytearray)):
+            continue
+        elif isinstance(current, collections.abc.Mapping):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        if hasattr(current, '__dict__'):
+            pending.append(vars(current))
+        for name in getattr(type(current), '__slots__', ()):
+            if hasattr(current, name):
+                pending.append(getattr(current, name))
+    return size
@@ -34,6 +34,10 @@ except ImportError:
 
 NEW_LINE = '\n'
 INDENT = '    '
+# Matches the start of every str that int or float can convert, so numeric 
+# conversions are only attempted on str that might be numbers.
+NUMERIC = re.compile(r'\s*[-+]?(?:\d|\.\d|inf|nan)', re.IGNORECASE)
+BOOLEANS = {'true': True, 'yes': True, 'false': False, 'no': False}
 
 """ Conversion/Validation tools """
 
@@ -226,7 +230,8 @@ def listify(
 def numify(variable: str) -> Union[int, float, str]:
     """Attempts to convert 'variable' to a numeric type.
     
-    If 'variable' cannot be converted to a numeric type, it is returned as is.
+    If 'variable' cannot be converted to a numeric type or is not a str, it 
+    is returned as is.
 
     Args:
         variable (str): variable to be converted.
@@ -235,13 +240,17 @@ def numify(variable: str) -> Union[int, float, str]:
         variable (int, float, str) converted to numeric type, if possible.
 
     """
-    try:
-        return int(variable)
-    except ValueError:
+    if not isinstance(variable, str):
+        return variable
+    elif NUMERIC.match(variable):
         try:
-            return float(variable)
+            return int(variable)
         except ValueError:
-            return variable
+            try:
+                return float(variable)
+            except ValueError:
+                pass
+    return variable
 
 def pathlibify(path: Union[str, pathlib.Path]) -> pathlib.Path:
     """Converts string 'path' to pathlib.pathlib.Path object.
@@ -395,6 +404,10 @@ def typify(variable: str) -> Union[Sequence, int, float, bool, str]:
     alternative datatype is found, the variable is returned in its original
     form.
 
+    The checks are made in a single pass: numeric conversions are only tried
+    if 'variable' starts like a number and bool values are found with one
+    dict lookup.
+
     Args:
         variable (str): string to be converted to appropriate datatype.
 
@@ -404,21 +417,22 @@ def typify(variable: str) -> Union[Sequence, int, float, bool, str]:
     """
     if not isinstance(variable, str):
         return variable
-    try:
-        return int(variable)
-    except ValueError:
+    if NUMERIC.match(variable):
         try:
-            return float(variable)
+            return int(variable)
         except ValueError:
-            if variable.lower() in ['true', 'yes']:
-                return True
-            elif variable.lower() in ['false', 'no']:
-                return False
-            elif ', ' in variable:
-                variable = variable.split(', ')
-                return [numify(item) for item in variable]
-            else:
-                return variable
+            try:
+                return float(variable)
+            except ValueError:
+                pass
+    try:
+        return BOOLEANS[variable.lower()]
+    except KeyError:
+        pass
+    if ', ' in variable:
+        return [numify(item) for item in variable.split(', ')]
+    else:
+        return variable
 
 def validate(
     item: Any,
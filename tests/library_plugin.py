@@ -0,0 +1,15 @@
+"""
+library_plugin: subclass imported lazily by test_library
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+"""
+
+import dataclasses
+
+from . import test_library
+
+
+@dataclasses.dataclass
+class Saw(test_library.Tool):
+    pass
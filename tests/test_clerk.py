@@ -0,0 +1,103 @@
+"""
+test_clerk: unit tests for Clerk
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+"""
+
+import asyncio
+import pathlib
+import tempfile
+
+import sourdough
+
+
+def test_clerk():
+    with tempfile.TemporaryDirectory() as folder:
+        filer = sourdough.Clerk(root_folder = pathlib.Path(folder))
+        assert filer.input_folder == pathlib.Path(folder) / 'input'
+        file_path = filer.input_folder / 'numbers.csv'
+        file_path.write_text(
+            'number,square\n'
+            + ''.join(f'{i},{i * i}\n' for i in range(25)))
+        # Tests chunked streaming
+        chunks = list(filer.stream(file_path = file_path, chunk_size = 10))
+        if isinstance(chunks[0], list):
+            assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+            assert chunks[2][4] == {'number': '24', 'square': '576'}
+            chunks = list(filer.loader._stream_csv(
+                file_path = file_path,
+                chunk_size = 20,
+                header = None,
+                nrows = 3))
+            assert chunks == [[['number', 'square'], ['0', '0'], ['1', '1']]]
+        else:
+            assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        stream = filer.stream(
+            file_path = file_path,
+            chunk_size = 1,
+            usecols = ['square'])
+        assert len(next(stream)) == 1
+        stream.close()
+        try:
+            filer.stream(file_path = file_path, file_format = 'pickle')
+            assert False
+        except TypeError:
+            pass
+        # Tests asynchronous transfers
+        paths = [filer.output_folder / f'part{i}.pickle' for i in range(6)]
+        async def transfer():
+            await asyncio.gather(*(
+                filer.asave(variable = {'part': i}, file_path = path)
+                for i, path in enumerate(paths)))
+            first = await filer.aload(file_path = paths[0])
+            gathered = await filer.gather_load(paths = paths, limit = 2)
+            return first, gathered
+        first, gathered = asyncio.run(transfer())
+        assert first == {'part': 0}
+        assert gathered == [{'part': i} for i in range(6)]
+        filer.save(
+            variable = 'hello', 
+            file_path = filer.output_folder / 'a.txt')
+        assert filer.load(file_path = filer.output_folder / 'a.txt') == 'hello'
+        assert filer.close()._executor is None
+        # Tests parallel bulk loading
+        reported = []
+        for mode in ['thread', 'process']:
+            loaded = filer.load_many(
+                paths = filer.output_folder / 'part*.pickle', 
+                workers = 2,
+                mode = mode,
+                progress = lambda *args: reported.append(args))
+            assert loaded == {f'part{i}': {'part': i} for i in range(6)}
+        assert [done for done, total, _ in reported] == [1, 2, 3, 4, 5, 6] * 2
+        for i, path in enumerate(paths):
+            filer.save(variable = [i, i], file_path = path)
+        assert filer.load_many(paths = paths, concatenate = True) == [
+            0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+        texts = [filer.output_folder / f'line{i}.txt' for i in range(3)]
+        for i, path in enumerate(texts):
+            filer.save(variable = f'line {i}\n', file_path = path)
+        assert filer.load_many(paths = texts, concatenate = True) == (
+            'line 0\nline 1\nline 2\n')
+        try:
+            filer.load_many(paths = [texts[0], paths[0]], concatenate = True)
+            assert False
+        except TypeError:
+            pass
+        paths[1].write_text('broken')
+        loaded = filer.load_many(paths = paths, errors = 'collect')
+        assert isinstance(loaded['part1'], Exception)
+        assert loaded['part2'] == [2, 2]
+        try:
+            filer.load_many(paths = paths)
+            assert False
+        except RuntimeError as error:
+            assert 'part1' in str(error)
+        filer.save(variable = 'x', file_path = filer.input_folder / 'x.pickle')
+        assert filer.load_many(paths = '*.pickle') == {'x': 'x'}
+    return
+
+
+if __name__ == '__main__':
+    test_clerk()
@@ -0,0 +1,233 @@
+"""
+test_configuration: unit tests for Configuration loading
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+"""
+
+import gc
+import logging
+import multiprocessing
+import os
+import pathlib
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+
+import sourdough
+
+
+class Worker(object):
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def read_shared(name: str) -> tuple:
+    settings = sourdough.Configuration.attach(name = name)
+    worker = settings.inject(instance = Worker(name = 'general'))
+    return (worker.seed, worker.verbose, len(settings._attached))
+
+
+def test_configuration():
+    with tempfile.TemporaryDirectory() as folder:
+        source = pathlib.Path(folder) / 'settings.ini'
+        shutil.copy(pathlib.Path('tests') / 'ini_settings.ini', source)
+        # Tests lazy type inference
+        settings = sourdough.Configuration(contents = source)
+        assert settings.contents.layers['source'].typed == {}
+        assert settings['files']['file_encoding'] == 'windows-1252'
+        assert list(settings.contents.layers['source'].typed) == ['files']
+        source_layer = settings.contents.layers['source']
+        assert source_layer['manager'] is source_layer['manager']
+        assert settings.contents['parser'] == {
+            'parser_tasks': 'divide', 'divide_techniques': ['slice', 'dice']}
+        assert sourdough.tools.typify('1_000') == 1000
+        assert sourdough.tools.typify('no') is False
+        assert sourdough.tools.typify('-inf') == float('-inf')
+        assert sourdough.tools.typify('slice, 2.5') == ['slice', 2.5]
+        assert sourdough.tools.numify('2.5') == 2.5
+        assert sourdough.tools.numify(5) == 5
+        assert sourdough.tools.numify(2.5) == 2.5
+        assert sourdough.tools.numify(b'5') == b'5'
+        defaulted = sourdough.Configuration(
+            contents = source, 
+            defaults = {'general': {'seed': 1}, 'extra': {'size': 1}})
+        assert 'general' not in defaulted.contents.layers['source'].typed
+        assert defaulted['general']['seed'] == 43
+        assert defaulted['extra'] == {'size': 1}
+        defaulted['extra']['size'] = 99
+        assert defaulted['extra']['size'] == 99
+        assert defaulted.defaults['extra'] == {'size': 1}
+        assert defaulted.contents.layers['runtime']['extra'] == {'size': 99}
+        # Tests layered settings
+        defaults = {'general': {'seed': 1, 'depth': 2}}
+        os.environ['TEST_SOURDOUGH__GENERAL__SEED'] = '7'
+        try:
+            layered = sourdough.Configuration(
+                contents = source, 
+                defaults = defaults,
+                environment = 'TEST_SOURDOUGH')
+        finally:
+            del os.environ['TEST_SOURDOUGH__GENERAL__SEED']
+        assert layered['general'] == {'verbose': True, 'seed': 7, 'depth': 2}
+        layered['general'] = {'depth': 3}
+        assert layered['general']['depth'] == 3
+        assert defaults == {'general': {'seed': 1, 'depth': 2}}
+        layered.replace_layer(name = 'environment', contents = {})
+        assert layered['general']['seed'] == 43
+        layered.replace_layer(name = 'runtime', contents = {})
+        assert layered['general']['depth'] == 2
+        assert 'files' in layered and 'files' in list(layered.contents)
+        assert 'files' not in layered.contents.layers['runtime']
+        source_layer = layered.contents.layers['source']
+        layered.replace_layer(name = 'source', contents = {})
+        assert 'files' not in layered
+        try:
+            layered['files']
+            assert False
+        except KeyError:
+            pass
+        layered.contents.replace(name = 'source', layer = source_layer)
+        # Tests compiled injection plans
+        planned = sourdough.Configuration(contents = {
+            'general': {'seed': 0, 'verbose': True}, 
+            'worker': {'seed': 5, 'size': 2}})
+        workers = planned.inject_many(
+            instances = [Worker(name = 'worker') for _ in range(3)])
+        assert all((w.seed, w.size, w.verbose) == (5, 2, True) for w in workers)
+        assert planned.inject(
+            instance = Worker(name = 'worker'), overwrite = True).seed == 5
+        planned['worker'] = {'size': 3}
+        assert planned.inject(instance = Worker(name = 'worker')).size == 3
+        assert len(planned._plans) == 2
+        planned['worker']['size'] = 4
+        assert planned.inject(instance = Worker(name = 'worker')).size == 4
+        del planned['worker']['size']
+        assert planned.inject(instance = Worker(name = 'worker')).size == 2
+        # Tests shared settings
+        name = layered.share()
+        assert layered.share() == name
+        with multiprocessing.Pool(processes = 1) as pool:
+            assert pool.apply(read_shared, (name,)) == (43, True, 1)
+        attached = sourdough.Configuration.attach(name = name)
+        assert attached is sourdough.Configuration.attach(name = name)
+        assert attached['general']['depth'] == 2
+        attached['general']['depth'] = 3
+        assert attached['general']['depth'] == 3
+        shared = attached.contents.layers['source']['general']
+        assert shared['depth'] == 2
+        try:
+            shared['depth'] = 3
+            assert False
+        except TypeError:
+            pass
+        layered.unshare()
+        del sourdough.Configuration._attached[name]
+        # Tests the parsed settings cache
+        settings = sourdough.Configuration(contents = source, cache = True)
+        cached = list(pathlib.Path(folder).glob('.settings.ini.*.cache'))
+        assert len(cached) == 1
+        assert settings['general'] == {'verbose': True, 'seed': 43}
+        reloaded = sourdough.Configuration(contents = source, cache = True)
+        cached_layer = reloaded.contents.layers['source']
+        assert set(cached_layer.typed) == set(cached_layer.contents)
+        assert reloaded.contents == settings.contents
+        loader = sourdough.Configuration._load_from_ini
+        sourdough.Configuration._load_from_ini = None
+        try:
+            assert sourdough.Configuration(
+                contents = source, cache = True).contents == settings.contents
+        finally:
+            sourdough.Configuration._load_from_ini = loader
+        with open(source, 'a') as settings_file:
+            settings_file.write('\n[extra]\nsize = 5\n')
+        changed = sourdough.Configuration(contents = source, cache = True)
+        assert changed['extra']['size'] == 5
+        untyped = sourdough.Configuration(
+            contents = source, 
+            cache = True, 
+            infer_types = False)
+        assert untyped['extra']['size'] == '5'
+        def rewrite(settings, file_path):
+            contents = loader(settings, file_path = file_path)
+            with open(source, 'a') as settings_file:
+                settings_file.write('\n[late]\nsize = 6\n')
+            return contents
+        sourdough.Configuration._load_from_ini = rewrite
+        try:
+            stale = sourdough.Configuration(contents = source, cache = True)
+        finally:
+            sourdough.Configuration._load_from_ini = loader
+        assert 'late' not in stale
+        fresh = sourdough.Configuration(contents = source, cache = True)
+        assert fresh['late']['size'] == 6
+        cache_folder = pathlib.Path(folder) / 'cache'
+        sourdough.Configuration(contents = source, cache = cache_folder)
+        assert len(os.listdir(cache_folder)) == 1
+        # Tests reloading and watching
+        watched = sourdough.Configuration(contents = source)
+        worker = Worker(name = 'extra')
+        watched.inject(instance = worker)
+        assert (worker.seed, worker.size) == (43, 5)
+        calls = []
+        watched.watch(
+            interval = 0.01, 
+            callbacks = lambda settings, changes: calls.append(changes))
+        text = source.read_text().replace('size = 5', 'size = 60')
+        source.write_text(text.replace('seed = 43', 'seed = 44'))
+        deadline = time.time() + 5
+        while not calls and time.time() < deadline:
+            time.sleep(0.01)
+        watched.unwatch()
+        assert calls == [{'general': {'seed': 44}, 'extra': {'size': 60}}]
+        assert (worker.seed, worker.size) == (44, 60)
+        assert watched['general']['seed'] == 44
+        assert watched.reload() == {}
+        assert 'files' not in watched.contents.layers['source'].typed
+        # Tests removed sections and options on reload
+        source.write_text(text.replace('[extra]\nsize = 60\n', ''))
+        assert watched.reload()['extra'] == {'size': None}
+        assert worker.size is None
+        # Tests pickling after injection and watching
+        watched.watch(interval = 0.01)
+        watched.share()
+        restored = pickle.loads(pickle.dumps(watched))
+        assert restored.contents == watched.contents
+        assert restored._bindings == {} and restored._watcher is None
+        assert restored.inject(instance = Worker(name = 'general')).seed == 43
+        watched.unshare()
+        # Tests logged callback failures and weakly referenced watchers
+        def fail(settings, changes):
+            raise RuntimeError('callback failed')
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logging.getLogger().addHandler(handler)
+        try:
+            watched._callbacks.append(fail)
+            source.write_text(text)
+            deadline = time.time() + 5
+            while not records and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            logging.getLogger().removeHandler(handler)
+        assert 'callback failed' in str(records[0].exc_info[1])
+        assert worker.size == 60
+        # Releases the traceback, which refers to 'watched', because other 
+        # handlers may keep the record.
+        records[0].exc_info = None
+        polling = threading.active_count()
+        del worker, watched
+        gc.collect()
+        deadline = time.time() + 5
+        while threading.active_count() >= polling and time.time() < deadline:
+            time.sleep(0.01)
+        assert threading.active_count() < polling
+    return
+
+
+if __name__ == '__main__':
+    test_configuration()
@@ -6,6 +6,8 @@ License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
 """
 
 import dataclasses
+import pathlib
+import tempfile
 
 import sourdough
 
@@ -36,6 +38,21 @@ def test_graph():
     assert 'woman' in graph_edges['camera']
     assert 'man' in graph_edges['camera']
     assert 'tv' not in graph_edges['person']
+    # Tests streaming edge list constructors
+    graph_stream = sourdough.Graph.from_edge_stream(
+        edges = (edge for edge in edges), 
+        buffer_size = 3)
+    assert graph_stream.contents == graph_edges.contents
+    graph_file = sourdough.Graph.load_edges(
+        file_path = pathlib.Path('tests') / 'edge_list.csv',
+        header = True)
+    assert graph_file.contents == graph_edges.contents
+    # Tests binary serialization
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = pathlib.Path(folder) / 'graph.sdg'
+        graph_edges.save(file_path = file_path)
+        graph_loaded = sourdough.Graph.load(file_path = file_path)
+    assert graph_loaded.contents == graph_edges.contents
     # Tests manual construction
     graph = sourdough.Graph()
     graph.add_node('bonnie')
@@ -60,6 +77,38 @@ def test_graph():
     assert all_paths == [['bonnie', 'clyde'], 
                          ['bonnie', 'henchman'], 
                          ['butch', 'sundance', 'henchman']]
+    # Tests fingerprinting
+    reordered = sourdough.Graph.from_edges(edges = list(reversed(edges)))
+    assert reordered.fingerprint() == graph_edges.fingerprint()
+    fingerprint = graph.fingerprint()
+    assert graph.fingerprint() == fingerprint
+    graph.add_edge('clyde', 'henchman')
+    assert graph.fingerprint() != fingerprint
+    graph.delete_edge('clyde', 'henchman')
+    assert graph.fingerprint() == fingerprint
+    # Tests components and partitioning
+    assert graph.components() == [
+        ['bonnie', 'clyde', 'henchman', 'butch', 'sundance']]
+    assert len(graph_edges.components()) == 1
+    split = sourdough.Graph.from_edges(edges = edges + [('getaway', 'car')])
+    assert sorted(split.components()[1]) == ['car', 'getaway']
+    partitions = list(split.partition())
+    assert [list(part.contents) for part in partitions] == split.components()
+    assert partitions[1]['getaway'] == split['getaway']
+    assert partitions[1]['getaway'] is not split['getaway']
+    # Tests transitive reduction
+    redundant = sourdough.Graph.from_edges(edges = [
+        ('a', 'b'), ('a', 'c'), ('b', 'c'), ('c', 'd'), ('a', 'd'), ('b', 'd')])
+    reduced = redundant.transitive_reduction()
+    assert reduced.contents == {'a': ['b'], 'b': ['c'], 'c': ['d'], 'd': []}
+    assert redundant['a'] == ['b', 'c', 'd']
+    assert graph.transitive_reduction().contents == graph.contents
+    redundant.add_edge('d', 'a')
+    try:
+        redundant.transitive_reduction()
+        assert False
+    except ValueError:
+        pass
     graph.combine(graph = graph_edges)
     print(graph)
     print(graph.endpoints)
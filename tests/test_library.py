@@ -0,0 +1,331 @@
+"""
+test_library: unit tests for Library
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+"""
+
+import dataclasses
+import gc
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+from typing import ClassVar, Dict, List
+
+import sourdough
+
+
+@dataclasses.dataclass
+class Tool(sourdough.Base):
+    size: int = 1
+
+
+@dataclasses.dataclass
+class Hammer(Tool):
+    pass
+
+
+@dataclasses.dataclass
+class Toolbox(sourdough.quirks.Loader):
+    graph: object = 'sourdough.core.structures.Graph'
+
+
+@dataclasses.dataclass
+class Template(sourdough.quirks.Librarian):
+    name: str = 'template'
+    data: List[int] = dataclasses.field(default_factory = lambda: [1, 2])
+    options: Dict[str, int] = dataclasses.field(default_factory = dict)
+    scratch: List[int] = dataclasses.field(default_factory = list)
+    shared: ClassVar[List[str]] = ['data']
+    copy_on_write: ClassVar[List[str]] = ['options']
+
+
+@dataclasses.dataclass
+class Fleeting(Template):
+    name: str = 'fleeting'
+    store: ClassVar[sourdough.WeakCatalog] = sourdough.WeakCatalog()
+    pool_size: ClassVar[int] = 1
+
+
+class Broken(object):
+
+    def __sourdough_clone__(self) -> object:
+        return self.missing
+
+
+@dataclasses.dataclass
+class Checked(sourdough.quirks.Validator):
+    count: int = '3'
+    label: str = None
+    validations: ClassVar[List[str]] = ['count', 'label']
+
+    def _validate_count(self, count: int) -> int:
+        return int(count)
+
+    @staticmethod
+    def _validate_label(label: str) -> str:
+        return label or 'unlabeled'
+
+
+@sourdough.decorators.flatify
+@dataclasses.dataclass
+class Composite(sourdough.quirks.Element, Template):
+    name: str = None
+
+
+@sourdough.decorators.flatify
+@dataclasses.dataclass
+class Doubled(Composite):
+    size: int = 0
+
+    def __post_init__(self) -> None:
+        size = self.size * 2
+        try:
+            super().__post_init__()
+        except AttributeError:
+            pass
+        self.size = size
+
+
+@dataclasses.dataclass
+class Fragile(object):
+
+    def __post_init__(self) -> None:
+        self.missing
+
+
+@sourdough.decorators.flatify
+@dataclasses.dataclass
+class Sturdy(Fragile):
+    size: int = 0
+
+    def __post_init__(self) -> None:
+        try:
+            super().__post_init__()
+        except AttributeError:
+            pass
+        self.size = 1
+
+
+def test_library():
+    library = Tool.library
+    assert library['hammer'] is Hammer
+    # Tests snapshot replacement of 'contents'
+    snapshot = library.contents
+    library['mallet'] = Hammer
+    assert 'mallet' not in snapshot
+    assert library.contents is not snapshot
+    del library['mallet']
+    assert 'mallet' not in library
+    # Tests cached building with quirks
+    built = library.build(name = 'hammer', quirks = ['element'])
+    assert built is library.build(name = 'hammer', quirks = 'element')
+    assert issubclass(built, Hammer)
+    assert library['hammer'] is Hammer
+    instance = library.instance(name = 'hammer', quirks = 'element', size = 3)
+    assert isinstance(instance, built)
+    assert instance.size == 3
+    # Tests prebuilding and eviction
+    library.prebuild(combinations = [('hammer', None)])
+    assert ('hammer', ()) in library._builds
+    library.build_limit = 1
+    library.build(name = 'hammer', quirks = ['element', 'validator'])
+    assert list(library._builds) == [('hammer', ('element', 'validator'))]
+    del library.build_limit
+    # Tests invalidation of built classes when a key is registered again
+    library['mallet'] = Hammer
+    built = library.build(name = 'mallet', quirks = 'element')
+    assert issubclass(built, Hammer)
+    library['mallet'] = Tool
+    rebuilt = library.build(name = 'mallet', quirks = 'element')
+    assert issubclass(rebuilt, Tool) and not issubclass(rebuilt, Hammer)
+    del library['mallet']
+    assert ('mallet', ('element',)) not in library._builds
+    # Tests batched instancing
+    specs = [('hammer', {'size': 2}), (['drill', 'hammer'], None), 
+             ('hammer', {'size': 4})]
+    for workers in [None, 2]:
+        instances = library.instance_many(specs = specs, workers = workers)
+        assert all(type(i) is Hammer for i in instances)
+        assert [i.size for i in instances] == [2, 1, 4]
+    try:
+        library.instance_many(specs = [('drill', None)])
+        assert False
+    except KeyError:
+        pass
+    catalog = sourdough.Catalog(contents = {'list': list, 'dict': dict})
+    assert catalog.instance_many(
+        specs = [('dict', {'a': 1}), ('list', None)]) == [{'a': 1}, []]
+    # Tests lazy importing from a manifest
+    library.manifest['saw'] = 'tests.library_plugin.Saw'
+    assert 'tests.library_plugin' not in sys.modules
+    assert library.borrow(name = 'saw').__name__ == 'Saw'
+    assert 'tests.library_plugin' in sys.modules
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = pathlib.Path(folder) / 'manifest.json'
+        library.save_manifest(file_path = file_path)
+        manifest = sourdough.Library().load_manifest(file_path = file_path)
+    assert manifest.manifest['saw'] == 'tests.library_plugin.Saw'
+    assert manifest['saw'] is library['saw']
+    # Tests lazy import paths in Bases and Loader
+    bases = sourdough.Bases()
+    bases.add(name = 'lexicon', base = 'sourdough.core.types.Lexicon')
+    assert 'lexicon' not in vars(bases)
+    assert bases.lexicon is sourdough.Lexicon
+    assert vars(bases)['lexicon'] is sourdough.Lexicon
+    bases.delete(name = 'lexicon')
+    bases.add(name = 'missing', base = 'sourdough.nothing.Missing')
+    bases.add(name = 'catalog', base = 'sourdough.core.types.Catalog')
+    report = bases.preload()
+    assert isinstance(report['sourdough.core.types'], float)
+    assert isinstance(report['sourdough.nothing'], ImportError)
+    assert bases.catalog is sourdough.Catalog
+    bases.delete(name = 'missing')
+    assert not hasattr(bases, 'lexicon')
+    importify = sourdough.tools.importify
+    sourdough.tools.importify = lambda **kwargs: (
+        time.sleep(0.05), importify(**kwargs))[1]
+    try:
+        bases.add(name = 'lexicon', base = 'sourdough.core.types.Lexicon')
+        barrier = threading.Barrier(4)
+        accessed = []
+        def access():
+            barrier.wait()
+            try:
+                accessed.append(bases.lexicon)
+            except AttributeError as error:
+                accessed.append(error)
+        threads = [threading.Thread(target = access) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sourdough.tools.importify = importify
+    assert accessed == [sourdough.Lexicon] * 4
+    bases.add(name = 'preload', base = 'sourdough.core.types.Catalog')
+    assert callable(vars(sourdough.Bases)['preload'])
+    assert sourdough.Bases().preload() == {}
+    toolbox = Toolbox()
+    assert toolbox.graph is sourdough.Graph
+    toolbox.graph = 'sourdough.core.types.Catalog'
+    assert toolbox.graph is sourdough.Catalog
+    # Tests cloning and pooling of borrowed templates
+    template = Template(options = {'depth': 1})
+    clone = Template.borrow(key = 'template')
+    assert clone.data is template.data
+    assert clone.scratch is not template.scratch
+    assert clone.options.contents is template.options
+    clone.options['depth'] = 2
+    assert template.options == {'depth': 1}
+    assert clone.options == {'depth': 2}
+    Template.pool_size = 2
+    first = Template.borrow(key = 'template')
+    time.sleep(0.1)
+    assert len(Template._pools[(Template, 'template')]) == 2
+    second = Template.borrow(key = 'template')
+    assert second is not first
+    assert second.options == {'depth': 1}
+    sourdough.quirks.Librarian._pooler.submit(lambda: None).result()
+    template.scratch.append(5)
+    third = Template.borrow(key = 'template')
+    assert third.scratch == [5] and third.scratch is not template.scratch
+    del Template.pool_size
+    fleeting = Fleeting()
+    Fleeting.borrow(key = 'fleeting')
+    sourdough.quirks.Librarian._pooler.submit(lambda: None).result()
+    assert len(Fleeting._pools[(Fleeting, 'fleeting')]) == 1
+    del fleeting
+    gc.collect()
+    assert 'fleeting' not in Fleeting.store
+    assert (Fleeting, 'fleeting') not in Fleeting._pools
+    try:
+        sourdough.quirks.Librarian._clone(item = Broken())
+        assert False
+    except AttributeError as error:
+        assert 'missing' in str(error)
+    assert sourdough.CopyOnWriteList(contents = (1, 2)) == [1, 2]
+    assert [1, 2] == sourdough.CopyOnWriteList(contents = (1, 2))
+    assert sourdough.CopyOnWriteList(contents = [1, 2]) == (
+        sourdough.CopyOnWriteList(contents = (1, 2)))
+    # Tests compiled validation plans
+    checked = Checked().validate()
+    assert (checked.count, checked.label) == (3, 'unlabeled')
+    assert ('count', 'label') in Checked._validation_plans
+    checked.count = '4'
+    checked.validate(validations = ['count'])
+    assert checked.count == 4
+    checked._validate_count = lambda count: int(count) + 1
+    assert checked.validate(validations = ['count']).count == 5
+    # Tests flattened initialization
+    composite = Composite()
+    assert composite.name == 'composite'
+    assert Template.store['composite'] is composite
+    assert Composite.__post_init__.__qualname__ == 'Composite.__post_init__'
+    doubled = Doubled(size = 2)
+    assert (doubled.name, doubled.size) == ('doubled', 4)
+    assert Sturdy().size == 1
+    # Tests registry scopes
+    first, second = sourdough.Scope(name = 'first'), sourdough.Scope()
+    with first:
+        library['drill'] = Hammer
+        assert library['drill'] is Hammer
+        assert library.build(name = 'drill') is library.build(name = 'drill')
+        with second:
+            assert 'drill' not in library
+            library['drill'] = Tool
+        assert library['drill'] is Hammer
+    assert 'drill' not in library
+    assert library['hammer'] is Hammer
+    assert ('drill', ()) not in library._builds
+    with second:
+        assert library['drill'] is Tool
+        threaded = []
+        thread = threading.Thread(
+            target = lambda: threaded.append('drill' in library))
+        thread.start()
+        thread.join()
+        assert threaded == [False]
+    assert sourdough.Scope.active() is None
+    # Tests concurrent entry of the same scope, exiting in the order entered
+    events, errors = [threading.Event() for _ in range(3)], []
+    def enter(first: bool):
+        try:
+            if not first:
+                events[0].wait(timeout = 5)
+            with second:
+                assert library['drill'] is Tool
+                if first:
+                    events[0].set()
+                    events[1].wait(timeout = 5)
+                else:
+                    events[1].set()
+                    events[2].wait(timeout = 5)
+            if first:
+                events[2].set()
+            assert sourdough.Scope.active() is None
+        except Exception as error:
+            errors.append(error)
+    threads = [threading.Thread(target = enter, args = (i == 0,)) 
+               for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    # Tests that forks of collected Libraries are discarded
+    with sourdough.Scope() as scope:
+        for _ in range(50):
+            dropped = sourdough.Library()
+            dropped['ghost'] = dict
+            del dropped
+            gc.collect()
+            assert 'ghost' not in sourdough.Library()
+        assert scope.contents == {}
+    return
+
+
+if __name__ == '__main__':
+    test_library()
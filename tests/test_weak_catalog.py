@@ -0,0 +1,59 @@
+"""
+test_weak_catalog: unit tests for WeakCatalog
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+"""
+
+import dataclasses
+import gc
+import time
+from typing import List
+
+import sourdough
+
+
+@dataclasses.dataclass
+class Record(object):
+    values: List[int] = dataclasses.field(default_factory = list)
+
+
+def test_weak_catalog():
+    # Tests weak references
+    catalog = sourdough.WeakCatalog()
+    record = Record(values = [1, 2, 3])
+    catalog['kept'] = record
+    catalog['dropped'] = Record()
+    gc.collect()
+    assert list(catalog.keys()) == ['kept']
+    assert catalog['kept'] is record
+    assert catalog['all'] == [record]
+    # Tests memory reporting
+    report = catalog.report()
+    assert report['kept'] > sourdough.memory.get_size(Record())
+    # Tests LRU retention
+    catalog = sourdough.WeakCatalog(limit = 2)
+    catalog['first'] = Record()
+    catalog['second'] = Record()
+    catalog['first']
+    catalog['third'] = Record()
+    gc.collect()
+    assert sorted(catalog.keys()) == ['first', 'third']
+    # Tests TTL retention
+    catalog = sourdough.WeakCatalog(ttl = 0.05)
+    catalog['expires'] = Record()
+    gc.collect()
+    assert 'expires' in catalog
+    time.sleep(0.1)
+    catalog.prune()
+    gc.collect()
+    assert 'expires' not in catalog
+    # Tests deletion
+    catalog['kept'] = record
+    del catalog['kept']
+    assert 'kept' not in catalog
+    return
+
+
+if __name__ == '__main__':
+    test_weak_catalog()